@@ -0,0 +1,91 @@
+"""
+Throughput of many concurrent single-text embedding calls, direct against EmbeddingBatcher.
+
+    python benchmarks/bench_embedding_batcher.py --calls 2000 --threads 200
+
+The transport simulates a server that handles at most --server-slots requests at
+once, each taking a fixed overhead plus a per-input time, so tiny requests queue
+up behind each other the way they do against a busy embedding service.
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from sify.aiplatform.models import EmbeddingBatcher, ModelAsAService
+from sify.aiplatform.transport import TimeoutConfig
+
+
+class BusyServerTransport:
+    """Answers /v1/embeddings from a fixed number of slots after overhead + per_item * len(input)."""
+
+    def __init__(self, slots: int, overhead: float, per_item: float):
+        self.slots = threading.Semaphore(slots)
+        self.overhead = overhead
+        self.per_item = per_item
+        self.timeout = TimeoutConfig()
+        self.requests = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        inputs = kwargs["json"]["input"]
+        inputs = [inputs] if isinstance(inputs, str) else inputs
+        with self.slots:
+            self.requests += 1
+            time.sleep(self.overhead + self.per_item * len(inputs))
+        body = {
+            "object": "list", "model": "bench-embed",
+            "data": [{"object": "embedding", "embedding": [0.5] * 8, "index": i} for i in range(len(inputs))],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+        return response
+
+
+def run(embed, calls: int, threads: int) -> float:
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        vectors = list(pool.map(embed, (f"query {i}" for i in range(calls))))
+    assert len(vectors) == calls
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=200)
+    parser.add_argument("--server-slots", type=int, default=8)
+    parser.add_argument("--overhead-ms", type=float, default=10.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.1)
+    args = parser.parse_args()
+
+    def transport() -> BusyServerTransport:
+        return BusyServerTransport(args.server_slots, args.overhead_ms / 1e3, args.per_item_ms / 1e3)
+
+    print(f"{args.calls} calls from {args.threads} threads; server: {args.server_slots} slots, "
+          f"{args.overhead_ms} ms + {args.per_item_ms} ms/input")
+    print(f"{'mode':<22}{'requests':>10}{'seconds':>10}{'calls/s':>10}{'batch':>8}{'p95 wait ms':>13}")
+
+    direct = transport()
+    client = ModelAsAService("bench-key", "bench-embed", transport=direct, embedding_encoding="float")
+    elapsed = run(lambda text: client.create_embeddings(text).data[0].embedding, args.calls, args.threads)
+    print(f"{'direct':<22}{direct.requests:>10}{elapsed:>10.2f}{args.calls / elapsed:>10.0f}{1:>8.1f}{'-':>13}")
+
+    for max_items, max_wait in ((16, 0.002), (64, 0.005), (128, 0.01)):
+        batched = transport()
+        client = ModelAsAService("bench-key", "bench-embed", transport=batched, embedding_encoding="float")
+        with EmbeddingBatcher(client, max_items=max_items, max_wait=max_wait) as batcher:
+            elapsed = run(batcher.embed, args.calls, args.threads)
+            stats = batcher.stats()
+        name = f"batcher {max_items}/{max_wait * 1e3:g}ms"
+        print(f"{name:<22}{batched.requests:>10}{elapsed:>10.2f}{args.calls / elapsed:>10.0f}"
+              f"{stats['mean_batch_size']:>8.1f}{stats['queue_wait_p95'] * 1e3:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
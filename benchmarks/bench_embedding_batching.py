@@ -0,0 +1,89 @@
+"""
+Wall time of create_embeddings for a large input, sent as one request against
+concurrent sub-batches.
+
+    python benchmarks/bench_embedding_batching.py --inputs 5000 --per-item-ms 0.5
+
+The transport simulates a server that takes a fixed overhead plus a per-input time
+for every request, with no real network, so the numbers show what splitting and
+parallel dispatch buy for a given server latency profile.
+"""
+import argparse
+import json
+import time
+
+import requests
+
+from sify.aiplatform.models import EmbeddingBatching, ModelAsAService
+from sify.aiplatform.transport import TimeoutConfig
+
+
+class SimulatedTransport:
+    """Answers /v1/embeddings after overhead + per_item * len(input) seconds."""
+
+    def __init__(self, overhead: float, per_item: float, dim: int):
+        self.overhead = overhead
+        self.per_item = per_item
+        self.dim = dim
+        self.timeout = TimeoutConfig()
+        self.requests = 0
+
+    def request(self, method: str, url: str, json=None, **kwargs) -> requests.Response:
+        self.requests += 1
+        inputs = json["input"]
+        time.sleep(self.overhead + self.per_item * len(inputs))
+        body = {
+            "object": "list", "model": json["model"],
+            "data": [{"object": "embedding", "embedding": [0.5] * self.dim, "index": i} for i in range(len(inputs))],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = _dumps(body)
+        return response
+
+
+def _dumps(body) -> bytes:
+    # request() receives the body as its json argument, which shadows the module
+    return json.dumps(body).encode()
+
+
+def run(batching: EmbeddingBatching, transport: SimulatedTransport, texts) -> float:
+    client = ModelAsAService("bench-key", "bench-embed", transport=transport, embedding_encoding="float",
+                             embedding_batching=batching)
+    started_at = time.perf_counter()
+    response = client.create_embeddings(texts)
+    elapsed = time.perf_counter() - started_at
+    assert [item.index for item in response.data] == list(range(len(texts)))
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inputs", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    texts = [f"document chunk {i} " * 8 for i in range(args.inputs)]
+    cases = [
+        ("one request", EmbeddingBatching(max_items=None, max_tokens=None)),
+        ("256 x 1", EmbeddingBatching(max_items=256, max_concurrency=1)),
+        ("256 x 4", EmbeddingBatching(max_items=256, max_concurrency=4)),
+        ("256 x 8", EmbeddingBatching(max_items=256, max_concurrency=8)),
+        ("64 x 16", EmbeddingBatching(max_items=64, max_concurrency=16)),
+    ]
+    print(f"{args.inputs} inputs, server: {args.overhead_ms} ms + {args.per_item_ms} ms/input per request")
+    print(f"{'batching':<14}{'requests':>10}{'seconds':>10}{'speedup':>10}")
+    baseline = None
+    for name, batching in cases:
+        transport = SimulatedTransport(args.overhead_ms / 1e3, args.per_item_ms / 1e3, args.dim)
+        elapsed = run(batching, transport, texts)
+        baseline = baseline or elapsed
+        print(f"{name:<14}{transport.requests:>10}{elapsed:>10.2f}{baseline / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Throughput of EmbeddingCache bulk lookups and inserts.
+
+    python benchmarks/bench_embedding_cache.py --texts 10000 --dim 1024
+
+Fills a fresh SQLite cache with --texts vectors, then times get_many for all
+hits, all misses and a 50/50 mix, in batches the size create_embeddings would
+look up.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sify.aiplatform.models import EmbeddingCache
+
+
+def timed(fn) -> float:
+    started_at = time.perf_counter()
+    fn()
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(os.path.join(directory, "embeddings.sqlite"), max_bytes=None)
+        texts = [f"document {i} chunk text " * 20 for i in range(args.texts)]
+        vector = os.urandom(4 * args.dim)
+        batches = [texts[i:i + args.batch] for i in range(0, len(texts), args.batch)]
+
+        put = timed(lambda: [cache.put_many("bench", None, [(text, vector) for text in batch]) for batch in batches])
+        hits = timed(lambda: [cache.get_many("bench", None, batch) for batch in batches])
+        misses = timed(lambda: [cache.get_many("other", None, batch) for batch in batches])
+        mixed_texts = random.sample(texts, args.texts // 2) + [f"new {i}" for i in range(args.texts // 2)]
+        mixed = timed(lambda: [cache.get_many("bench", None, mixed_texts[i:i + args.batch])
+                               for i in range(0, len(mixed_texts), args.batch)])
+
+        print(f"{args.texts} texts x {args.dim} dims, batches of {args.batch}, {cache.stats()['bytes'] / 1e6:.0f} MB")
+        for name, elapsed in (("put_many", put), ("get_many hits", hits), ("get_many misses", misses),
+                              ("get_many 50/50", mixed)):
+            print(f"{name:<18}{elapsed * 1e3:>10.1f} ms{args.texts / elapsed:>14,.0f} texts/s")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Peak memory and throughput of EmbeddingPipeline as the input grows, against loading
+the whole file and calling create_embeddings once.
+
+    python benchmarks/bench_embedding_pipeline.py --records 20000 100000 --dim 384
+
+Each input is a generated JSON Lines file. The transport answers /v1/embeddings
+in-process with base64 vectors after a fixed per-request delay, so the numbers are
+the client's own memory and overhead. Peak memory is the largest Python allocation
+total tracemalloc sees during the run; the pipeline writes to an int8 EmbeddingStore.
+"""
+import argparse
+import base64
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import requests
+
+from sify.aiplatform.models import EmbeddingPipeline, EmbeddingStoreSink, ModelAsAService, read_jsonl
+from sify.aiplatform.transport import TimeoutConfig
+
+
+class EmbeddingTransport:
+    """Answers /v1/embeddings with base64 float32 vectors after a fixed delay."""
+
+    def __init__(self, dim: int, delay: float):
+        self.vector = base64.b64encode(np.full(dim, 0.5, dtype="<f4").tobytes()).decode("ascii")
+        self.delay = delay
+        self.timeout = TimeoutConfig()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        inputs = kwargs["json"]["input"]
+        time.sleep(self.delay)
+        body = {
+            "object": "list", "model": "bench-embed",
+            "data": [{"object": "embedding", "embedding": self.vector, "index": i} for i in range(len(inputs))],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)}
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+        return response
+
+
+def write_input(path: str, records: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(records):
+            f.write(json.dumps({"id": f"doc-{i}", "text": f"Paragraph {i} of the corpus. " * 8}) + "\n")
+
+
+def measure(fn):
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started_at
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[20000, 100000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    client = ModelAsAService("bench-key", "bench-embed", transport=EmbeddingTransport(args.dim, args.delay_ms / 1e3))
+    print(f"{args.dim} dimensions, batch size {args.batch_size}, {args.delay_ms} ms per request")
+    print(f"{'records':>9}  {'mode':<18}{'seconds':>9}{'records/s':>11}{'peak MB':>9}")
+    directory = tempfile.mkdtemp()
+    try:
+        for records in args.records:
+            source = os.path.join(directory, f"input-{records}.jsonl")
+            write_input(source, records)
+
+            def load_all():
+                texts = [text for _, text in read_jsonl(source)]
+                client.create_embeddings(texts, as_numpy=True)
+
+            def pipeline():
+                sink = EmbeddingStoreSink(os.path.join(directory, f"store-{records}"), dtype="int8")
+                EmbeddingPipeline(client, sink, batch_size=args.batch_size).run(read_jsonl(source))
+
+            for mode, fn in (("load + embed all", load_all), ("pipeline", pipeline)):
+                elapsed, peak = measure(fn)
+                print(f"{records:>9}  {mode:<18}{elapsed:>9.2f}{records / elapsed:>11,.0f}{peak / 1e6:>9.1f}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Size, recall and search speed of EmbeddingStore with float32, float16 and int8 rows.
+
+    python benchmarks/bench_embedding_store.py --vectors 500000 --dim 384 --queries 64
+
+Each store is written in batches, reopened read-only through its memory maps and
+searched by brute force. Recall@k is measured against exact float32 scores. Opening
+only maps the files; the pages are read, and shared between processes, through the
+OS page cache as the search touches them.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from sify.aiplatform.models import EmbeddingStore
+
+
+def unit_rows(count: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(1000, dim)).astype(np.float32)
+    rows = centers[rng.integers(0, len(centers), count)] + rng.normal(size=(count, dim)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def store_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=500000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=50000)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    vectors = unit_rows(args.vectors, args.dim, seed=0)
+    ids = [f"chunk-{i}" for i in range(args.vectors)]
+    queries = vectors[:args.queries] + 0.05 * np.random.default_rng(1).normal(size=(args.queries, args.dim))
+    exact = np.argsort(-(queries.astype(np.float32) @ vectors.T), axis=1)[:, :args.k]
+    truth = [{ids[row] for row in rows} for rows in exact]
+
+    print(f"{args.vectors} x {args.dim} vectors, {args.queries} queries, k={args.k}")
+    print(f"{'dtype':<9}{'MB':>8}{'write s':>9}{'open ms':>9}{'search ms':>11}{'recall':>8}")
+    directory = tempfile.mkdtemp()
+    try:
+        for dtype in ("float32", "float16", "int8"):
+            path = os.path.join(directory, dtype)
+            started_at = time.perf_counter()
+            with EmbeddingStore.create(path, "bench-embed", args.dim, dtype) as store:
+                for start in range(0, args.vectors, args.batch):
+                    store.append(ids[start:start + args.batch], vectors[start:start + args.batch])
+                    store.flush()
+            written = time.perf_counter() - started_at
+
+            started_at = time.perf_counter()
+            store = EmbeddingStore.open(path)
+            opened = time.perf_counter() - started_at
+            store.search(queries[:1], args.k)
+            started_at = time.perf_counter()
+            _, found = store.search(queries, args.k)
+            searched = time.perf_counter() - started_at
+            recall = np.mean([len(set(row) & expected) / args.k for row, expected in zip(found, truth)])
+            print(f"{dtype:<9}{store_bytes(path) / 1e6:>8.0f}{written:>9.2f}{opened * 1e3:>9.1f}"
+                  f"{searched * 1e3:>11.0f}{recall:>8.3f}")
+            del store
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Size and decode time of an embeddings response sent as JSON floats against base64.
+
+    python benchmarks/bench_embeddings_base64.py --count 1000 --dim 1024
+
+Decode time covers what create_embeddings does with the body: codec.loads followed
+by EmbeddingResponse.from_dict, and with as_numpy=True by from_dict_as_numpy when
+numpy is installed. "lists" then reads every embedding, which is when from_dict
+decodes base64 vectors into lists of floats.
+"""
+import argparse
+import base64
+import random
+import struct
+import time
+
+from sify.aiplatform.models.types import EmbeddingResponse, np
+from sify.aiplatform.transport.codec import get_codec
+
+
+def body(vectors, encoding: str) -> bytes:
+    data = []
+    for i, vector in enumerate(vectors):
+        if encoding == "base64":
+            embedding = base64.b64encode(struct.pack(f"<{len(vector)}f", *vector)).decode()
+        else:
+            embedding = vector
+        data.append({"object": "embedding", "embedding": embedding, "index": i})
+    return get_codec().dumps({"object": "list", "data": data, "model": "bench-embed",
+                              "usage": {"prompt_tokens": len(vectors), "total_tokens": len(vectors)}})
+
+
+def decode(raw: bytes, as_numpy: bool) -> EmbeddingResponse:
+    data = get_codec().loads(raw)
+    if as_numpy:
+        return EmbeddingResponse.from_dict_as_numpy(data)
+    response = EmbeddingResponse.from_dict(data)
+    for item in response.data:
+        item.embedding
+    return response
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # float32-representable values, as the model produces them
+    vectors = [struct.unpack(f"<{args.dim}f", struct.pack(f"<{args.dim}f", *(random.uniform(-1, 1)
+               for _ in range(args.dim)))) for _ in range(args.count)]
+    bodies = {encoding: body(vectors, encoding) for encoding in ("float", "base64")}
+
+    print(f"{args.count} x {args.dim} embeddings, codec={get_codec().name}, numpy={np is not None}")
+    modes = [False, True] if np is not None else [False]
+    print(f"{'encoding':<10}{'MB':>10}" + "".join(f"{'as_numpy ms' if mode else 'lists ms':>14}" for mode in modes))
+    for encoding, raw in bodies.items():
+        timings = [best_of(lambda: decode(raw, mode), args.repeat) for mode in modes]
+        print(f"{encoding:<10}{len(raw) / 1e6:>10.2f}" + "".join(f"{elapsed * 1e3:>14.1f}" for elapsed in timings))
+    size = len(bodies["float"]) / len(bodies["base64"])
+    print(f"base64 body is {size:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Memory held by an embeddings response as Python float lists against as_numpy().
+
+    python benchmarks/bench_embeddings_numpy.py --count 1000 --dim 1024
+
+The response is built from a freshly decoded body that is then dropped, as
+create_embeddings does, and the memory still held is measured with tracemalloc.
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from sify.aiplatform.models.types import EmbeddingResponse
+
+
+def body(count: int, dim: int) -> bytes:
+    data = [{"object": "embedding", "embedding": [random.uniform(-1, 1) for _ in range(dim)], "index": i}
+            for i in range(count)]
+    return json.dumps({"object": "list", "data": data, "model": "bench-embed",
+                       "usage": {"prompt_tokens": count, "total_tokens": count}}).encode()
+
+
+def retained_mb(raw: bytes, as_numpy: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    response = EmbeddingResponse.from_dict(json.loads(raw))
+    if as_numpy:
+        response.as_numpy()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert response.usage.total_tokens
+    return (after - before) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=1024)
+    args = parser.parse_args()
+
+    raw = body(args.count, args.dim)
+    lists = retained_mb(raw, as_numpy=False)
+    matrix = retained_mb(raw, as_numpy=True)
+    floats = args.count * args.dim
+    print(f"{args.count} x {args.dim} embeddings")
+    print(f"float lists: {lists:8.1f} MB  ({lists * 1e6 / floats:5.1f} B/float)")
+    print(f"as_numpy:    {matrix:8.1f} MB  ({matrix * 1e6 / floats:5.1f} B/float)")
+
+
+if __name__ == "__main__":
+    main()
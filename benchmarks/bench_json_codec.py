@@ -0,0 +1,77 @@
+"""
+Compare JSON codecs on a large /v1/embeddings response and a chat request body.
+
+    python benchmarks/bench_json_codec.py --vectors 2000 --dims 1024
+
+"stdlib str" is what the clients did before the codec: decode the body to str,
+then json.loads it.
+"""
+import argparse
+import json
+import random
+import time
+
+from sify.aiplatform.transport.codec import JSONCodec, OrjsonCodec, UjsonCodec, available_codecs
+
+
+def embeddings_payload(vectors: int, dims: int) -> bytes:
+    rng = random.Random(0)
+    body = {
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": i, "embedding": [rng.uniform(-1, 1) for _ in range(dims)]}
+            for i in range(vectors)
+        ],
+        "model": "bench-embedding",
+        "usage": {"prompt_tokens": vectors * 8, "total_tokens": vectors * 8}
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def chat_payload() -> dict:
+    return {
+        "model": "bench-llm",
+        "messages": [{"role": "user", "content": "Summarise the following text. " * 200}] * 8,
+        "max_tokens": 512,
+        "temperature": 0.2
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=2000)
+    parser.add_argument("--dims", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = embeddings_payload(args.vectors, args.dims)
+    request = chat_payload()
+    print(f"embeddings response: {len(body) / 1e6:.1f} MB ({args.vectors} x {args.dims})")
+
+    codecs = [JSONCodec()]
+    installed = available_codecs()
+    if installed["ujson"]:
+        codecs.append(UjsonCodec())
+    if installed["orjson"]:
+        codecs.append(OrjsonCodec())
+
+    baseline = best_of(lambda: json.loads(body.decode()), args.repeat)
+    print(f"{'codec':<12}{'decode ms':>12}{'speedup':>10}{'encode us':>12}")
+    print(f"{'stdlib str':<12}{baseline * 1e3:>12.1f}{1.0:>10.2f}{'':>12}")
+    for codec in codecs:
+        decode = best_of(lambda: codec.loads(body), args.repeat)
+        encode = best_of(lambda: codec.dumps(request), args.repeat * 20)
+        print(f"{codec.name:<12}{decode * 1e3:>12.1f}{baseline / decode:>10.2f}{encode * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
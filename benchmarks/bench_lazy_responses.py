@@ -0,0 +1,100 @@
+"""
+Cost of building responses eagerly against lazy views when one field is read.
+
+    python benchmarks/bench_lazy_responses.py --embeddings 1000 --documents 500
+
+Each case decodes nothing: it starts from the already decoded dict, builds the
+response, reads the field a typical caller wants and calls to_dict().
+"""
+import argparse
+import time
+from typing import Any, Callable
+
+from sify.aiplatform.aistudio.lazy import LazyListDocumentsResponse
+from sify.aiplatform.aistudio.types import Document, ListDocumentsResponse
+from sify.aiplatform.models.lazy import LazyChatCompletionResponse, LazyEmbeddingResponse
+from sify.aiplatform.models.types import ChatCompletionResponse, EmbeddingResponse
+
+
+def chat_body() -> dict:
+    return {
+        "id": "chatcmpl-bench", "object": "chat.completion", "created": 1700000000, "model": "bench-llm",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello!"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15}
+    }
+
+
+def embeddings_body(count: int) -> dict:
+    return {
+        "object": "list", "model": "bench-embed", "usage": {"prompt_tokens": count, "total_tokens": count},
+        "data": [{"object": "embedding", "embedding": [0.0] * 8, "index": i} for i in range(count)]
+    }
+
+
+def documents_body(count: int) -> dict:
+    document = {
+        "id": "doc", "position": 1, "data_source_type": "upload_file", "data_source_info": {},
+        "dataset_process_rule_id": "r", "name": "handbook.pdf", "created_from": "api", "created_by": "u",
+        "created_at": 1700000000, "tokens": 5120, "indexing_status": "completed", "error": None,
+        "enabled": True, "disabled_at": None, "disabled_by": None, "archived": False,
+        "display_status": "available", "word_count": 4096, "hit_count": 3, "doc_form": "text_model"
+    }
+    return {"data": [dict(document) for _ in range(count)], "has_more": False, "limit": count,
+            "total": count, "page": 1}
+
+
+def eager_documents(body: dict) -> ListDocumentsResponse:
+    # What DataMind.list_documents builds without lazy=True
+    return ListDocumentsResponse(data=[Document(**doc) for doc in body["data"]], has_more=body["has_more"],
+                                 limit=body["limit"], total=body["total"], page=body["page"])
+
+
+def per_call_us(fn: Callable[[], Any], repeat: int, number: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - started_at)
+    return best / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", type=int, default=1000)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    chat, embeddings, documents = chat_body(), embeddings_body(args.embeddings), documents_body(args.documents)
+    cases = [
+        ("chat: message.content",
+         lambda: ChatCompletionResponse.from_dict(chat).choices[0].message.content,
+         lambda: LazyChatCompletionResponse.from_dict(chat).choices[0].message.content),
+        ("chat: to_dict()",
+         lambda: ChatCompletionResponse.from_dict(chat).to_dict(),
+         lambda: LazyChatCompletionResponse.from_dict(chat).to_dict()),
+        (f"embeddings x{args.embeddings}: usage",
+         lambda: EmbeddingResponse.from_dict(embeddings).usage.total_tokens,
+         lambda: LazyEmbeddingResponse.from_dict(embeddings).usage.total_tokens),
+        (f"embeddings x{args.embeddings}: to_dict()",
+         lambda: EmbeddingResponse.from_dict(embeddings).to_dict(),
+         lambda: LazyEmbeddingResponse.from_dict(embeddings).to_dict()),
+        (f"documents x{args.documents}: total",
+         lambda: eager_documents(documents).total,
+         lambda: LazyListDocumentsResponse(documents).total),
+        (f"documents x{args.documents}: every name",
+         lambda: [doc.name for doc in eager_documents(documents).data],
+         lambda: [doc.name for doc in LazyListDocumentsResponse(documents).data]),
+    ]
+
+    print(f"{'case':<32}{'eager us':>12}{'lazy us':>12}{'speedup':>10}")
+    for name, eager, lazy in cases:
+        eager_us = per_call_us(eager, args.repeat, args.number)
+        lazy_us = per_call_us(lazy, args.repeat, args.number)
+        print(f"{name:<32}{eager_us:>12.1f}{lazy_us:>12.1f}{eager_us / lazy_us:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
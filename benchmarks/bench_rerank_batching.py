@@ -0,0 +1,81 @@
+"""
+Wall time of rerank for a large candidate list, sent as one request against
+concurrent sub-requests.
+
+    python benchmarks/bench_rerank_batching.py --documents 2000 --per-doc-ms 0.5
+
+The transport simulates a cross-encoder server that takes a fixed overhead plus a
+per-document time for every request, with no real network. Each run checks that the
+chunked top_n matches the single-request ranking.
+"""
+import argparse
+import json
+import time
+
+import requests
+
+from sify.aiplatform.models import ModelAsAService, RerankBatching
+from sify.aiplatform.transport import TimeoutConfig
+
+
+class SimulatedRerankTransport:
+    """Scores each document by a hash of its text after overhead + per_doc * len(documents) seconds."""
+
+    def __init__(self, overhead: float, per_doc: float):
+        self.overhead = overhead
+        self.per_doc = per_doc
+        self.timeout = TimeoutConfig()
+        self.requests = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self.requests += 1
+        payload = kwargs["json"]
+        documents = payload["documents"]
+        time.sleep(self.overhead + self.per_doc * len(documents))
+        results = [
+            {"index": i, "relevance_score": (hash(document) % 10007) / 10007, "document": document}
+            for i, document in enumerate(documents)
+        ]
+        results.sort(key=lambda item: -item["relevance_score"])
+        if payload.get("top_n"):
+            results = results[:payload["top_n"]]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"id": "rerank-bench", "results": results}).encode()
+        return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--top-n", type=int, default=20)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-doc-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    documents = [f"Candidate passage {i} about the refund policy. " * 6 for i in range(args.documents)]
+    print(f"{args.documents} documents, top_n={args.top_n}; server: {args.overhead_ms} ms + "
+          f"{args.per_doc_ms} ms/document")
+    print(f"{'policy':<28}{'requests':>10}{'seconds':>10}{'speedup':>9}")
+    baseline = reference = None
+    policies = [("single request", RerankBatching(max_documents=None, max_tokens=None))]
+    for max_documents in (500, 128, 64):
+        for concurrency in (4, 8):
+            policies.append((f"{max_documents} docs x {concurrency} in flight",
+                             RerankBatching(max_documents=max_documents, max_concurrency=concurrency)))
+    for name, policy in policies:
+        transport = SimulatedRerankTransport(args.overhead_ms / 1e3, args.per_doc_ms / 1e3)
+        client = ModelAsAService("bench-key", "bench-rerank", transport=transport, rerank_batching=policy)
+        started_at = time.perf_counter()
+        response = client.rerank("What is the refund policy?", documents, top_n=args.top_n)
+        elapsed = time.perf_counter() - started_at
+        ranking = [item.index for item in response.results]
+        reference = reference or ranking
+        assert ranking == reference, name
+        baseline = baseline or elapsed
+        print(f"{name:<28}{transport.requests:>10}{elapsed:>10.3f}{baseline / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Documents sent and wall time of repetitive rerank traffic with and without a RerankCache.
+
+    python benchmarks/bench_rerank_cache.py --calls 200 --queries 20 --documents 100
+
+Replays --calls rerank requests whose queries follow a Zipf-like popularity over
+--queries distinct queries; each call takes its candidates from a sliding window over
+a shared corpus, so the same documents recur for a query with some churn. The
+transport simulates a cross-encoder server with a fixed overhead plus a per-document
+time. Each cached response is checked against the uncached ranking.
+"""
+import argparse
+import json
+import random
+import time
+
+import requests
+
+from sify.aiplatform.models import ModelAsAService, RerankCache
+from sify.aiplatform.transport import TimeoutConfig
+
+
+class SimulatedRerankTransport:
+    """Scores each document by a hash of (query, text) after overhead + per_doc * len(documents) seconds."""
+
+    def __init__(self, overhead: float, per_doc: float):
+        self.overhead = overhead
+        self.per_doc = per_doc
+        self.timeout = TimeoutConfig()
+        self.requests = 0
+        self.documents = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        payload = kwargs["json"]
+        documents = payload["documents"]
+        self.requests += 1
+        self.documents += len(documents)
+        time.sleep(self.overhead + self.per_doc * len(documents))
+        results = [
+            {"index": i, "relevance_score": (hash((payload["query"], document)) % 10007) / 10007,
+             "document": document}
+            for i, document in enumerate(documents)
+        ]
+        results.sort(key=lambda item: -item["relevance_score"])
+        if payload.get("top_n"):
+            results = results[:payload["top_n"]]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"id": "rerank-bench", "results": results}).encode()
+        return response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--churn", type=int, default=10, help="maximum shift of the candidate window per call")
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--overhead-ms", type=float, default=20.0)
+    parser.add_argument("--per-doc-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = [f"Passage {i} about shipping, returns and refunds. " * 4 for i in range(args.documents * 4)]
+    weights = [1 / (rank + 1) for rank in range(args.queries)]
+    offsets = [0] * args.queries
+    calls = []
+    for _ in range(args.calls):
+        query = rng.choices(range(args.queries), weights)[0]
+        offsets[query] = (offsets[query] + rng.randint(0, args.churn)) % (len(corpus) - args.documents)
+        calls.append((f"popular query {query}", corpus[offsets[query]:offsets[query] + args.documents]))
+
+    print(f"{args.calls} calls over {args.queries} queries, {args.documents} documents each, top_n={args.top_n}")
+    print(f"{'client':<12}{'requests':>10}{'documents':>11}{'seconds':>10}{'speedup':>9}")
+    baseline = None
+    rankings = []
+    for name, cache in (("uncached", None), ("RerankCache", RerankCache())):
+        transport = SimulatedRerankTransport(args.overhead_ms / 1e3, args.per_doc_ms / 1e3)
+        client = ModelAsAService("bench-key", "bench-rerank", transport=transport, rerank_cache=cache)
+        started_at = time.perf_counter()
+        ranking = []
+        for query, documents in calls:
+            response = client.rerank(query, documents, top_n=args.top_n)
+            ranking.append([(item.index, item.relevance_score) for item in response.results])
+        elapsed = time.perf_counter() - started_at
+        rankings.append(ranking)
+        baseline = baseline or elapsed
+        print(f"{name:<12}{transport.requests:>10}{transport.documents:>11}{elapsed:>10.3f}{baseline / elapsed:>9.2f}")
+        if cache is not None:
+            print(f"cache: {cache.stats()}")
+    assert rankings[0] == rankings[1], "cached ranking differs"
+
+
+if __name__ == "__main__":
+    main()
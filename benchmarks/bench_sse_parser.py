@@ -0,0 +1,121 @@
+"""
+Throughput of the byte-level SSE parser against the previous line-based parsing.
+
+    python benchmarks/bench_sse_parser.py --events 50000 --chunk-size 512
+
+"iter_lines + str" is the old path: requests' iter_lines(decode_unicode=True), then a
+"data: " prefix check, strip and json.loads per line. Both parsers read the same
+chunks through a requests.Response, as they do from the network.
+"""
+import argparse
+import json
+import time
+from typing import Iterator, List
+
+import requests
+
+from sify.aiplatform.transport.codec import get_codec
+from sify.aiplatform.transport.sse import iter_json
+
+
+def build_stream(events: int) -> bytes:
+    parts = []
+    for i in range(events):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-llm",
+            "choices": [{"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}]
+        }
+        parts.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+def split(body: bytes, size: int) -> List[bytes]:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class _ChunkedRaw:
+    """Stands in for urllib3's response, replaying the body in fixed-size network chunks."""
+
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+
+    def stream(self, chunk_size=None, decode_content=True) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+def make_response(chunks: List[bytes]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = _ChunkedRaw(chunks)
+    return response
+
+
+def old_parse_stream_line(line: str):
+    if not line:
+        return None
+    if line.startswith("data: "):
+        data_str = line[len("data: "):].strip()
+        if data_str and data_str != "[DONE]":
+            try:
+                return json.loads(data_str)
+            except json.JSONDecodeError:
+                return None
+    elif line.strip():
+        try:
+            return json.loads(line.strip())
+        except json.JSONDecodeError:
+            return None
+    return None
+
+
+def old_parser(chunks: List[bytes]) -> int:
+    count = 0
+    for line in make_response(chunks).iter_lines(decode_unicode=True):
+        if old_parse_stream_line(line) is not None:
+            count += 1
+    return count
+
+
+def new_parser(chunks: List[bytes]) -> int:
+    count = 0
+    for _ in iter_json(make_response(chunks).iter_content(chunk_size=None)):
+        count += 1
+    return count
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_stream(args.events)
+    chunks = split(body, args.chunk_size)
+    assert old_parser(chunks) == new_parser(chunks) == args.events
+
+    print(f"{args.events} events, {len(body) / 1e6:.1f} MB in {len(chunks)} chunks, codec={get_codec().name}")
+    old = best_of(lambda: old_parser(chunks), args.repeat)
+    new = best_of(lambda: new_parser(chunks), args.repeat)
+    print(f"{'parser':<18}{'ms':>10}{'events/s':>14}")
+    print(f"{'iter_lines + str':<18}{old * 1e3:>10.1f}{args.events / old:>14,.0f}")
+    print(f"{'byte-level sse':<18}{new * 1e3:>10.1f}{args.events / new:>14,.0f}")
+    print(f"speedup: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
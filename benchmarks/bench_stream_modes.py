@@ -0,0 +1,128 @@
+"""
+Throughput and allocations of chat_completion stream modes: chunks, text and raw.
+
+    python benchmarks/bench_stream_modes.py --events 50000 --chunk-size 512
+
+Each mode runs through ModelAsAService with a transport that replays a recorded
+SSE body, so the numbers include the client's whole streaming path. Allocations
+are the Python memory blocks (and bytes) still alive per yielded item when the
+consumer keeps every item, measured with tracemalloc.
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Iterator, List
+
+import requests
+
+from sify.aiplatform.models import ModelAsAService
+from sify.aiplatform.transport import TimeoutConfig
+from sify.aiplatform.transport.codec import get_codec
+
+MESSAGES = [{"role": "user", "content": "Tell me a long story."}]
+
+
+def build_stream(events: int) -> bytes:
+    parts = []
+    for i in range(events):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-llm",
+            "choices": [{"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}]
+        }
+        parts.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    parts.append(b"data: [DONE]\n\n")
+    return b"".join(parts)
+
+
+class _ChunkedRaw:
+    """Stands in for urllib3's response, replaying the body in fixed-size network chunks."""
+
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+        self.closed = False
+
+    def stream(self, chunk_size=None, decode_content=True) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def release_conn(self) -> None:
+        pass
+
+
+class ReplayTransport:
+    """Answers every request with the same recorded streaming body."""
+
+    def __init__(self, chunks: List[bytes]):
+        self.chunks = chunks
+        self.timeout = TimeoutConfig()
+
+    def request(self, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "text/event-stream"
+        response.raw = _ChunkedRaw(self.chunks)
+        return response
+
+
+def consume(client: ModelAsAService, mode: str) -> int:
+    count = 0
+    for _ in client.chat_completion(MESSAGES, stream=True, stream_mode=mode):
+        count += 1
+    return count
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def retained_per_item(client: ModelAsAService, mode: str):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = list(client.chat_completion(MESSAGES, stream=True, stream_mode=mode))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return blocks / len(items), size / len(items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_stream(args.events)
+    chunks = [body[i:i + args.chunk_size] for i in range(0, len(body), args.chunk_size)]
+    client = ModelAsAService("bench-key", "bench-llm", transport=ReplayTransport(chunks))
+
+    print(f"{args.events} events in {len(chunks)} chunks of {args.chunk_size} bytes, codec={get_codec().name}")
+    print(f"{'mode':<8}{'ms':>10}{'chunks/s':>14}{'speedup':>10}{'blocks/item':>14}{'bytes/item':>12}")
+    baseline = None
+    for mode in ("chunks", "text", "raw"):
+        assert consume(client, mode) >= args.events
+        elapsed = best_of(lambda: consume(client, mode), args.repeat)
+        baseline = baseline or elapsed
+        blocks, size = retained_per_item(client, mode)
+        print(f"{mode:<8}{elapsed * 1e3:>10.1f}{args.events / elapsed:>14,.0f}{baseline / elapsed:>10.2f}"
+              f"{blocks:>14.1f}{size:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
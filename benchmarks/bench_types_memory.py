@@ -0,0 +1,90 @@
+"""
+Memory per instance of the slotted response types against dict-backed equivalents.
+
+    python benchmarks/bench_types_memory.py --count 200000
+
+"__dict__" is the same class rebuilt without __slots__, i.e. the layout before
+the change. Field values are shared between instances, so the numbers are the
+per-object overhead that __slots__ removes, measured with tracemalloc.
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from sify.aiplatform.aistudio.types import Conversation, Document, Message, RetrieverResource
+from sify.aiplatform.models.types import ChatCompletionChunk, EmbeddingData, ModelInfo
+
+DOCUMENT = {
+    "id": "5b7a3c1e-0000-4000-8000-000000000000", "position": 1, "data_source_type": "upload_file",
+    "data_source_info": {"upload_file_id": "f"}, "dataset_process_rule_id": "r", "name": "handbook.pdf",
+    "created_from": "api", "created_by": "u", "created_at": 1700000000, "tokens": 5120,
+    "indexing_status": "completed", "error": None, "enabled": True, "disabled_at": None, "disabled_by": None,
+    "archived": False, "display_status": "available", "word_count": 4096, "hit_count": 3, "doc_form": "text_model"
+}
+MESSAGE = {
+    "id": "m", "conversation_id": "c", "inputs": {}, "query": "What is the refund policy?",
+    "answer": "Refunds are issued within 14 days.", "message_files": [], "feedback": {},
+    "retriever_resources": [], "agent_thoughts": [], "created_at": 1700000000
+}
+RESOURCE = {
+    "position": 1, "dataset_id": "d", "dataset_name": "Policies", "document_id": "doc",
+    "document_name": "handbook.pdf", "segment_id": "s", "score": 0.87, "content": "Refunds are issued..."
+}
+CONVERSATION = {"id": "c", "name": "Refunds", "inputs": {}, "introduction": "", "created_at": 1700000000, "status": "normal"}
+MODEL = {"id": "bench-llm", "name": "Bench LLM", "model_type": "llm", "max_tokens": 8192, "owned_by": "bench"}
+CHUNK = {
+    "id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 1700000000, "model": "bench-llm",
+    "choices": [{"index": 0, "delta": {"content": "token "}, "finish_reason": None}]
+}
+EMBEDDING = {"object": "embedding", "embedding": [0.0] * 8, "index": 0}
+
+CASES = [
+    ("Document", Document, lambda cls: cls(**DOCUMENT)),
+    ("Message", Message, lambda cls: cls(**MESSAGE)),
+    ("RetrieverResource", RetrieverResource, lambda cls: cls(**RESOURCE)),
+    ("Conversation", Conversation, lambda cls: cls(**CONVERSATION)),
+    ("ModelInfo", ModelInfo, lambda cls: cls(**MODEL)),
+    ("ChatCompletionChunk", ChatCompletionChunk, lambda cls: cls.from_dict(CHUNK)),
+    ("EmbeddingData", EmbeddingData, lambda cls: cls.from_dict(EMBEDDING)),
+]
+
+
+def dict_backed(cls: type) -> type:
+    """Rebuild cls as a plain class whose instances carry a __dict__."""
+    namespace: Dict[str, Any] = {
+        name: value for name, value in vars(cls).items() if name != "__slots__" and name not in cls.__slots__
+    }
+    return type(cls.__name__, (), namespace)
+
+
+def bytes_per_instance(factory: Callable[[], Any], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of their footprint
+    list_size = objects.__sizeof__()
+    del objects
+    return (after - before - list_size) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{args.count} instances of each type")
+    print(f"{'type':<22}{'__dict__ B':>12}{'slots B':>10}{'saved':>8}{'MB saved':>10}")
+    for name, cls, build in CASES:
+        plain = dict_backed(cls)
+        old = bytes_per_instance(lambda: build(plain), args.count)
+        new = bytes_per_instance(lambda: build(cls), args.count)
+        saved_mb = (old - new) * args.count / 1e6
+        print(f"{name:<22}{old:>12.0f}{new:>10.0f}{1 - new / old:>8.0%}{saved_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,5 +26,8 @@ setup(
         "viz": ["matplotlib","seaborn","wordcloud","plotly"],
         "ml": ["bertopic","scikit-learn","hdbscan","umap-learn"],
         "nlp": ["nltk", "spacy", "transformers", "sentence-transformers"],
+        "async": ["httpx"],
+        "json": ["orjson"],
+        "parquet": ["pyarrow", "numpy"],
     },
 )
\ No newline at end of file
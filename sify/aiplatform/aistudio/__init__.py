@@ -1,5 +1,9 @@
 from .app import AIApplication
 from .datamind import DataMind
+from .async_app import AsyncAIApplication
+from .async_datamind import AsyncDataMind
+from .streaming import ChatMessageStream, AsyncChatMessageStream
+from .lazy import LazyListDocumentsResponse, LazyListKnowledgeResponse
 from .types import (
     ChatCompletionResponse, 
     FileObject,
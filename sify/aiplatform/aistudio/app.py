@@ -2,29 +2,247 @@ import json
 import os
 import mimetypes
 import requests
-from typing import Any, Dict, Generator, List, Optional, Union
-from sify.aiplatform.aistudio.types import ChatCompletionResponse, ChatCompletionStreamResponse, FileObject, MessageFile, AgentThought, RetrieverResource, Message, Conversation, FileUploadResponse
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sify.aiplatform.aistudio.types import ChatCompletionResponse, FileObject, MessageFile, AgentThought, RetrieverResource, Message, Conversation, FileUploadResponse
+from sify.aiplatform.transport import HTTPTransport, TimeoutConfig, check_deadline, codec, get_default_transport
+from sify.aiplatform.aistudio.streaming import STREAM_MODES, ChatMessageStream
+from sify.aiplatform.transport.sse import EventStream, iter_data, iter_json
 
+# Timeouts of the stop request sent for a stream that was garbage collected before it finished
+_STOP_TIMEOUT = TimeoutConfig(connect=2.0, read=5.0, total=5.0)
+
+
+class _AIApplicationBase:
+    """Request building, validation and response parsing shared by the sync and async clients."""
 
-class AIApplication:
     def __init__(self, base_url: str, api_key: str):
+        if not base_url:
+            raise ValueError("Base URL must be provided")
+        if not api_key:
+            raise ValueError("API key must be provided")
+
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+
+    def _json_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _file_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}"
+            # Note: Don't set Content-Type for multipart/form-data - the HTTP client will set it automatically
+        }
+
+    def _raise_for_status(self, response, default_msg: str, missing_msg: str) -> None:
+        if response.status_code < 400:
+            return
+        # Attempt to get error message from JSON or fallback to text
+        error_msg = default_msg
+        try:
+            err_resp = codec.loads(response.content)
+            if 'message' in err_resp and isinstance(err_resp['message'], str):
+                error_msg = err_resp['message']
+            else:
+                error_msg = missing_msg
+        except json.JSONDecodeError:
+            error_msg = response.text if response.text else "Non-JSON Error"
+        raise ValueError(error_msg)
+
+    def _parse_result(self, response) -> Dict[str, Any]:
+        try:
+            result = codec.loads(response.content)
+        except json.JSONDecodeError:
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                raise ValueError(f"HTML Response: {response.text[:100]}")
+            else:
+                raise ValueError(response.text if response.text else "Non-JSON Response")
+        return {"status_code": response.status_code, "result": result}
+
+    def _validate_required_params(self, params: Dict[str, Any]) -> None:
+        for param_name, param_value in params.items():
+            if not param_value:
+                raise ValueError(f"{param_name} must not be empty")
+
+    def _prepare_chat_message(
+        self,
+        query: str,
+        user: str,
+        response_mode: str,
+        inputs: Optional[Dict[str, Any]],
+        conversation_id: Optional[str],
+        files: Optional[List[FileObject]],
+        auto_generate_name: bool,
+        stream_mode: str = "chunks"
+    ) -> Dict[str, Any]:
+        if response_mode not in ["blocking", "streaming"]:
+            raise ValueError("response_mode must be 'blocking' or 'streaming'")
+        if stream_mode not in STREAM_MODES:
+            raise ValueError(f"stream_mode must be one of: {', '.join(STREAM_MODES)}")
+
+        self._validate_required_params({
+            "query": query,
+            "user": user,
+            "response_mode": response_mode
+        })
+
+        data = {
+            "inputs": inputs or {},
+            "query": query,
+            "user": user,
+            "response_mode": response_mode,
+            "auto_generate_name": auto_generate_name
+        }
+
+        if conversation_id:
+            data["conversation_id"] = conversation_id
+
+        if files:
+            data["files"] = [file.to_dict() for file in files]
+        return data
+
+    def _prepare_file_upload(self, file_path: str, user: str) -> Tuple[str, str]:
+        self._validate_required_params({
+            "file_path": file_path,
+            "user": user
+        })
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        # Get file information
+        file_name = os.path.basename(file_path)
+        mime_type, _ = mimetypes.guess_type(file_path)
+        
+        # Validate file type (only images supported)
+        supported_types = ['image/png', 'image/jpeg', 'image/jpg', 'image/webp', 'image/gif']
+        if mime_type not in supported_types:
+            raise ValueError(f"Unsupported file type: {mime_type}. Supported types: {', '.join(supported_types)}")
+        return file_name, mime_type
+
+    def _prepare_conversation_messages(self, user: str, conversation_id: str, first_id: Optional[str],
+                                       limit: Optional[int]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "user": user,
+            "conversation_id": conversation_id
+        })        
+        params = {
+            "user": user,
+            "conversation_id": conversation_id
+        }
+        if first_id is not None:
+            params["first_id"] = first_id
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    def _build_conversation_messages(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        messages = [
+            Message(
+                id=msg["id"],
+                conversation_id=msg["conversation_id"],
+                inputs=msg["inputs"],
+                query=msg["query"],
+                answer=msg["answer"],
+                message_files=[MessageFile(**mf) for mf in msg["message_files"]],
+                feedback=msg["feedback"],
+                retriever_resources=[RetrieverResource(**rr) for rr in msg["retriever_resources"]],
+                agent_thoughts=[AgentThought(**at) for at in msg["agent_thoughts"]],
+                created_at=msg["created_at"]
+            ) for msg in result["data"]
+        ]
+        return {
+            "limit": result["limit"],
+            "has_more": result["has_more"],
+            "data": messages
+        }
+
+    def _prepare_conversations(self, user: str, last_id: Optional[str], limit: Optional[int],
+                               pinned: Optional[bool]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "user": user
+        })
+
+        params = {"user": user}
+        if last_id:
+            params["last_id"] = last_id
+        if limit is None:
+            limit = 20
+        params["limit"] = limit
+        if pinned is not None:
+            params["pinned"] = pinned
+        return params
+
+    def _build_conversations(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        conversations = [
+            Conversation(**conv) for conv in result["data"]
+        ]
+        return {
+            "limit": result["limit"],
+            "has_more": result["has_more"],
+            "data": conversations
+        }
+
+    def _prepare_message_feedback(self, message_id: str, user: str, rating: str) -> Dict[str, Any]:
+        self._validate_required_params({
+            "message_id": message_id,
+            "user": user,
+            "rating": rating
+        })
+
+        return {
+            "rating": rating,
+            "user": user
+        }
+
+    def _prepare_rename_conversation(self, conversation_id: str, user: str, name: Optional[str],
+                                     auto_generate: bool) -> Dict[str, Any]:
+        self._validate_required_params({
+            "conversation_id": conversation_id,
+            "user": user
+        })
+        if not auto_generate and not name:
+            raise ValueError("Name must not be empty when auto_generate is False")
+
+        data = {
+            "user": user,
+            "auto_generate": auto_generate
+        }
+        if name:
+            data["name"] = name
+        return data
+
+    def _prepare_stop_generate(self, task_id: str, user: str) -> Dict[str, Any]:
+        self._validate_required_params({
+            "task_id": task_id,
+            "user": user
+        })
+
+        return {"user": user}
+
+
+class AIApplication(_AIApplicationBase):
+    def __init__(self, base_url: str, api_key: str, transport: Optional[HTTPTransport] = None,
+                 timeout: Optional[TimeoutConfig] = None):
         """
         Initialize the AIApplication with a base URL and api  key.
 
         Args:
             base_url (str): The base URL for the API (e.g., https://copilot-dev.sifymdp.digital/v1).
             api_key (str): The API key for authentication.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests over.
+                                                 Defaults to the process-wide shared transport.
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                                               client's requests. Defaults to the transport's timeouts.
 
         Raises:
             ValueError: If base_url or api_key is empty or invalid.
         """
-        if not base_url:
-            raise ValueError("Base URL must be provided")
-        if not api_key:
-            raise ValueError("API key must be provided")
-
-        self.base_url = base_url.rstrip('/')
-        self.api_key = api_key
+        super().__init__(base_url, api_key)
+        self.transport = transport or get_default_transport()
+        self.timeout = timeout or self.transport.timeout
 
     def _send_request(
         self,
@@ -32,61 +250,42 @@ class AIApplication:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        stream: bool = False
-    ) -> Union[Dict[str, Any], Generator[Dict[str, Any], None, None]]:
+        stream: bool = False,
+        raw_events: bool = False,
+        timeout: Optional[TimeoutConfig] = None,
+        idempotent: Optional[bool] = None
+    ) -> Union[Dict[str, Any], EventStream]:
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        headers = self._json_headers()
         url = f"{self.base_url}{endpoint}"
+        timeout = timeout or self.timeout
+        expires_at = timeout.expires_at()
 
         try:
-            response = requests.request(
+            response = self.transport.request(
                 method=method,
                 url=url,
                 json=json_data,
                 params=params,
                 headers=headers,
                 stream=stream,
-                timeout=300
+                timeout=timeout,
+                idempotent=idempotent
             )
 
-            if response.status_code >= 400:
-                # Attempt to get error message from JSON or fallback to text
-                error_msg = "Something Went Wrong"
-                try:
-                    err_resp = response.json()
-                    if 'message' in err_resp and isinstance(err_resp['message'], str):
-                        error_msg = err_resp['message']
-                    else:
-                        error_msg = "Output error: No valid error message provided"
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
+            self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
 
             if stream:
+                events = iter_data if raw_events else iter_json
+
                 def line_generator():
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line.startswith("data:"):
-                            data_str = line[len("data:"):].strip()
-                            if data_str:
-                                try:
-                                    yield json.loads(data_str)
-                                except json.JSONDecodeError:
-                                    continue
-                return line_generator()
+                    for chunk in events(response.iter_content(chunk_size=None), response.headers.get("Content-Type")):
+                        check_deadline(expires_at)
+                        yield chunk
+                return EventStream(line_generator(), response)
 
             else:
-                content = response.content.decode()
-                try:
-                    result = json.loads(content)
-                except json.JSONDecodeError:
-                    if 'text/html' in response.headers.get('Content-Type', ''):
-                        raise ValueError(f"HTML Response: {response.text[:100]}")
-                    else:
-                        raise ValueError(response.text if response.text else "Non-JSON Response")
-                return {"status_code": response.status_code, "result": result}
+                return self._parse_result(response)
 
         except requests.RequestException as e:
             error_msg = str(e).lower()
@@ -105,43 +304,22 @@ class AIApplication:
         data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-            # Note: Don't set Content-Type for multipart/form-data - requests will set it automatically
-        }
+        headers = self._file_headers()
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.transport.request(
                 method=method,
                 url=url,
                 files=files,
                 data=data,
                 headers=headers,
-                timeout=300
+                timeout=self.timeout
             )
 
-            if response.status_code >= 400:
-                # Attempt to get error message from JSON or fallback to text
-                error_msg = "Request failed"
-                try:
-                    err_resp = response.json()
-                    if 'message' in err_resp and isinstance(err_resp['message'], str):
-                        error_msg = err_resp['message']
-                    else:
-                        error_msg = "API error: No valid error message provided"
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
-
-            try:
-                result = response.json()
-                return {"status_code": response.status_code, "result": result}
-            except json.JSONDecodeError:
-                if 'text/html' in response.headers.get('Content-Type', ''):
-                    raise ValueError(f"HTML Response: {response.text[:100]}")
-                else:
-                    raise ValueError(response.text if response.text else "Non-JSON Response")
+            self._raise_for_status(response, "Request failed", "API error: No valid error message provided")
+
+            return self._parse_result(response)
 
         except requests.RequestException as e:
             error_msg = str(e).lower()
@@ -152,11 +330,6 @@ class AIApplication:
             else:
                 error_msg = "Something Went Wrong"
             raise ValueError(error_msg)
-
-    def _validate_required_params(self, params: Dict[str, Any]) -> None:
-        for param_name, param_value in params.items():
-            if not param_value:
-                raise ValueError(f"{param_name} must not be empty")
         
     def chat_message(
         self,
@@ -167,8 +340,8 @@ class AIApplication:
         conversation_id: Optional[str] = None,
         files: Optional[List[FileObject]] = None,
         auto_generate_name: bool = True,
-        
-    ) -> Union[ChatCompletionResponse, Generator[ChatCompletionStreamResponse, None, None]]:
+        stream_mode: str = "chunks"
+    ) -> Union[ChatCompletionResponse, ChatMessageStream]:
         """
         Send a chat message to the AI application.
 
@@ -190,6 +363,9 @@ class AIApplication:
                                                     obtained via the /files/upload Output .
             auto_generate_name (bool): Whether to auto-generate the conversation title. Defaults to True.
                                        If False, the conversation rename Output  can be used to generate a title asynchronously.
+            stream_mode (str): What a stream yields: "chunks" for ChatCompletionStreamResponse objects, "text"
+                               for the answer fragments as str, or "raw" for each event's undecoded JSON bytes.
+                               Defaults to "chunks".
 
         Returns:
               - If response_mode="blocking":
@@ -226,7 +402,10 @@ class AIApplication:
                 - created_at (int): Message creation timestamp (Unix epoch).
                 - task_id (Optional[str]): Task ID for tracking (optional).
             - If response_mode="streaming":
-                - Iterator of ChatCompletionStreamResponse: An iterator yielding ChatCompletionStreamResponse objects, each containing:
+                - ChatMessageStream: An iterator yielding ChatCompletionStreamResponse objects. Closing it
+                  (close() or a with block) before the answer is complete releases the connection and stops
+                  the generation on the server; garbage collection releases the connection and sends the
+                  stop from a background thread. Each object contains:
                 - event (str): Event type (e.g., "message", "chunk", or "done").
                 - task_id (Optional[str]): Task ID for tracking (optional).
                 - message_id (Optional[str]): Unique message ID (UUID).
@@ -239,38 +418,19 @@ class AIApplication:
         Raises:
             ValueError: If query or user is empty, conversation_id is not a valid UUID, or Output  request fails.
         """
-        if response_mode not in ["blocking", "streaming"]:
-            raise ValueError("response_mode must be 'blocking' or 'streaming'")
-
-        self._validate_required_params({
-            "query": query,
-            "user": user,
-            "response_mode": response_mode
-        })
-
-        data = {
-            "inputs": inputs or {},
-            "query": query,
-            "user": user,
-            "response_mode": response_mode,
-            "auto_generate_name": auto_generate_name
-        }
-
-        if conversation_id:
-            data["conversation_id"] = conversation_id
-
-        if files:
-            data["files"] = [file.to_dict() for file in files]
+        data = self._prepare_chat_message(query, user, response_mode, inputs, conversation_id,
+                                          files, auto_generate_name, stream_mode)
         
-        def stream_mode():
-            response_generator = self._send_request(
+        def streaming_mode():
+            events = self._send_request(
                 method="POST",
                 endpoint="/chat-messages",
                 json_data=data,
-                stream=True
+                stream=True,
+                raw_events=stream_mode == "raw"
             )
-            for line in response_generator:
-                yield ChatCompletionStreamResponse.from_dict(line)
+            return ChatMessageStream(events, lambda task_id: self.stop_generate_message(task_id, user), stream_mode,
+                                     stop_in_background=lambda task_id: self._stop_generate_quickly(task_id, user))
 
         def blocking_mode():
             response = self._send_request(
@@ -283,7 +443,7 @@ class AIApplication:
 
 
         if response_mode == "streaming":
-            return stream_mode()
+            return streaming_mode()
         else:
             return blocking_mode()
         
@@ -310,23 +470,7 @@ class AIApplication:
             ValueError: If file_path or user is empty, file doesn't exist, or upload request fails.
             FileNotFoundError: If the specified file path doesn't exist.
         """
-        
-        self._validate_required_params({
-            "file_path": file_path,
-            "user": user
-        })
-        
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        # Get file information
-        file_name = os.path.basename(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        
-        # Validate file type (only images supported)
-        supported_types = ['image/png', 'image/jpeg', 'image/jpg', 'image/webp', 'image/gif']
-        if mime_type not in supported_types:
-            raise ValueError(f"Unsupported file type: {mime_type}. Supported types: {', '.join(supported_types)}")
+        file_name, mime_type = self._prepare_file_upload(file_path, user)
         
         # Prepare file and data for upload
         with open(file_path, 'rb') as file:
@@ -398,40 +542,10 @@ class AIApplication:
         Raises:
             ValueError: If user is empty, conversation_id or first_id is not a valid UUID, or Output  request fails.
 """
-        self._validate_required_params({
-            "user": user,
-            "conversation_id": conversation_id
-        })        
-        params = {
-            "user": user,
-            "conversation_id": conversation_id
-        }
-        if first_id is not None:
-            params["first_id"] = first_id
-        if limit is not None:
-            params["limit"] = limit
+        params = self._prepare_conversation_messages(user, conversation_id, first_id, limit)
 
         response = self._send_request(method="GET", endpoint="/messages", params=params)
-        result = response["result"]
-        messages = [
-            Message(
-                id=msg["id"],
-                conversation_id=msg["conversation_id"],
-                inputs=msg["inputs"],
-                query=msg["query"],
-                answer=msg["answer"],
-                message_files=[MessageFile(**mf) for mf in msg["message_files"]],
-                feedback=msg["feedback"],
-                retriever_resources=[RetrieverResource(**rr) for rr in msg["retriever_resources"]],
-                agent_thoughts=[AgentThought(**at) for at in msg["agent_thoughts"]],
-                created_at=msg["created_at"]
-            ) for msg in result["data"]
-        ]
-        return {
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-            "data": messages
-        }
+        return self._build_conversation_messages(response["result"])
 
     def get_conversations(self, user: str, last_id: Optional[str] = None, 
                           limit: Optional[int] = None, pinned: Optional[bool] = None) -> Dict[str, Any]:
@@ -459,28 +573,9 @@ class AIApplication:
         Raises:
             ValueError: If user is empty, or Output  request fails.
         """
-        self._validate_required_params({
-            "user": user
-        })
-
-        params = {"user": user}
-        if last_id:
-            params["last_id"] = last_id
-        if limit is None:
-            limit = 20
-        params["limit"] = limit
-        if pinned is not None:
-            params["pinned"] = pinned
+        params = self._prepare_conversations(user, last_id, limit, pinned)
         response = self._send_request(method="GET", endpoint="/conversations", params=params)
-        result = response["result"]
-        conversations = [
-            Conversation(**conv) for conv in result["data"]
-        ]
-        return {
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-            "data": conversations
-        }
+        return self._build_conversations(response["result"])
 
     def send_message_feedback(self, message_id: str, user: str, rating: str) -> Dict[str, str]:
         """
@@ -498,16 +593,7 @@ class AIApplication:
         Raises:
             ValueError: If message_id, user, or rating is empty, or Output  request fails.
         """
-        self._validate_required_params({
-            "message_id": message_id,
-            "user": user,
-            "rating": rating
-        })
-
-        data = {
-            "rating": rating,
-            "user": user
-        }
+        data = self._prepare_message_feedback(message_id, user, rating)
         response = self._send_request(
             method="POST",
             endpoint=f"/messages/{message_id}/feedbacks",
@@ -538,19 +624,7 @@ class AIApplication:
             ValueError: If conversation_id or user is empty, name is empty when auto_generate is False.
         """
 
-        self._validate_required_params({
-            "conversation_id": conversation_id,
-            "user": user
-        })
-        if not auto_generate and not name:
-            raise ValueError("Name must not be empty when auto_generate is False")
-
-        data = {
-            "user": user,
-            "auto_generate": auto_generate
-        }
-        if name:
-            data["name"] = name
+        data = self._prepare_rename_conversation(conversation_id, user, name, auto_generate)
 
         response = self._send_request(
             method="POST",
@@ -574,12 +648,7 @@ class AIApplication:
         Raises:
             ValueError: If task_id or user is empty, or request fails.
         """
-        self._validate_required_params({
-            "task_id": task_id,
-            "user": user
-        })
-
-        data = {"user": user}
+        data = self._prepare_stop_generate(task_id, user)
 
         response = self._send_request(
             method="POST",
@@ -588,3 +657,14 @@ class AIApplication:
         )
         
         return response["result"]
+
+    def _stop_generate_quickly(self, task_id: str, user: str) -> Dict[str, str]:
+        # Used for garbage-collected streams, from a daemon thread: short timeout, no retries
+        response = self._send_request(
+            method="POST",
+            endpoint=f"/chat-messages/{task_id}/stop",
+            json_data=self._prepare_stop_generate(task_id, user),
+            timeout=_STOP_TIMEOUT,
+            idempotent=False
+        )
+        return response["result"]
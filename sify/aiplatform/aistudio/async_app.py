@@ -0,0 +1,231 @@
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from sify.aiplatform.aistudio.app import _AIApplicationBase
+from sify.aiplatform.aistudio.types import ChatCompletionResponse, FileObject, Conversation, FileUploadResponse
+from sify.aiplatform.transport.async_http import AsyncHTTPTransport, httpx
+from sify.aiplatform.aistudio.streaming import AsyncChatMessageStream
+from sify.aiplatform.transport.sse import AsyncEventStream, aiter_data, aiter_json
+from sify.aiplatform.transport.timeouts import TimeoutConfig, check_deadline
+
+
+class AsyncAIApplication(_AIApplicationBase):
+    """
+    Asyncio client for AI Studio applications.
+
+    Exposes the same methods as AIApplication as coroutines returning the same
+    response types. Streaming chat messages resolve to AsyncChatMessageStream objects.
+    """
+
+    def __init__(self, base_url: str, api_key: str, transport: Optional[AsyncHTTPTransport] = None,
+                 timeout: Optional[TimeoutConfig] = None):
+        """
+        Initialize the AsyncAIApplication with a base URL and api key.
+
+        Args:
+            base_url (str): The base URL for the API (e.g., https://copilot-dev.sifymdp.digital/v1).
+            api_key (str): The API key for authentication.
+            transport (Optional[AsyncHTTPTransport]): Pooled async transport to send requests over.
+                Defaults to a transport owned by, and closed with, this client.
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                client's requests. Defaults to the transport's timeouts.
+
+        Raises:
+            ValueError: If base_url or api_key is empty or invalid.
+            ImportError: If httpx is not installed.
+        """
+        super().__init__(base_url, api_key)
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncHTTPTransport()
+        self.timeout = timeout or self.transport.timeout
+
+    async def aclose(self) -> None:
+        """Close the underlying transport if this client created it."""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncAIApplication":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _request_error(self, e: Exception) -> ValueError:
+        if isinstance(e, httpx.TimeoutException):
+            return ValueError("Request timeout")
+        elif isinstance(e, httpx.NetworkError):
+            return ValueError("Connection error")
+        return ValueError("Something Went Wrong")
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        raw_events: bool = False
+    ) -> Union[Dict[str, Any], AsyncEventStream]:
+        url = f"{self.base_url}{endpoint}"
+        expires_at = self.timeout.expires_at()
+
+        try:
+            response = await self.transport.request(
+                method=method,
+                url=url,
+                json=json_data,
+                params=params,
+                headers=self._json_headers(),
+                stream=stream,
+                timeout=self.timeout
+            )
+        except httpx.RequestError as e:
+            raise self._request_error(e)
+
+        if stream:
+            if response.status_code >= 400:
+                try:
+                    await response.aread()
+                    self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+                finally:
+                    await response.aclose()
+            return AsyncEventStream(self._line_generator(response, expires_at, raw_events), response)
+
+        self._raise_for_status(response, "Something Went Wrong", "Output error: No valid error message provided")
+        return self._parse_result(response)
+
+    async def _line_generator(self, response, expires_at: Optional[float] = None,
+                              raw_events: bool = False) -> AsyncGenerator[Union[Dict[str, Any], bytes], None]:
+        events = aiter_data if raw_events else aiter_json
+        async for chunk in events(response.aiter_bytes(), response.headers.get("Content-Type")):
+            check_deadline(expires_at)
+            yield chunk
+
+    async def _send_file_request(
+        self,
+        method: str,
+        endpoint: str,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            response = await self.transport.request(
+                method=method,
+                url=url,
+                files=files,
+                data=data,
+                headers=self._file_headers(),
+                timeout=self.timeout
+            )
+        except httpx.RequestError as e:
+            raise self._request_error(e)
+
+        self._raise_for_status(response, "Request failed", "API error: No valid error message provided")
+        return self._parse_result(response)
+
+    async def chat_message(
+        self,
+        query: str,
+        user: str,
+        response_mode: str,
+        inputs: Dict[str, Any] = None,
+        conversation_id: Optional[str] = None,
+        files: Optional[List[FileObject]] = None,
+        auto_generate_name: bool = True,
+        stream_mode: str = "chunks"
+    ) -> Union[ChatCompletionResponse, AsyncChatMessageStream]:
+        """
+        Async version of AIApplication.chat_message.
+
+        With response_mode="streaming" the coroutine resolves to an AsyncChatMessageStream of
+        ChatCompletionStreamResponse objects; use it with ``async with`` (or aclose() it) so a
+        consumer that stops early releases the connection and stops the generation. stream_mode
+        "text" yields answer fragments as str and "raw" each event's undecoded bytes.
+        """
+        data = self._prepare_chat_message(query, user, response_mode, inputs, conversation_id,
+                                          files, auto_generate_name, stream_mode)
+
+        if response_mode == "streaming":
+            events = await self._send_request(
+                method="POST",
+                endpoint="/chat-messages",
+                json_data=data,
+                stream=True,
+                raw_events=stream_mode == "raw"
+            )
+            return AsyncChatMessageStream(events, lambda task_id: self.stop_generate_message(task_id, user),
+                                          stream_mode)
+
+        response = await self._send_request(
+            method="POST",
+            endpoint="/chat-messages",
+            json_data=data,
+            stream=False
+        )
+        return ChatCompletionResponse.from_dict(response["result"])
+
+    async def file_upload(self, file_path: str, user: str) -> FileUploadResponse:
+        """Async version of AIApplication.file_upload."""
+        file_name, mime_type = self._prepare_file_upload(file_path, user)
+
+        with open(file_path, 'rb') as file:
+            files = {
+                'file': (file_name, file, mime_type)
+            }
+            data = {
+                'user': user
+            }
+            response = await self._send_file_request(
+                method="POST",
+                endpoint="/files/upload",
+                files=files,
+                data=data
+            )
+
+            return FileUploadResponse.from_dict(response["result"])
+
+    async def get_conversation_messages(self, user: str, conversation_id: str,
+                                        first_id: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Async version of AIApplication.get_conversation_messages."""
+        params = self._prepare_conversation_messages(user, conversation_id, first_id, limit)
+        response = await self._send_request(method="GET", endpoint="/messages", params=params)
+        return self._build_conversation_messages(response["result"])
+
+    async def get_conversations(self, user: str, last_id: Optional[str] = None,
+                                limit: Optional[int] = None, pinned: Optional[bool] = None) -> Dict[str, Any]:
+        """Async version of AIApplication.get_conversations."""
+        params = self._prepare_conversations(user, last_id, limit, pinned)
+        response = await self._send_request(method="GET", endpoint="/conversations", params=params)
+        return self._build_conversations(response["result"])
+
+    async def send_message_feedback(self, message_id: str, user: str, rating: str) -> Dict[str, str]:
+        """Async version of AIApplication.send_message_feedback."""
+        data = self._prepare_message_feedback(message_id, user, rating)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/messages/{message_id}/feedbacks",
+            json_data=data
+        )
+        return response["result"]
+
+    async def rename_conversation(self, conversation_id: str, user: str, name: Optional[str] = None,
+                                  auto_generate: bool = False) -> Conversation:
+        """Async version of AIApplication.rename_conversation."""
+        data = self._prepare_rename_conversation(conversation_id, user, name, auto_generate)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/conversations/{conversation_id}/name",
+            json_data=data
+        )
+        return Conversation(**response["result"])
+
+    async def stop_generate_message(self, task_id: str, user: str) -> Dict[str, str]:
+        """Async version of AIApplication.stop_generate_message."""
+        data = self._prepare_stop_generate(task_id, user)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/chat-messages/{task_id}/stop",
+            json_data=data
+        )
+        return response["result"]
@@ -0,0 +1,172 @@
+from typing import Any, Dict, Optional
+
+from sify.aiplatform.aistudio.datamind import _DataMindBase
+from sify.aiplatform.aistudio.types import ProcessRule, DocumentResponse, ListDocumentsResponse, DatasetResponse, ListKnowledgeResponse, BatchStatusResponse
+from sify.aiplatform.transport.async_http import AsyncHTTPTransport, httpx
+from sify.aiplatform.transport.timeouts import TimeoutConfig
+
+
+class AsyncDataMind(_DataMindBase):
+    """
+    Asyncio client for DataMind knowledge datasets.
+
+    Exposes the same methods as DataMind as coroutines returning the same response types.
+    """
+
+    def __init__(self, base_url: str, api_key: str, transport: Optional[AsyncHTTPTransport] = None,
+                 timeout: Optional[TimeoutConfig] = None, lazy: bool = False):
+        """
+        Initialize the AsyncDataMind client with the base URL and API key.
+
+        Args:
+            base_url (str): The base URL of the DataMind API (e.g., https://copilot-dev.sifymdp.digital/v1).
+            api_key (str): The API key for authentication.
+            transport (Optional[AsyncHTTPTransport]): Pooled async transport to send requests over.
+                Defaults to a transport owned by, and closed with, this client.
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                client's requests. Defaults to the transport's timeouts.
+            lazy (bool): Return list_documents and list_knowledge responses as lazy views over the
+                decoded JSON: documents and datasets are built on first access and the JSON itself
+                is never modified. Defaults to False.
+
+        Raises:
+            ValueError: If base_url or api_key is empty or invalid.
+            ImportError: If httpx is not installed.
+        """
+        super().__init__(base_url, api_key, lazy)
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncHTTPTransport()
+        self.timeout = timeout or self.transport.timeout
+
+    async def aclose(self) -> None:
+        """Close the underlying transport if this client created it."""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncDataMind":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _send_request(self, method: str, endpoint: str, json_data: Dict[str, Any] = None,
+                            params: Dict[str, Any] = None, files: Dict[str, Any] = None) -> Dict[str, Any]:
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            response = await self.transport.request(
+                method=method,
+                url=url,
+                json=json_data,
+                params=params,
+                headers=self._headers(files),
+                files=files,
+                timeout=self.timeout
+            )
+        except httpx.TimeoutException:
+            raise ValueError("Request timeout")
+        except httpx.NetworkError:
+            raise ValueError("Connection error")
+        except httpx.RequestError:
+            raise ValueError("Something Went Wrong")
+
+        self._raise_for_status(response)
+        return self._parse_result(response)
+
+    async def create_document_from_text(self, dataset_id: str, name: str, text: str,
+                                        indexing_technique: str = "high_quality",
+                                        process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
+        """Async version of DataMind.create_document_from_text."""
+        data = self._prepare_document_from_text(dataset_id, name, text, indexing_technique, process_rule)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/datasets/{dataset_id}/document/create_by_text",
+            json_data=data
+        )
+        return self._build_document_response(response["result"])
+
+    async def create_document_from_file(self, dataset_id: str, file_path: str,
+                                        indexing_technique: str = "high_quality",
+                                        process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
+        """Async version of DataMind.create_document_from_file."""
+        data = self._prepare_document_from_file(dataset_id, file_path, indexing_technique, process_rule)
+        with open(file_path, 'rb') as file:
+            response = await self._send_request(
+                method="POST",
+                endpoint=f"/datasets/{dataset_id}/document/create_by_file",
+                files=self._file_payload(data, file)
+            )
+        return self._build_document_response(response["result"])
+
+    async def create_knowledge(self, name: str) -> DatasetResponse:
+        """Async version of DataMind.create_knowledge."""
+        self._validate_required_params({"name": name})
+        data = {"name": name}
+        response = await self._send_request(method="POST", endpoint="/datasets", json_data=data)
+        return DatasetResponse(**response["result"])
+
+    async def list_knowledge(self, page: int = 1, limit: int = 20) -> ListKnowledgeResponse:
+        """Async version of DataMind.list_knowledge."""
+        params = self._prepare_list_knowledge(page, limit)
+        response = await self._send_request(method="GET", endpoint="/datasets", params=params)
+        return self._build_list_knowledge(response["result"])
+
+    async def delete_knowledge(self, dataset_id: str):
+        """Async version of DataMind.delete_knowledge."""
+        self._validate_required_params({"dataset_id": dataset_id})
+        response = await self._send_request(method="DELETE", endpoint=f"/datasets/{dataset_id}")
+        return self._build_delete_status(response)
+
+    async def update_document_text(self, dataset_id: str, document_id: str, name: str, text: str) -> DocumentResponse:
+        """Async version of DataMind.update_document_text."""
+        data = self._prepare_update_document_text(dataset_id, document_id, name, text)
+        response = await self._send_request(
+            method="POST",
+            endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_text",
+            json_data=data
+        )
+        return self._build_document_response(response["result"])
+
+    async def update_document_file(self, dataset_id: str, document_id: str, file_path: str) -> DocumentResponse:
+        """Async version of DataMind.update_document_file."""
+        data = self._prepare_update_document_file(dataset_id, document_id, file_path)
+        with open(file_path, 'rb') as file:
+            response = await self._send_request(
+                method="POST",
+                endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_file",
+                files=self._file_payload(data, file)
+            )
+        return self._build_document_response(response["result"])
+
+    async def delete_document(self, dataset_id: str, document_id: str) -> str:
+        """Async version of DataMind.delete_document."""
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "document_id": document_id
+        })
+        response = await self._send_request(
+            method="DELETE",
+            endpoint=f"/datasets/{dataset_id}/documents/{document_id}"
+        )
+        return response["result"]["result"]
+
+    async def get_embedding_status(self, dataset_id: str, batch: str) -> BatchStatusResponse:
+        """Async version of DataMind.get_embedding_status."""
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "batch": batch
+        })
+        response = await self._send_request(
+            method="GET",
+            endpoint=f"/datasets/{dataset_id}/documents/{batch}/indexing-status"
+        )
+        return self._build_batch_status(response["result"])
+
+    async def list_documents(self, dataset_id: str) -> ListDocumentsResponse:
+        """Async version of DataMind.list_documents."""
+        self._validate_required_params({"dataset_id": dataset_id})
+        response = await self._send_request(
+            method="GET",
+            endpoint=f"/datasets/{dataset_id}/documents"
+        )
+        return self._build_list_documents(response["result"])
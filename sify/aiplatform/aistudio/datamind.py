@@ -2,69 +2,234 @@ import requests
 import json
 from typing import Dict, Any, Optional
 from sify.aiplatform.aistudio.types import ProcessRule, DocumentResponse, Document, SegmentationRule, PreProcessingRule, Dataset, BatchStatus, ListDocumentsResponse, DatasetResponse, ListKnowledgeResponse, BatchStatusResponse
+from sify.aiplatform.aistudio.lazy import LazyListDocumentsResponse, LazyListKnowledgeResponse
+from sify.aiplatform.transport import HTTPTransport, TimeoutConfig, codec, get_default_transport
 
-class DataMind:
-    def __init__(self, base_url: str, api_key: str):
+class _DataMindBase:
+    """Request building, validation and response parsing shared by the sync and async clients."""
+
+    def __init__(self, base_url: str, api_key: str, lazy: bool = False):
+        if not base_url:
+            raise ValueError("Base URL must be provided")
+        if not api_key:
+            raise ValueError("API key must be provided")
+        
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.lazy = lazy
+
+    def _headers(self, files: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        if not files:
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    def _raise_for_status(self, response) -> None:
+        if response.status_code < 400:
+            return
+        # requests exposes the status text as `reason`, httpx as `reason_phrase`
+        reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+        error_msg = f"{response.status_code} {reason}"
+        try:
+            error_response = codec.loads(response.content)
+            if 'message' in error_response and isinstance(error_response['message'], str):
+                error_msg = error_response['message']
+        except json.JSONDecodeError:
+            if response.status_code == 404:
+                error_msg = reason
+            elif 'text/html' in response.headers.get('Content-Type', ''):
+                error_msg = f"HTML Error: {response.text[:100]}"
+            else:
+                error_msg = response.text if response.text else "Non-JSON Error"
+        raise ValueError(error_msg)
+
+    def _parse_result(self, response) -> Dict[str, Any]:
+        try:
+            result = codec.loads(response.content)
+        except json.JSONDecodeError:
+            if 'text/html' in response.headers.get('Content-Type', ''):
+                result = f"HTML Response: {response.text[:100]}"
+            else:
+                result = response.text if response.text else "Non-JSON Response"
+        return {"status_code": response.status_code, "result": result}
+
+    def _validate_required_params(self, params: Dict[str, Any]) -> None:
+        for param_name, param_value in params.items():
+            if not param_value:
+                raise ValueError(f"{param_name} must not be empty")
+
+    def _default_file_process_rule(self) -> ProcessRule:
+        return ProcessRule(
+            mode="custom",
+            rules={
+                "pre_processing_rules": [
+                    PreProcessingRule(id="remove_extra_spaces", enabled=True),
+                    PreProcessingRule(id="remove_urls_emails", enabled=True)
+                ],
+                "segmentation": SegmentationRule(separator="###", max_tokens=500)
+            }
+        )
+
+    def _file_payload(self, data: Dict[str, Any], file) -> Dict[str, Any]:
+        return {
+            'data': (None, json.dumps(data), 'text/plain'),
+            'file': file
+        }
+
+    def _prepare_document_from_text(self, dataset_id: str, name: str, text: str, indexing_technique: str,
+                                    process_rule: Optional[ProcessRule]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "name": name,
+            "text": text
+        })
+
+        if process_rule is None:
+            process_rule = ProcessRule(mode="automatic")
+
+        return {
+            "name": name,
+            "text": text,
+            "indexing_technique": indexing_technique,
+            "process_rule": process_rule.to_dict()
+        }
+
+    def _prepare_document_from_file(self, dataset_id: str, file_path: str, indexing_technique: str,
+                                    process_rule: Optional[ProcessRule]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "file_path": file_path
+        })
+        if process_rule is None:
+            process_rule = self._default_file_process_rule()
+            
+        return {
+            "indexing_technique": indexing_technique,
+            "process_rule": process_rule.to_dict()
+        }
+
+    def _build_document_response(self, result: Dict[str, Any]) -> DocumentResponse:
+        return DocumentResponse(
+            document=Document(**result["document"]),
+            batch=result["batch"]
+        )
+
+    def _prepare_list_knowledge(self, page: int, limit: int) -> Dict[str, Any]:
+        if page < 1 or limit < 1:
+            raise ValueError("Page and limit must be greater than 0")
+        return {
+            "page": page,
+            "limit": limit
+        }
+
+    def _build_list_knowledge(self, result: Dict[str, Any]) -> ListKnowledgeResponse:
+        if self.lazy:
+            return LazyListKnowledgeResponse(result)
+        return ListKnowledgeResponse(
+            data=[Dataset(**dataset) for dataset in result["data"]],
+            has_more=result["has_more"],
+            limit=result["limit"],
+            total=result["total"],
+            page=result["page"]
+        )
+
+    def _build_delete_status(self, response: Dict[str, Any]) -> str:
+        result = response["result"]
+        # Handle both string and dict responses, and 204 No Content
+        if response.get("status_code") == 204 or result == "No Content":
+            status = "success"   
+        else:
+            status = "Something Went Wrong while deleteing"
+        return status
+
+    def _prepare_update_document_text(self, dataset_id: str, document_id: str, name: str,
+                                      text: str) -> Dict[str, Any]:
+        self._validate_required_params({"dataset_id": dataset_id,
+                                       "document_id": document_id, 
+                                       "name": name, 
+                                       "text": text})
+        return {
+            "name": name,
+            "text": text
+        }
+
+    def _prepare_update_document_file(self, dataset_id: str, document_id: str, file_path: str) -> Dict[str, Any]:
+        self._validate_required_params({
+            "dataset_id": dataset_id,
+            "document_id": document_id,
+            "file_path": file_path
+        })
+
+        return {
+            "indexing_technique": "high_quality",
+            "process_rule": self._default_file_process_rule().to_dict()
+        }
+
+    def _build_batch_status(self, result: Dict[str, Any]) -> BatchStatusResponse:
+        return BatchStatusResponse(
+            data=[BatchStatus(**status) for status in result["data"]]
+        )
+
+    def _build_list_documents(self, result: Dict[str, Any]) -> ListDocumentsResponse:
+        required_fields = ["data", "has_more", "limit", "total", "page"]
+        for field in required_fields:
+            if field not in result:
+                raise ValueError(f"Missing required field '{field}' in API response: {result}")
+        if self.lazy:
+            return LazyListDocumentsResponse(result)
+        return ListDocumentsResponse(
+            data=[Document(**doc) for doc in result["data"]],
+            has_more=result["has_more"],
+            limit=result["limit"],
+            total=result["total"],
+            page=result["page"]
+        )
+
+
+class DataMind(_DataMindBase):
+    def __init__(self, base_url: str, api_key: str, transport: Optional[HTTPTransport] = None,
+                 timeout: Optional[TimeoutConfig] = None, lazy: bool = False):
         """
         Initialize the DataMind client with the base URL and API key.
 
         Args:
             base_url (str): The base URL of the DataMind API (e.g., https://copilot-dev.sifymdp.digital/v1).
             api_key (str): The API key for authentication.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests over.
+                                                 Defaults to the process-wide shared transport.
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                                               client's requests. Defaults to the transport's timeouts.
+            lazy (bool): Return list_documents and list_knowledge responses as lazy views over the
+                         decoded JSON: documents and datasets are built on first access and
+                         the JSON itself is never modified. Defaults to False.
 
         Raises:
             ValueError: If base_url or api_key is empty or invalid.
         """
-        if not base_url:
-            raise ValueError("Base URL must be provided")
-        if not api_key:
-            raise ValueError("API key must be provided")
-        
-        self.base_url = base_url.rstrip('/')
-        self.api_key = api_key
+        super().__init__(base_url, api_key, lazy)
+        self.transport = transport or get_default_transport()
+        self.timeout = timeout or self.transport.timeout
 
     def _send_request(self, method: str, endpoint: str, json_data: Dict[str, Any] = None, 
                      params: Dict[str, Any] = None, files: Dict[str, Any] = None) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json" if not files else None
-        }
+        headers = self._headers(files)
 
         url = f"{self.base_url}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.transport.request(
                 method=method,
                 url=url,
                 json=json_data,
                 params=params,
                 headers=headers,
                 files=files,
-                timeout=300
+                timeout=self.timeout
             )
-            if response.status_code >= 400:
-                error_msg = f"{response.status_code} {response.reason}"
-                try:
-                    error_response = response.json()
-                    if 'message' in error_response and isinstance(error_response['message'], str):
-                        error_msg = error_response['message']
-                except json.JSONDecodeError:
-                    if response.status_code == 404:
-                        error_msg = response.reason
-                    elif 'text/html' in response.headers.get('Content-Type', ''):
-                        error_msg = f"HTML Error: {response.text[:100]}"
-                    else:
-                        error_msg = response.text if response.text else "Non-JSON Error"
-                raise ValueError(error_msg)
-
-            try:
-                result = response.json()
-            except json.JSONDecodeError:
-                if 'text/html' in response.headers.get('Content-Type', ''):
-                    result = f"HTML Response: {response.text[:100]}"
-                else:
-                    result = response.text if response.text else "Non-JSON Response"
-            return {"status_code": response.status_code, "result": result}
+            self._raise_for_status(response)
+            return self._parse_result(response)
 
         except requests.RequestException as e:
             error_msg = str(e).lower()
@@ -75,11 +240,6 @@ class DataMind:
             else:
                 error_msg = "Something Went Wrong"
             raise ValueError(error_msg)
-        
-    def _validate_required_params(self, params: Dict[str, Any]) -> None:
-        for param_name, param_value in params.items():
-            if not param_value:
-                raise ValueError(f"{param_name} must not be empty")
 
     def create_document_from_text(self, dataset_id: str, name: str, text: str, 
                                  indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
@@ -120,31 +280,14 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, name, or text is empty, or Output request fails.
         """
-        self._validate_required_params({
-            "dataset_id": dataset_id,
-            "name": name,
-            "text": text
-        })
-
-        if process_rule is None:
-            process_rule = ProcessRule(mode="automatic")
-
-        data = {
-            "name": name,
-            "text": text,
-            "indexing_technique": indexing_technique,
-            "process_rule": process_rule.to_dict()
-        }
+        data = self._prepare_document_from_text(dataset_id, name, text, indexing_technique, process_rule)
         
         response = self._send_request(
             method="POST", 
             endpoint=f"/datasets/{dataset_id}/document/create_by_text", 
             json_data=data
         )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._build_document_response(response["result"])
 
     def create_document_from_file(self, dataset_id: str, file_path: str,
                                  indexing_technique: str = "high_quality", process_rule: Optional[ProcessRule] = None) -> DocumentResponse:
@@ -185,41 +328,15 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, file_path, or name is empty, or Output request fails.
         """
-        self._validate_required_params({
-            "dataset_id": dataset_id,
-            "file_path": file_path
-        })
-        if process_rule is None:
-            process_rule = ProcessRule(
-                mode="custom",
-                rules={
-                    "pre_processing_rules": [
-                        PreProcessingRule(id="remove_extra_spaces", enabled=True),
-                        PreProcessingRule(id="remove_urls_emails", enabled=True)
-                    ],
-                    "segmentation": SegmentationRule(separator="###", max_tokens=500)
-                }
-            )
-            
-        data = {
-            "indexing_technique": indexing_technique,
-            "process_rule": process_rule.to_dict()
-        }
+        data = self._prepare_document_from_file(dataset_id, file_path, indexing_technique, process_rule)
         
         with open(file_path, 'rb') as file:
-            files = {
-                'data': (None, json.dumps(data), 'text/plain'),
-                'file': file
-            }
             response = self._send_request(
                 method="POST",
                 endpoint=f"/datasets/{dataset_id}/document/create_by_file",
-                files=files
+                files=self._file_payload(data, file)
             )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._build_document_response(response["result"])
 
     def create_knowledge(self, name: str) -> DatasetResponse:
         """
@@ -287,20 +404,9 @@ class DataMind:
         Raises:
             ValueError: If page or limit is less than 1 or Output request fails.
         """
-        if page < 1 or limit < 1:
-            raise ValueError("Page and limit must be greater than 0")
-        params = {
-            "page": page,
-            "limit": limit
-        }
+        params = self._prepare_list_knowledge(page, limit)
         response = self._send_request(method="GET", endpoint="/datasets", params=params)
-        return ListKnowledgeResponse(
-            data=[Dataset(**dataset) for dataset in response["result"]["data"]],
-            has_more=response["result"]["has_more"],
-            limit=response["result"]["limit"],
-            total=response["result"]["total"],
-            page=response["result"]["page"]
-        )
+        return self._build_list_knowledge(response["result"])
 
     def delete_knowledge(self, dataset_id: str):
         """
@@ -318,13 +424,7 @@ class DataMind:
         """
         self._validate_required_params({"dataset_id": dataset_id})
         response = self._send_request(method="DELETE", endpoint=f"/datasets/{dataset_id}")
-        result = response["result"]
-        # Handle both string and dict responses, and 204 No Content
-        if response.get("status_code") == 204 or result == "No Content":
-            status = "success"   
-        else:
-            status = "Something Went Wrong while deleteing"
-        return status
+        return self._build_delete_status(response)
 
     def update_document_text(self, dataset_id: str, document_id: str, name: str, text: str) -> DocumentResponse:
         """
@@ -364,23 +464,13 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, document_id, name, or text is empty, or Output request fails.
         """
-        self._validate_required_params({"dataset_id": dataset_id,
-                                       "document_id": document_id, 
-                                       "name": name, 
-                                       "text": text})
-        data = {
-            "name": name,
-            "text": text
-        }
+        data = self._prepare_update_document_text(dataset_id, document_id, name, text)
         response = self._send_request(
             method="POST",
             endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_text",
             json_data=data
         )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._build_document_response(response["result"])
 
     def update_document_file(self, dataset_id: str, document_id: str, file_path: str) -> DocumentResponse:
         """
@@ -419,40 +509,15 @@ class DataMind:
         Raises:
             ValueError: If dataset_id, document_id, name, or file_path is empty, or Output request fails.
 """
-        self._validate_required_params({
-            "dataset_id": dataset_id,
-            "document_id": document_id,
-            "file_path": file_path
-        })
-
-        data = {
-            "indexing_technique": "high_quality",
-            "process_rule": ProcessRule(
-                mode="custom",
-                rules={
-                    "pre_processing_rules": [
-                        PreProcessingRule(id="remove_extra_spaces", enabled=True),
-                        PreProcessingRule(id="remove_urls_emails", enabled=True)
-                    ],
-                    "segmentation": SegmentationRule(separator="###", max_tokens=500)
-                }
-            ).to_dict()
-        }
+        data = self._prepare_update_document_file(dataset_id, document_id, file_path)
         
         with open(file_path, 'rb') as file:
-            files = {
-                'data': (None, json.dumps(data), 'text/plain'),
-                'file': file
-            }
             response = self._send_request(
                 method="POST",
                 endpoint=f"/datasets/{dataset_id}/documents/{document_id}/update_by_file",
-                files=files
+                files=self._file_payload(data, file)
             )
-        return DocumentResponse(
-            document=Document(**response["result"]["document"]),
-            batch=response["result"]["batch"]
-        )
+        return self._build_document_response(response["result"])
 
     def delete_document(self, dataset_id: str, document_id: str) -> str:
         """
@@ -519,9 +584,7 @@ class DataMind:
             method="GET",
             endpoint=f"/datasets/{dataset_id}/documents/{batch}/indexing-status"
         )
-        return BatchStatusResponse(
-            data=[BatchStatus(**status) for status in response["result"]["data"]]
-        )
+        return self._build_batch_status(response["result"])
 
     def list_documents(self, dataset_id: str) -> ListDocumentsResponse:
         """
@@ -566,15 +629,4 @@ class DataMind:
             method="GET",
             endpoint=f"/datasets/{dataset_id}/documents"
         )
-        result = response["result"]
-        required_fields = ["data", "has_more", "limit", "total", "page"]
-        for field in required_fields:
-            if field not in result:
-                raise ValueError(f"Missing required field '{field}' in API response: {result}")
-        return ListDocumentsResponse(
-            data=[Document(**doc) for doc in result["data"]],
-            has_more=result["has_more"],
-            limit=result["limit"],
-            total=result["total"],
-            page=result["page"]
-        )
+        return self._build_list_documents(response["result"])
@@ -0,0 +1,20 @@
+from sify.aiplatform.aistudio.types import Dataset, Document, ListDocumentsResponse, ListKnowledgeResponse
+from sify.aiplatform.models.lazy import LazyView, list_of
+
+
+class LazyDocument(LazyView, Document):
+    __slots__ = ("_data",)
+
+
+class LazyListDocumentsResponse(LazyView, ListDocumentsResponse):
+    __slots__ = ("_data",)
+    _builders = {"data": list_of(LazyDocument)}
+
+
+class LazyDataset(LazyView, Dataset):
+    __slots__ = ("_data",)
+
+
+class LazyListKnowledgeResponse(LazyView, ListKnowledgeResponse):
+    __slots__ = ("_data",)
+    _builders = {"data": list_of(LazyDataset)}
@@ -0,0 +1,187 @@
+import re
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Union
+
+from sify.aiplatform.aistudio.types import ChatCompletionStreamResponse
+from sify.aiplatform.transport import codec
+from sify.aiplatform.transport.sse import _aclose_soon
+
+# chunks: ChatCompletionStreamResponse objects, text: answer fragments, raw: undecoded event bytes
+STREAM_MODES = ("chunks", "text", "raw")
+
+# Events after which the application has finished generating the answer
+_FINAL_EVENTS = frozenset(["message_end", "workflow_finished", "error"])
+# The "event" field of a final event in undecoded JSON; quotes inside the answer text are
+# escaped, so text that merely mentions an event name does not match
+_FINAL_EVENT_FIELD = re.compile(rb'"event"\s*:\s*"(?:%s)"' % b"|".join(sorted(name.encode() for name in _FINAL_EVENTS)))
+
+
+class _TaskTracker:
+    """Follows task_id and completion across events so an early close can stop the task."""
+
+    def __init__(self, mode: str):
+        self._mode = mode
+        self.task_id: Optional[str] = None
+        self.finished = False
+        self.closed = False
+
+    def _convert(self, event: Union[Dict[str, Any], bytes]) -> Any:
+        """Return what to yield for an event, or None to skip it."""
+        if self._mode == "raw":
+            # Raw events are only decoded until the task_id is known; after that matching
+            # the event field is enough to notice the final event
+            if self.task_id is None:
+                try:
+                    self._track(codec.loads(event))
+                except ValueError:
+                    pass
+            elif _FINAL_EVENT_FIELD.search(event):
+                self.finished = True
+            return event
+
+        self._track(event)
+        if self._mode == "text":
+            return event.get("answer") or None
+        return ChatCompletionStreamResponse.from_dict(event)
+
+    def _track(self, event: Any) -> None:
+        if not isinstance(event, dict):
+            return
+        if event.get("task_id"):
+            self.task_id = event["task_id"]
+        if event.get("event") in _FINAL_EVENTS:
+            self.finished = True
+
+
+class ChatMessageStream(_TaskTracker):
+    """
+    Iterator returned by chat_message(response_mode="streaming"), yielding
+    ChatCompletionStreamResponse objects, answer fragments or raw event bytes
+    depending on stream_mode.
+
+    Remembers the task_id of the generation. If the stream is closed before the
+    application finished answering, via close() or leaving a with block (e.g. because
+    the end client disconnected), the connection is released and stop_generate_message
+    is sent for that task so the server stops generating. A stream that is garbage
+    collected instead only releases its connection in the finalizer; the stop request,
+    if stop_in_background is given, is sent from a daemon thread so collection never
+    waits on the network.
+    """
+
+    def __init__(self, events: Iterator[Union[Dict[str, Any], bytes]], stop: Callable[[str], Any],
+                 mode: str = "chunks", stop_in_background: Optional[Callable[[str], Any]] = None):
+        super().__init__(mode)
+        self._events = events
+        self._stop = stop
+        self._stop_in_background = stop_in_background
+
+    def __iter__(self) -> "ChatMessageStream":
+        return self
+
+    def __next__(self) -> Union[ChatCompletionStreamResponse, str, bytes]:
+        while True:
+            try:
+                event = next(self._events)
+            except StopIteration:
+                self.finished = True
+                raise
+            item = self._convert(event)
+            if item is not None:
+                return item
+
+    def close(self) -> None:
+        """Release the connection and, if the answer is incomplete, stop the generation."""
+        if self.closed:
+            return
+        self.closed = True
+        close = getattr(self._events, "close", None)
+        if close is not None:
+            close()
+        if not self.finished and self.task_id:
+            try:
+                self._stop(self.task_id)
+            except ValueError:
+                # Best effort: the task may already have finished on the server
+                pass
+
+    def __enter__(self) -> "ChatMessageStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            close = getattr(self._events, "close", None)
+            if close is not None:
+                close()
+        except Exception:
+            pass
+        if not self.finished and self.task_id and self._stop_in_background is not None:
+            threading.Thread(target=_stop_quietly, args=(self._stop_in_background, self.task_id),
+                             name="sify-stop-generate", daemon=True).start()
+
+
+def _stop_quietly(stop: Callable[[str], Any], task_id: str) -> None:
+    try:
+        stop(task_id)
+    except Exception:
+        # Best effort: nobody is left to report a failure to
+        pass
+
+
+class AsyncChatMessageStream(_TaskTracker):
+    """
+    Async version of ChatMessageStream.
+
+    Prefer ``async with`` or aclose(); a stream garbage collected while its event loop
+    is running is closed, and its generation stopped, in a background task.
+    """
+
+    def __init__(self, events: AsyncIterator[Union[Dict[str, Any], bytes]], stop: Callable[[str], Awaitable[Any]],
+                 mode: str = "chunks"):
+        super().__init__(mode)
+        self._events = events
+        self._stop = stop
+
+    def __aiter__(self) -> "AsyncChatMessageStream":
+        return self
+
+    async def __anext__(self) -> Union[ChatCompletionStreamResponse, str, bytes]:
+        while True:
+            try:
+                event = await self._events.__anext__()
+            except StopAsyncIteration:
+                self.finished = True
+                raise
+            item = self._convert(event)
+            if item is not None:
+                return item
+
+    async def aclose(self) -> None:
+        """Release the connection and, if the answer is incomplete, stop the generation."""
+        if self.closed:
+            return
+        self.closed = True
+        aclose = getattr(self._events, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        if not self.finished and self.task_id:
+            try:
+                await self._stop(self.task_id)
+            except ValueError:
+                # Best effort: the task may already have finished on the server
+                pass
+
+    async def __aenter__(self) -> "AsyncChatMessageStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __del__(self) -> None:
+        if not self.closed:
+            _aclose_soon(self.aclose)
@@ -1,10 +1,14 @@
-from typing import Any, Dict, List, Optional,Any
+from typing import Any, Dict, List, Mapping, Optional,Any
+
+from sify.aiplatform.models.types import NO_EXTRA
 
 class FileObject:
+    __slots__ = ("type", "transfer_method", "url", "upload_file_id")
+
     type: str
     transfer_method: str
-    url: Optional[str] = None
-    upload_file_id: Optional[str] = None
+    url: Optional[str]
+    upload_file_id: Optional[str]
 
     def __init__(self, type: str, transfer_method: str, url: Optional[str] = None, upload_file_id: Optional[str] = None):
         self.type = type
@@ -21,6 +25,11 @@ class FileObject:
         }
 
 class RetrieverResource:
+    __slots__ = (
+        "position", "dataset_id", "dataset_name", "document_id", "document_name", "segment_id", "score",
+        "content", "extra"
+    )
+
     position: int
     dataset_id: str
     dataset_name: str
@@ -29,9 +38,10 @@ class RetrieverResource:
     segment_id: str
     score: float
     content: str
+    extra: Mapping[str, Any]
 
     def __init__(self, position: int, dataset_id: str, dataset_name: str, document_id: str,
-                 document_name: str, segment_id: str, score: float, content: str):
+                 document_name: str, segment_id: str, score: float, content: str, **extra):
         self.position = position
         self.dataset_id = dataset_id
         self.dataset_name = dataset_name
@@ -40,6 +50,7 @@ class RetrieverResource:
         self.segment_id = segment_id
         self.score = score
         self.content = content
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -50,33 +61,44 @@ class RetrieverResource:
             "document_name": self.document_name,
             "segment_id": self.segment_id,
             "score": self.score,
-            "content": self.content
+            "content": self.content,
+            **self.extra
         }
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> 'RetrieverResource':
         return cls(**d)
 
 class MessageFile:
+    __slots__ = ("id", "type", "url", "belongs_to", "extra")
+
     id: str
     type: str
     url: str
     belongs_to: str
+    extra: Mapping[str, Any]
 
-    def __init__(self, id: str, type: str, url: str, belongs_to: str):
+    def __init__(self, id: str, type: str, url: str, belongs_to: str, **extra):
         self.id = id
         self.type = type
         self.url = url
         self.belongs_to = belongs_to
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "type": self.type,
             "url": self.url,
-            "belongs_to": self.belongs_to
+            "belongs_to": self.belongs_to,
+            **self.extra
         }
 
 class AgentThought:
+    __slots__ = (
+        "id", "message_id", "position", "thought", "tool", "tool_input", "observation", "created_at",
+        "message_files", "extra"
+    )
+
     id: str
     message_id: str
     position: int
@@ -86,9 +108,10 @@ class AgentThought:
     observation: str
     created_at: int
     message_files: List[str]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, message_id: str, position: int, thought: str, tool: str,
-                 tool_input: str, observation: str, created_at: int, message_files: List[str]):
+                 tool_input: str, observation: str, created_at: int, message_files: List[str], **extra):
         self.id = id
         self.message_id = message_id
         self.position = position
@@ -98,6 +121,7 @@ class AgentThought:
         self.observation = observation
         self.created_at = created_at
         self.message_files = message_files
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -109,10 +133,16 @@ class AgentThought:
             "tool_input": self.tool_input,
             "observation": self.observation,
             "created_at": self.created_at,
-            "message_files": self.message_files
+            "message_files": self.message_files,
+            **self.extra
         }
 
 class Message:
+    __slots__ = (
+        "id", "conversation_id", "inputs", "query", "answer", "message_files", "feedback",
+        "retriever_resources", "agent_thoughts", "created_at"
+    )
+
     id: str
     conversation_id: str
     inputs: Dict[str, Any]
@@ -153,20 +183,25 @@ class Message:
         }
 
 class Conversation:
+    __slots__ = ("id", "name", "inputs", "introduction", "created_at", "status", "extra")
+
     id: str
     name: str
     inputs: Dict[str, Any]
     introduction: str
     created_at: int
     status: str
+    extra: Mapping[str, Any]
 
-    def __init__(self, id: str, name: str, inputs: Dict[str, Any], introduction: str, created_at: int, status: str):
+    def __init__(self, id: str, name: str, inputs: Dict[str, Any], introduction: str, created_at: int, status: str,
+                 **extra):
         self.id = id
         self.name = name
         self.inputs = inputs
         self.introduction = introduction
         self.created_at = created_at
         self.status = status
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -175,14 +210,21 @@ class Conversation:
             "inputs": self.inputs,
             "introduction": self.introduction,
             "created_at": self.created_at,
-            "status": self.status
+            "status": self.status,
+            **self.extra
         }
 
 
 class ChatMetaUsage:
+    __slots__ = (
+        "prompt_tokens", "prompt_unit_price", "prompt_price", "prompt_price_unit", "completion_tokens",
+        "completion_unit_price", "completion_price", "completion_price_unit", "total_tokens", "total_price",
+        "currency", "latency", "extra"
+    )
+
     def __init__(self, prompt_tokens: int, prompt_unit_price: float, prompt_price: float, prompt_price_unit: str,
                  completion_tokens: int, completion_unit_price: float, completion_price: float, completion_price_unit: str,
-                 total_tokens: int, total_price: float, currency: str, latency: float):
+                 total_tokens: int, total_price: float, currency: str, latency: float, **extra):
         self.prompt_tokens = prompt_tokens
         self.prompt_unit_price = prompt_unit_price
         self.prompt_price = prompt_price
@@ -195,6 +237,7 @@ class ChatMetaUsage:
         self.total_price = total_price
         self.currency = currency
         self.latency = latency
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -209,7 +252,8 @@ class ChatMetaUsage:
             "total_tokens": self.total_tokens,
             "total_price": self.total_price,
             "currency": self.currency,
-            "latency": self.latency
+            "latency": self.latency,
+            **self.extra
         }
     
     @classmethod
@@ -218,6 +262,8 @@ class ChatMetaUsage:
 
 
 class ChatMetaData:
+    __slots__ = ("usage", "retriever_resources")
+
     def __init__(self, usage: ChatMetaUsage, retriever_resources: List[RetrieverResource]):
         self.usage = usage
         self.retriever_resources = retriever_resources
@@ -256,6 +302,11 @@ class ChatMetaData:
 
 
 class ChatCompletionResponse:
+    __slots__ = (
+        "id", "event", "message_id", "conversation_id", "mode", "answer", "metadata", "created_at",
+        "task_id"
+    )
+
     def __init__(self, event: str, message_id: str, conversation_id: str, mode: str,
                  answer: str, metadata: ChatMetaData, created_at: int, id: Optional[str] = None,
                  task_id: Optional[str] = None):
@@ -311,6 +362,10 @@ class ChatCompletionResponse:
         )
     
 class ChatCompletionStreamResponse:
+    __slots__ = (
+        "event", "task_id", "message_id", "conversation_id", "answer", "created_at", "metadata", "id"
+    )
+
     def __init__(self, event: str, message_id: str = None, task_id: str = None, conversation_id: str = None, answer: str = None, created_at: int = None, metadata: dict = None, id: str = None):
         self.event = event
         self.task_id = task_id
@@ -335,6 +390,8 @@ class ChatCompletionStreamResponse:
         )
 
 class PreProcessingRule:
+    __slots__ = ("id", "enabled")
+
     id: str
     enabled: bool
 
@@ -349,6 +406,8 @@ class PreProcessingRule:
         }
 
 class SegmentationRule:
+    __slots__ = ("separator", "max_tokens")
+
     separator: str
     max_tokens: int
 
@@ -363,8 +422,10 @@ class SegmentationRule:
         }
 
 class ProcessRule:
+    __slots__ = ("mode", "rules")
+
     mode: str
-    rules: Optional[Dict[str, Any]] = None
+    rules: Optional[Dict[str, Any]]
 
     def __init__(self, mode: str, rules: Optional[Dict[str, Any]] = None):
         self.mode = mode
@@ -380,13 +441,20 @@ class ProcessRule:
         return result
 
 class Dataset:
+    __slots__ = (
+        "id", "name", "description", "provider", "permission", "data_source_type", "indexing_technique",
+        "app_count", "document_count", "word_count", "created_by", "created_at", "updated_by", "updated_at",
+        "embedding_model", "embedding_model_provider", "embedding_available", "retrieval_model_dict", "tags",
+        "extra"
+    )
+
     id: str
     name: str
-    description: Optional[str] = None
+    description: Optional[str]
     provider: str
     permission: str
-    data_source_type: Optional[str] = None
-    indexing_technique: Optional[str] = None
+    data_source_type: Optional[str]
+    indexing_technique: Optional[str]
     app_count: int
     document_count: int
     word_count: int
@@ -394,18 +462,19 @@ class Dataset:
     created_at: int
     updated_by: str
     updated_at: int
-    embedding_model: Optional[str] = None
-    embedding_model_provider: Optional[str] = None
-    embedding_available: Optional[bool] = None
-    retrieval_model_dict: Optional[Dict[str, Any]] = None
-    tags: Optional[List[str]] = None
+    embedding_model: Optional[str]
+    embedding_model_provider: Optional[str]
+    embedding_available: Optional[bool]
+    retrieval_model_dict: Optional[Dict[str, Any]]
+    tags: Optional[List[str]]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, name: str, description: Optional[str], provider: str, permission: str,
                  data_source_type: Optional[str], indexing_technique: Optional[str], app_count: int,
                  document_count: int, word_count: int, created_by: str, created_at: int,
                  updated_by: str, updated_at: int, embedding_model: Optional[str],
                  embedding_model_provider: Optional[str], embedding_available: Optional[bool],
-                 retrieval_model_dict: Optional[Dict[str, Any]] = None, tags: Optional[List[str]] = None):
+                 retrieval_model_dict: Optional[Dict[str, Any]] = None, tags: Optional[List[str]] = None, **extra):
         self.id = id
         self.name = name
         self.description = description
@@ -425,6 +494,7 @@ class Dataset:
         self.embedding_available = embedding_available
         self.retrieval_model_dict = retrieval_model_dict
         self.tags = tags
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -446,28 +516,36 @@ class Dataset:
             "embedding_model_provider": self.embedding_model_provider,
             "embedding_available": self.embedding_available,
             "retrieval_model_dict": self.retrieval_model_dict,
-            "tags": self.tags
+            "tags": self.tags,
+            **self.extra
         }
 
 class BatchStatus:
+    __slots__ = (
+        "id", "indexing_status", "processing_started_at", "parsing_completed_at", "cleaning_completed_at",
+        "splitting_completed_at", "completed_at", "paused_at", "error", "stopped_at", "completed_segments",
+        "total_segments", "extra"
+    )
+
     id: str
     indexing_status: str
     processing_started_at: float
-    parsing_completed_at: Optional[float] = None
-    cleaning_completed_at: Optional[float] = None
-    splitting_completed_at: Optional[float] = None
-    completed_at: Optional[float] = None
-    paused_at: Optional[float] = None
-    error: Optional[str] = None
-    stopped_at: Optional[float] = None
+    parsing_completed_at: Optional[float]
+    cleaning_completed_at: Optional[float]
+    splitting_completed_at: Optional[float]
+    completed_at: Optional[float]
+    paused_at: Optional[float]
+    error: Optional[str]
+    stopped_at: Optional[float]
     completed_segments: int
     total_segments: int
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, indexing_status: str, processing_started_at: float,
                  parsing_completed_at: Optional[float], cleaning_completed_at: Optional[float],
                  splitting_completed_at: Optional[float], completed_at: Optional[float],
                  paused_at: Optional[float], error: Optional[str], stopped_at: Optional[float],
-                 completed_segments: int, total_segments: int):
+                 completed_segments: int, total_segments: int, **extra):
         self.id = id
         self.indexing_status = indexing_status
         self.processing_started_at = processing_started_at
@@ -480,6 +558,7 @@ class BatchStatus:
         self.stopped_at = stopped_at
         self.completed_segments = completed_segments
         self.total_segments = total_segments
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -494,10 +573,18 @@ class BatchStatus:
             "error": self.error,
             "stopped_at": self.stopped_at,
             "completed_segments": self.completed_segments,
-            "total_segments": self.total_segments
+            "total_segments": self.total_segments,
+            **self.extra
         }
 
 class Document:
+    __slots__ = (
+        "id", "position", "data_source_type", "data_source_info", "dataset_process_rule_id", "name",
+        "created_from", "created_by", "created_at", "tokens", "indexing_status", "error", "enabled",
+        "disabled_at", "disabled_by", "archived", "display_status", "word_count", "hit_count", "doc_form",
+        "data_source_detail_dict", "extra"
+    )
+
     id: str
     position: int
     data_source_type: str
@@ -509,23 +596,24 @@ class Document:
     created_at: int
     tokens: int
     indexing_status: str
-    error: Optional[str] = None
+    error: Optional[str]
     enabled: bool
-    disabled_at: Optional[int] = None
-    disabled_by: Optional[str] = None
+    disabled_at: Optional[int]
+    disabled_by: Optional[str]
     archived: bool
     display_status: str
     word_count: int
     hit_count: int
     doc_form: str
-    data_source_detail_dict: Optional[Dict[str, Any]] = None
+    data_source_detail_dict: Optional[Dict[str, Any]]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, position: int, data_source_type: str, data_source_info: Dict[str, Any],
                  dataset_process_rule_id: str, name: str, created_from: str, created_by: str,
                  created_at: int, tokens: int, indexing_status: str, error: Optional[str],
                  enabled: bool, disabled_at: Optional[int], disabled_by: Optional[str],
                  archived: bool, display_status: str, word_count: int, hit_count: int, doc_form: str,
-                 data_source_detail_dict: Optional[Dict[str, Any]] = None):
+                 data_source_detail_dict: Optional[Dict[str, Any]] = None, **extra):
         self.id = id
         self.position = position
         self.data_source_type = data_source_type
@@ -547,6 +635,7 @@ class Document:
         self.hit_count = hit_count
         self.doc_form = doc_form
         self.data_source_detail_dict = data_source_detail_dict
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -570,10 +659,13 @@ class Document:
             "word_count": self.word_count,
             "hit_count": self.hit_count,
             "doc_form": self.doc_form,
-            "data_source_detail_dict": self.data_source_detail_dict
+            "data_source_detail_dict": self.data_source_detail_dict,
+            **self.extra
         }
 
 class DocumentResponse:
+    __slots__ = ("document", "batch")
+
     document: Document
     batch: str
 
@@ -588,13 +680,20 @@ class DocumentResponse:
         }
 
 class DatasetResponse:
+    __slots__ = (
+        "id", "name", "description", "provider", "permission", "data_source_type", "indexing_technique",
+        "app_count", "document_count", "word_count", "created_by", "created_at", "updated_by", "updated_at",
+        "embedding_model", "embedding_model_provider", "embedding_available", "retrieval_model_dict", "tags",
+        "extra"
+    )
+
     id: str
     name: str
-    description: Optional[str] = None
+    description: Optional[str]
     provider: str
     permission: str
-    data_source_type: Optional[str] = None
-    indexing_technique: Optional[str] = None
+    data_source_type: Optional[str]
+    indexing_technique: Optional[str]
     app_count: int
     document_count: int
     word_count: int
@@ -602,18 +701,19 @@ class DatasetResponse:
     created_at: int
     updated_by: str
     updated_at: int
-    embedding_model: Optional[str] = None
-    embedding_model_provider: Optional[str] = None
-    embedding_available: Optional[bool] = None
-    retrieval_model_dict: Optional[Dict[str, Any]] = None
-    tags: Optional[List[str]] = None
+    embedding_model: Optional[str]
+    embedding_model_provider: Optional[str]
+    embedding_available: Optional[bool]
+    retrieval_model_dict: Optional[Dict[str, Any]]
+    tags: Optional[List[str]]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, name: str, description: Optional[str], provider: str, permission: str,
                  data_source_type: Optional[str], indexing_technique: Optional[str], app_count: int,
                  document_count: int, word_count: int, created_by: str, created_at: int,
                  updated_by: str, updated_at: int, embedding_model: Optional[str],
                  embedding_model_provider: Optional[str], embedding_available: Optional[bool],
-                 retrieval_model_dict: Optional[Dict[str, Any]] = None, tags: Optional[List[str]] = None):
+                 retrieval_model_dict: Optional[Dict[str, Any]] = None, tags: Optional[List[str]] = None, **extra):
         self.id = id
         self.name = name
         self.description = description
@@ -633,6 +733,7 @@ class DatasetResponse:
         self.embedding_available = embedding_available
         self.retrieval_model_dict = retrieval_model_dict
         self.tags = tags
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -654,10 +755,13 @@ class DatasetResponse:
             "embedding_model_provider": self.embedding_model_provider,
             "embedding_available": self.embedding_available,
             "retrieval_model_dict": self.retrieval_model_dict,
-            "tags": self.tags
+            "tags": self.tags,
+            **self.extra
         }
 
 class ListKnowledgeResponse:
+    __slots__ = ("data", "has_more", "limit", "total", "page")
+
     data: List[Dataset]
     has_more: bool
     limit: int
@@ -681,6 +785,8 @@ class ListKnowledgeResponse:
         }
 
 class ListDocumentsResponse:
+    __slots__ = ("data", "has_more", "limit", "total", "page")
+
     data: List[Document]
     has_more: bool
     limit: int
@@ -704,6 +810,8 @@ class ListDocumentsResponse:
         }
 
 class BatchStatusResponse:
+    __slots__ = ("data",)
+
     data: List[BatchStatus]
 
     def __init__(self, data: List[BatchStatus]):
@@ -715,6 +823,8 @@ class BatchStatusResponse:
         }
 
 class DeleteResponse:
+    __slots__ = ("status",)
+
     status: str
 
     def __init__(self, status: str):
@@ -727,6 +837,8 @@ class DeleteResponse:
 
 
 class FileUploadResponse:
+    __slots__ = ("id", "name", "size", "extension", "mime_type", "created_by", "created_at")
+
     id: str
     name: str
     size: int
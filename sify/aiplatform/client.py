@@ -1,8 +1,12 @@
-import requests
 
-class AiPlatform: 
-    def __init__(self):
+from typing import Optional
+
+from sify.aiplatform.transport import HTTPTransport, get_default_transport
+
+class AiPlatform:
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         self.base_url = "http://localhost:5000/api/inner"
+        self.transport = transport or get_default_transport()
 
     def _send_request(self, method, endpoint, json=None, params=None):
         url = f"{self.base_url}{endpoint}"
@@ -11,9 +15,9 @@ class AiPlatform:
             "Content-Type": "application/json"
         }
 
-        response = requests.request(method, url, json=json, headers=headers, params=params)
-        
+        response = self.transport.request(method, url, json=json, headers=headers, params=params)
+
         return response
-    
+
     def get_current_time(self):
         return self._send_request("GET", "/current-time")
\ No newline at end of file
@@ -1,4 +1,36 @@
 from .model_as_a_service import ModelAsAService
+from .async_model_as_a_service import AsyncModelAsAService
+from .streaming import (
+    StreamAccumulator,
+    StreamStats,
+    ChatCompletionStream,
+    CompletionStream,
+    AsyncChatCompletionStream,
+    AsyncCompletionStream
+)
+from .batching import EmbeddingBatching, RerankBatching, EmbeddingBatcher, AsyncEmbeddingBatcher
+from .embedding_cache import EmbeddingCache
+from .rerank_cache import RerankCache
+from .embedding_store import EmbeddingStore
+from .pipeline import (
+    EmbeddingPipeline,
+    EmbeddingSink,
+    EmbeddingStoreSink,
+    NpyShardSink,
+    ParquetSink,
+    read_jsonl,
+    read_csv
+)
+from .vector_index import VectorIndex, FlatIndex, IVFIndex
+from .lazy import (
+    LazyView,
+    lazy_type,
+    LazyChatCompletionResponse,
+    LazyCompletionResponse,
+    LazyEmbeddingResponse,
+    LazyModelsListResponse,
+    LazyRerankResponse
+)
 from .types import (
     ModelInfo,
     ModelsListResponse,
@@ -16,5 +48,6 @@ from .types import (
     AudioTranscriptionResponse,
     RerankDocument,
     RerankResponse,
-    APIError
+    APIError,
+    APIRequestError
 )
\ No newline at end of file
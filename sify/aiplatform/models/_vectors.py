@@ -0,0 +1,44 @@
+"""Vector math shared by the vector indexes, the embedding store and the embedding pipeline."""
+from typing import Tuple
+
+from sify.aiplatform.models.types import np
+
+
+def require_numpy(feature: str) -> None:
+    """
+    Raise ImportError naming feature if numpy is not installed.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError(f"{feature} requires numpy. Install it with: pip install sify-ai-platform[data]")
+
+
+def normalize(matrix: "np.ndarray") -> "np.ndarray":
+    """Scale each row to unit length, leaving zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k(scores: "np.ndarray", ids: "np.ndarray", k: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Return the (unordered) k best (scores, ids) of each row of a (queries, rows) score
+    matrix; ids are either shared by all rows or given per row.
+    """
+    if scores.shape[1] > k:
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        ids = ids[best] if ids.ndim == 1 else np.take_along_axis(ids, best, axis=1)
+        return np.take_along_axis(scores, best, axis=1), ids
+    return scores, np.broadcast_to(ids, scores.shape)
+
+
+def merge_top_k(scores: "np.ndarray", ids: "np.ndarray", new_scores: "np.ndarray", new_ids: "np.ndarray",
+                k: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Fold candidates into running top-k rows, returned sorted by descending score."""
+    scores = np.concatenate([scores, new_scores], axis=1)
+    ids = np.concatenate([ids, new_ids], axis=1)
+    scores, ids = top_k(scores, ids, k)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(scores, order, axis=1), np.take_along_axis(ids, order, axis=1)
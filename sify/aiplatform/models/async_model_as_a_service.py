@@ -0,0 +1,356 @@
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union, BinaryIO
+
+from sify.aiplatform.models.batching import Batch, EmbeddingBatching, RerankBatching
+from sify.aiplatform.models.embedding_cache import EmbeddingCache
+from sify.aiplatform.models.model_as_a_service import _ModelAsAServiceBase
+from sify.aiplatform.models.rerank_cache import RerankCache
+from sify.aiplatform.models.streaming import AsyncChatCompletionStream, AsyncCompletionStream, aiter_text
+from sify.aiplatform.models.types import (
+    ModelsListResponse,
+    EmbeddingResponse,
+    ChatCompletionResponse,
+    CompletionResponse,
+    AudioTranscriptionResponse,
+    AudioTranslationResponse,
+    RerankResponse,
+    APIRequestError
+)
+from sify.aiplatform.transport.async_http import AsyncHTTPTransport, httpx
+from sify.aiplatform.transport.hedging import HedgingPolicy
+from sify.aiplatform.transport.rate_limit import RateLimiter
+from sify.aiplatform.transport.single_flight import AsyncSingleFlight
+from sify.aiplatform.transport.sse import AsyncEventStream, aiter_data, aiter_json
+from sify.aiplatform.transport.timeouts import DeadlineExceededError, TimeoutConfig, check_deadline
+
+
+class AsyncModelAsAService(_ModelAsAServiceBase):
+    """
+    Asyncio client for the Model as a Service API.
+
+    Exposes the same methods as ModelAsAService as coroutines returning the same
+    response types. Streaming calls resolve to async iterators of chunks:
+
+        async with AsyncModelAsAService(api_key, model_id) as client:
+            async for chunk in await client.chat_completion(messages, stream=True):
+                ...
+    """
+
+    def __init__(self, api_key: str, model_id: str = None, transport: Optional[AsyncHTTPTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None, hedging: Optional[HedgingPolicy] = None,
+                 single_flight: Optional[AsyncSingleFlight] = None, timeout: Optional[TimeoutConfig] = None,
+                 lazy: bool = False, embedding_encoding: Optional[str] = "base64",
+                 embedding_batching: Optional[EmbeddingBatching] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None,
+                 rerank_batching: Optional[RerankBatching] = None,
+                 rerank_cache: Optional[RerankCache] = None, retry_generation: bool = False):
+        """
+        Initialize the client.
+
+        Args:
+            api_key (str): The API key for authentication.
+            model_id (str): The model to use for requests made by this instance.
+            transport (Optional[AsyncHTTPTransport]): Pooled async transport to send requests over.
+                Defaults to a transport owned by, and closed with, this client.
+            rate_limiter (Optional[RateLimiter]): Client-side limiter awaited per (api_key, model_id)
+                before every attempt. Defaults to None (no client-side limiting).
+            hedging (Optional[HedgingPolicy]): Sends a duplicate of slow non-streaming chat_completion
+                and create_embeddings requests and cancels the loser. Defaults to None (no hedging).
+            single_flight (Optional[AsyncSingleFlight]): Shares one HTTP call between identical concurrent
+                list_models, create_embeddings and rerank calls. Defaults to None (no coalescing).
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                client's requests. Defaults to the transport's timeouts.
+            lazy (bool): Return chat_completion, completion, create_embeddings, list_models and rerank
+                responses as lazy views over the decoded JSON: fields and nested objects are built on
+                first access and the JSON itself is never modified. Defaults to False.
+            embedding_encoding (Optional[str]): encoding_format create_embeddings requests by default.
+                "base64" sends each vector as packed float32, about 4x smaller than JSON floats and
+                decoded straight into the matrix by as_numpy or matrix; embeddings read as lists of
+                floats either way, decoded on first access. If the server rejects base64 the client
+                switches to "float"; None omits the field. Defaults to "base64".
+            embedding_batching (Optional[EmbeddingBatching]): How create_embeddings splits large inputs
+                into concurrent sub-batch requests. Defaults to a policy of at most 256 texts or
+                32768 estimated tokens per request and 4 requests in flight per call.
+            embedding_cache (Optional[EmbeddingCache]): Persistent cache create_embeddings looks texts up
+                in before sending only the misses. Defaults to None (no caching).
+            rerank_batching (Optional[RerankBatching]): How rerank splits large document lists into
+                concurrent sub-requests. Defaults to a policy of at most 128 documents or 32768
+                estimated tokens per request and 4 requests in flight per call.
+            rerank_cache (Optional[RerankCache]): Result cache rerank looks documents up in before
+                sending only the misses. Defaults to None (no caching).
+            retry_generation (bool): Let the transport retry chat_completion, completion and
+                text_to_speech requests on timeouts, 429 and 5xx. These calls are billed and not
+                idempotent, so a retry after the server accepted the request generates (and bills)
+                twice. Embeddings and rerank are always retried. Defaults to False.
+
+        Raises:
+            ValueError: If api_key is empty, embedding_encoding is not supported, or rerank_cache is given
+                with a rerank_batching that calibrates scores with anchors.
+            ImportError: If httpx is not installed.
+        """
+        super().__init__(api_key, model_id, rate_limiter, hedging, single_flight, lazy, embedding_encoding,
+                         embedding_batching, embedding_cache, rerank_batching, rerank_cache, retry_generation)
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncHTTPTransport()
+        self.timeout = timeout or self.transport.timeout
+
+    async def aclose(self) -> None:
+        """Close the underlying transport if this client created it."""
+        if self._owns_transport:
+            await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncModelAsAService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        form_data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        return_binary: bool = False,
+        raw_events: bool = False
+    ) -> Union[Dict[str, Any], AsyncEventStream, bytes]:
+        request_kwargs = self._build_request(method, endpoint, json_data, params, files, form_data)
+        request_kwargs["timeout"] = self.timeout
+        expires_at = self.timeout.expires_at()
+
+        try:
+            response = await self.transport.request(stream=stream, **request_kwargs)
+        except httpx.TimeoutException:
+            raise APIRequestError("Request timeout - the API took too long to respond")
+        except httpx.RequestError as e:
+            error_msg = str(e).lower()
+            if "ssl" in error_msg:
+                raise ValueError("SSL/TLS error - certificate verification failed")
+            elif isinstance(e, httpx.NetworkError):
+                raise APIRequestError("Connection error - unable to reach the API")
+            else:
+                raise ValueError(f"Request failed: {str(e)}")
+
+        if stream:
+            if response.status_code >= 400:
+                try:
+                    await response.aread()
+                    self._raise_for_status(response)
+                finally:
+                    await response.aclose()
+            return AsyncEventStream(self._handle_stream_response(response, expires_at, raw_events), response)
+
+        self._raise_for_status(response)
+        return self._parse_response(response, return_binary)
+
+    async def _send_hedged_request(self, **request: Any) -> Dict[str, Any]:
+        if self.hedging is None:
+            return await self._send_request(**request)
+        return await self.hedging.run_async(lambda: self._send_request(**request))
+
+    async def _send_coalesced_request(self, hedge: bool = False, **request: Any) -> Dict[str, Any]:
+        send = self._send_hedged_request if hedge else self._send_request
+        if self.single_flight is None:
+            return await send(**request)
+        return await self.single_flight.do(self._flight_key(**request), lambda: send(**request))
+
+    async def _handle_stream_response(self, response, expires_at: Optional[float] = None,
+                                      raw_events: bool = False) -> AsyncGenerator[Union[Dict[str, Any], bytes], None]:
+        events = aiter_data if raw_events else aiter_json
+        try:
+            async for chunk_data in events(response.aiter_bytes(), response.headers.get("Content-Type")):
+                check_deadline(expires_at)
+                yield chunk_data
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error processing stream: {str(e)}")
+
+    # Audio Service Methods
+    async def speech_to_text(self, file: BinaryIO, **kwargs) -> AudioTranscriptionResponse:
+        """Async version of ModelAsAService.speech_to_text."""
+        form_data = self._prepare_audio_form(file, kwargs)
+        response = await self._send_request(
+            method="POST",
+            endpoint="/v1/audio/transcriptions",
+            files={"file": file},
+            form_data=form_data
+        )
+        return AudioTranscriptionResponse.from_dict(response["result"])
+
+    async def audio_translation(self, file: BinaryIO, **kwargs) -> AudioTranslationResponse:
+        """Async version of ModelAsAService.audio_translation."""
+        form_data = self._prepare_audio_form(file, kwargs)
+        response = await self._send_request(
+            method="POST",
+            endpoint="/v1/audio/translations",
+            files={"file": file},
+            form_data=form_data
+        )
+        return AudioTranslationResponse.from_dict(response["result"])
+
+    async def text_to_speech(self, input_text: str, voice: str, **kwargs) -> bytes:
+        """Async version of ModelAsAService.text_to_speech."""
+        data = self._prepare_text_to_speech(input_text, voice, kwargs)
+        return await self._send_request(
+            method="POST",
+            endpoint="/v1/audio/speech",
+            json_data=data,
+            return_binary=True
+        )
+
+    # Embedding Service Methods
+    async def create_embeddings(self, input_data: Union[str, List[str]], as_numpy: bool = False,
+                                **kwargs) -> EmbeddingResponse:
+        """Async version of ModelAsAService.create_embeddings."""
+        data = self._prepare_embeddings(input_data, kwargs)
+        cache = self.embedding_cache
+        if cache is None:
+            return self._build_embeddings(await self._fetch_embeddings(data), as_numpy)
+
+        # SQLite calls block, so they run on the default executor
+        loop = asyncio.get_running_loop()
+        texts = self._embedding_texts(data)
+        cached = await loop.run_in_executor(None, cache.get_many, data["model"], data.get("dimensions"), texts)
+        misses = [i for i, vector in enumerate(cached) if vector is None]
+        fetched = None
+        if misses:
+            fetched = await self._fetch_embeddings(dict(data, input=[texts[i] for i in misses]))
+            items = self._embeddings_to_cache(texts, misses, fetched)
+            await loop.run_in_executor(None, cache.put_many, data["model"], data.get("dimensions"), items)
+        return self._build_embeddings(self._merge_cached_embeddings(data, cached, misses, fetched), as_numpy)
+
+    async def _fetch_embeddings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return await self._fetch_embedding_batches(data)
+        except ValueError as e:
+            if not self._base64_rejected(data, e):
+                raise
+        return await self._fetch_embedding_batches(dict(data, encoding_format="float"))
+
+    async def _fetch_embedding_batches(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        batches = self._split_embeddings(data)
+
+        async def send(batch: Batch) -> Dict[str, Any]:
+            response = await self._send_coalesced_request(
+                hedge=True,
+                method="POST",
+                endpoint="/v1/embeddings",
+                json_data=self._embeddings_batch(data, batch)
+            )
+            return response["result"]
+
+        if len(batches) == 1:
+            return await send(batches[0])
+        results = await self.embedding_batching.run_async(send, batches)
+        return self.embedding_batching.merge(results, batches)
+
+    # LLM Service Methods
+    async def chat_completion(self, messages: List[Dict[str, Any]], stream: bool = False, stream_mode: str = "chunks",
+                              **kwargs) -> Union[ChatCompletionResponse, AsyncChatCompletionStream, AsyncEventStream]:
+        """
+        Async version of ModelAsAService.chat_completion.
+
+        With stream=True the coroutine resolves to an AsyncChatCompletionStream of ChatCompletionChunk
+        objects; await its get_final_response() for the assembled ChatCompletionResponse. With
+        stream_mode="text" or "raw" it resolves to an AsyncEventStream of str deltas or event bytes.
+        """
+        self._validate_stream_mode(stream_mode)
+        data = self._prepare_chat_completion(messages, stream, kwargs)
+        if stream:
+            started_at = time.monotonic()
+            chunks = await self._send_request(
+                method="POST",
+                endpoint="/v1/chat/completions",
+                json_data=data,
+                stream=True,
+                raw_events=stream_mode == "raw"
+            )
+            if stream_mode == "chunks":
+                return AsyncChatCompletionStream(chunks, self.model_id, started_at)
+            return AsyncEventStream(aiter_text(chunks), chunks) if stream_mode == "text" else chunks
+
+        response = await self._send_hedged_request(
+            method="POST",
+            endpoint="/v1/chat/completions",
+            json_data=data
+        )
+        return self._response_type(ChatCompletionResponse).from_dict(response["result"])
+
+    async def completion(self, prompt: str, stream: bool = False, stream_mode: str = "chunks",
+                         **kwargs) -> Union[CompletionResponse, AsyncCompletionStream, AsyncEventStream]:
+        """
+        Async version of ModelAsAService.completion.
+
+        With stream=True the coroutine resolves to an AsyncCompletionStream of CompletionChunk objects,
+        or with stream_mode="text" or "raw" to an AsyncEventStream of str deltas or event bytes.
+        """
+        self._validate_stream_mode(stream_mode)
+        data = self._prepare_completion(prompt, stream, kwargs)
+        if stream:
+            started_at = time.monotonic()
+            chunks = await self._send_request(
+                method="POST",
+                endpoint="/v1/completions",
+                json_data=data,
+                stream=True,
+                raw_events=stream_mode == "raw"
+            )
+            if stream_mode == "chunks":
+                return AsyncCompletionStream(chunks, self.model_id, started_at)
+            return AsyncEventStream(aiter_text(chunks), chunks) if stream_mode == "text" else chunks
+
+        response = await self._send_request(
+            method="POST",
+            endpoint="/v1/completions",
+            json_data=data
+        )
+        return self._response_type(CompletionResponse).from_dict(response["result"])
+
+    # Models Service Methods
+    async def list_models(self) -> ModelsListResponse:
+        """Async version of ModelAsAService.list_models."""
+        response = await self._send_coalesced_request(
+            method="GET",
+            endpoint="/v1/models"
+        )
+        return self._response_type(ModelsListResponse).from_dict(response["result"])
+
+    # Rerank Service Methods
+    async def rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]],
+                     **kwargs) -> RerankResponse:
+        """Async version of ModelAsAService.rerank."""
+        data = self._prepare_rerank(query, documents, kwargs)
+        cache = self.rerank_cache
+        if cache is None:
+            return self._response_type(RerankResponse).from_dict(await self._fetch_rerank(data))
+
+        # The cache is in memory, so it is consulted on the loop
+        texts = self._rerank_texts(data)
+        cached = cache.get_many(data["model"], query, texts, data)
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+        fetched = None
+        if misses:
+            fetched = await self._fetch_rerank(self._rerank_misses_request(data, misses))
+            cache.put_many(data["model"], query, self._rerank_to_cache(texts, misses, fetched), fetched["id"], data)
+        return self._response_type(RerankResponse).from_dict(self._merge_cached_rerank(data, cached, misses, fetched))
+
+    async def _fetch_rerank(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        batches = self.rerank_batching.split(data["documents"], data["query"])
+
+        async def send(batch: Batch) -> Dict[str, Any]:
+            response = await self._send_coalesced_request(
+                method="POST",
+                endpoint="/v1/rerank",
+                json_data=self.rerank_batching.request(data, batch, batches)
+            )
+            return response["result"]
+
+        if len(batches) == 1:
+            return await send(batches[0])
+        results = await self.rerank_batching.run_async(send, batches)
+        return self.rerank_batching.merge(results, batches, data.get("top_n"))
@@ -0,0 +1,653 @@
+import asyncio
+import contextvars
+import heapq
+import math
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, CancelledError, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from sify.aiplatform.models.types import APIRequestError
+from sify.aiplatform.transport import estimate_tokens
+
+# (start, end) slice of the input list sent in one request
+Batch = Tuple[int, int]
+
+
+class EmbeddingBatching:
+    """
+    Splits large create_embeddings inputs into sub-batches sent concurrently.
+
+    Inputs are cut greedily, in order, into batches of at most max_items texts and
+    max_tokens estimated tokens (about four characters per token); a single text over
+    the token limit is sent on its own. At most max_concurrency batches are in flight
+    per call; a synchronous call runs its batches on a thread pool of its own, so
+    calls never queue behind each other. A batch that fails with a transient error
+    (a timeout, connection failure, 429 or 5xx) after the transport's own retries and
+    backoff is sent again on its own, up to max_attempts in total, so one failure does
+    not resend the other batches; any other error fails the call at once. The results
+    are merged into one response in input order with usage summed.
+    """
+    # Names used in error messages and for the threads of a call's pool
+    _kind = "Embedding"
+    _thread_name = "sify-embed"
+
+    def __init__(
+        self,
+        max_items: Optional[int] = 256,
+        max_tokens: Optional[int] = 32768,
+        max_concurrency: int = 4,
+        max_attempts: int = 2
+    ):
+        """
+        Initialize the batching policy.
+
+        Args:
+            max_items (Optional[int]): Maximum texts per request, None for no limit. Defaults to 256.
+            max_tokens (Optional[int]): Maximum estimated tokens per request, None for no limit. Defaults to 32768.
+            max_concurrency (int): Maximum batch requests in flight. Defaults to 4.
+            max_attempts (int): Attempts per batch at transient errors, including the first one. Defaults to 2.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be greater than 0")
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be greater than 0")
+        if max_concurrency < 1 or max_attempts < 1:
+            raise ValueError("max_concurrency and max_attempts must be greater than 0")
+
+        self.max_items = max_items
+        self.max_tokens = max_tokens
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+
+    def split(self, inputs: Sequence[str]) -> List[Batch]:
+        """Return the (start, end) slices of inputs to send as separate requests."""
+        return self._split(inputs, self.max_items, self.max_tokens)
+
+    @staticmethod
+    def _split(inputs: Sequence[str], max_items: Optional[int], max_tokens: Optional[int]) -> List[Batch]:
+        batches: List[Batch] = []
+        start = 0
+        tokens = 0
+        for i, text in enumerate(inputs):
+            cost = estimate_tokens(text)
+            full = max_items is not None and i - start >= max_items
+            too_long = max_tokens is not None and tokens + cost > max_tokens
+            if i > start and (full or too_long):
+                batches.append((start, i))
+                start = i
+                tokens = 0
+            tokens += cost
+        batches.append((start, len(inputs)))
+        return batches
+
+    @staticmethod
+    def merge(results: Sequence[Dict[str, Any]], batches: Sequence[Batch]) -> Dict[str, Any]:
+        """
+        Merge the decoded responses of the batches into one embeddings response.
+
+        Indices are shifted to positions in the original input and data is ordered by
+        them; integer usage counters are summed. The batch results are not modified.
+        """
+        data = []
+        usage: Dict[str, Any] = {}
+        for result, (start, _) in zip(results, batches):
+            for item in result["data"]:
+                data.append(dict(item, index=item["index"] + start) if start else item)
+            for key, value in (result.get("usage") or {}).items():
+                if isinstance(value, int) and not isinstance(value, bool):
+                    usage[key] = usage.get(key, 0) + value
+        data.sort(key=lambda item: item["index"])
+        merged = dict(results[0])
+        merged["data"] = data
+        merged["usage"] = usage
+        return merged
+
+    def _give_up(self, batch: Batch, error: ValueError, attempt: int) -> Optional[ValueError]:
+        # Returns the error to raise, or None to send the batch again; the transport has already backed off
+        if not isinstance(error, APIRequestError) or not error.transient:
+            return error
+        if attempt < self.max_attempts:
+            return None
+        start, end = batch
+        return ValueError(f"{self._kind} batch of inputs {start}-{end - 1} failed after {attempt} attempt(s): {error}")
+
+    def _run_batch(self, send: Callable[[Batch], Dict[str, Any]], batch: Batch,
+                   failed: threading.Event) -> Dict[str, Any]:
+        attempt = 1
+        while True:
+            if failed.is_set():
+                # Another batch of the call failed: its result is not needed anymore
+                raise CancelledError()
+            try:
+                return send(batch)
+            except ValueError as e:
+                error = self._give_up(batch, e, attempt)
+                if error is e:
+                    raise
+                if error is not None:
+                    raise error from e
+            attempt += 1
+
+    def run(self, send: Callable[[Batch], Dict[str, Any]], batches: Sequence[Batch]) -> List[Dict[str, Any]]:
+        """
+        Call send for every batch with bounded concurrency and return the results in batch order.
+
+        Raises:
+            ValueError: If a batch fails with a permanent error, or with transient errors max_attempts
+                times; the other batches are not retried or started anymore.
+        """
+        failed = threading.Event()
+        executor = ThreadPoolExecutor(min(self.max_concurrency, len(batches)), thread_name_prefix=self._thread_name)
+        try:
+            futures = [executor.submit(contextvars.copy_context().run, self._run_batch, send, batch, failed)
+                       for batch in batches]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            if pending:
+                failed.set()
+                for future in pending:
+                    future.cancel()
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _run_batch_async(self, send: Callable[[Batch], Awaitable[Dict[str, Any]]], batch: Batch,
+                               semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        async with semaphore:
+            attempt = 1
+            while True:
+                try:
+                    return await send(batch)
+                except ValueError as e:
+                    error = self._give_up(batch, e, attempt)
+                    if error is e:
+                        raise
+                    if error is not None:
+                        raise error from e
+                attempt += 1
+
+    async def run_async(self, send: Callable[[Batch], Awaitable[Dict[str, Any]]],
+                        batches: Sequence[Batch]) -> List[Dict[str, Any]]:
+        """Async version of run: the remaining batches are cancelled when one fails."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.ensure_future(self._run_batch_async(send, batch, semaphore)) for batch in batches]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()
+
+
+def _rank_key(item: Dict[str, Any]) -> Tuple[float, int]:
+    return -item["relevance_score"], item["index"]
+
+
+def _affine_fit(pairs: Sequence[Tuple[float, float]]) -> Callable[[float], float]:
+    """Least-squares map x -> a * x + b through (x, y) pairs; a shift when the xs do not vary."""
+    if not pairs:
+        return lambda x: x
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    variance = sum((x - mean_x) ** 2 for x, _ in pairs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in pairs) / variance if variance > 1e-12 else 1.0
+    return lambda x: mean_y + slope * (x - mean_x)
+
+
+def _sum_counters(values: Sequence[Any]) -> Any:
+    """Sum integer leaves of the dicts in values; other leaves keep the first value."""
+    first = values[0]
+    if isinstance(first, dict):
+        merged = dict(first)
+        for value in values[1:]:
+            for key, item in (value or {}).items():
+                merged[key] = _sum_counters([merged[key], item]) if key in merged else item
+        return merged
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        return sum(values)
+    return first
+
+
+class RerankBatching(EmbeddingBatching):
+    """
+    Splits large rerank document lists into sub-requests sent concurrently.
+
+    Documents are cut in order into batches of at most max_documents documents and
+    max_tokens estimated tokens, counting the query once per request, and run with the
+    same concurrency bound and per-batch retries as EmbeddingBatching. Each request
+    asks for at most top_n results, since the global top_n is among the union of every
+    batch's top_n. Results are mapped back to indices in the original list and merged
+    with a heap into one response; integer counters in meta are summed.
+
+    Scores are merged as returned, which is right for cross-encoder rerankers, whose
+    score depends only on the (query, document) pair. For a model that normalizes
+    scores across the documents of one request, set anchors: that many documents from
+    the start of the list are also sent with every other batch, and the scores of
+    each batch are mapped onto the first batch's scale by the least-squares line
+    through their anchor scores. Anchored requests ask for every result, so that the
+    anchor scores are returned.
+    """
+    _kind = "Rerank"
+    _thread_name = "sify-rerank"
+
+    def __init__(
+        self,
+        max_documents: Optional[int] = 128,
+        max_tokens: Optional[int] = 32768,
+        max_concurrency: int = 4,
+        max_attempts: int = 2,
+        anchors: int = 0
+    ):
+        """
+        Initialize the batching policy.
+
+        Args:
+            max_documents (Optional[int]): Maximum documents per request, None for no limit. Defaults to 128.
+            max_tokens (Optional[int]): Maximum estimated tokens per request, None for no limit. Defaults to 32768.
+            max_concurrency (int): Maximum batch requests in flight. Defaults to 4.
+            max_attempts (int): Attempts per batch at transient errors, including the first one. Defaults to 2.
+            anchors (int): Documents shared by all batches to calibrate their scores, 0 to merge
+                scores as returned. Defaults to 0.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        super().__init__(max_documents, max_tokens, max_concurrency, max_attempts)
+        if anchors < 0:
+            raise ValueError("anchors must not be negative")
+        if anchors and max_documents is not None and anchors >= max_documents:
+            raise ValueError("anchors must be less than max_documents")
+        self.anchors = anchors
+
+    @property
+    def max_documents(self) -> Optional[int]:
+        return self.max_items
+
+    @staticmethod
+    def _text(document: Union[str, Dict[str, Any]]) -> str:
+        return document if isinstance(document, str) else document["text"]
+
+    def split(self, documents: Sequence[Union[str, Dict[str, Any]]], query: str = "") -> List[Batch]:
+        """Return the (start, end) slices of documents to send as separate requests."""
+        texts = [self._text(document) for document in documents]
+        max_items = self.max_items
+        max_tokens = self.max_tokens
+        # Requests after the first also carry the query and the anchors
+        if self.anchors:
+            max_items = None if max_items is None else max_items - self.anchors
+        if max_tokens is not None:
+            reserved = estimate_tokens(query) + sum(estimate_tokens(text) for text in texts[:self.anchors])
+            max_tokens = max(1, max_tokens - reserved)
+        return self._split(texts, max_items, max_tokens)
+
+    def _anchor_count(self, batches: Sequence[Batch]) -> int:
+        if len(batches) < 2:
+            return 0
+        start, end = batches[0]
+        return min(self.anchors, end - start)
+
+    def request(self, data: Dict[str, Any], batch: Batch, batches: Sequence[Batch]) -> Dict[str, Any]:
+        """Build the rerank payload of one batch from the payload of the whole call."""
+        if len(batches) == 1:
+            return data
+        start, end = batch
+        documents = data["documents"][start:end]
+        anchors = self._anchor_count(batches)
+        if anchors and start:
+            documents = documents + data["documents"][:anchors]
+        request = dict(data, documents=documents)
+        if anchors:
+            request.pop("top_n", None)
+        elif data.get("top_n") is not None:
+            request["top_n"] = min(data["top_n"], end - start)
+        return request
+
+    def merge(self, results: Sequence[Dict[str, Any]], batches: Sequence[Batch],
+              top_n: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Merge the decoded responses of the batches into one rerank response.
+
+        Indices are shifted to positions in the original list, anchored batches are
+        calibrated and their anchor copies dropped, and the best top_n results (all
+        when None) are taken with a heap merge of the per-batch rankings. The batch
+        results are not modified.
+        """
+        anchors = self._anchor_count(batches)
+        reference = {
+            item["index"]: item["relevance_score"] for item in results[0]["results"] if item["index"] < anchors
+        }
+        rankings = []
+        for result, (start, end) in zip(results, batches):
+            size = end - start
+            calibrate = None
+            if anchors and start:
+                calibrate = _affine_fit([
+                    (item["relevance_score"], reference[item["index"] - size])
+                    for item in result["results"] if item["index"] - size in reference
+                ])
+            ranking = []
+            for item in result["results"]:
+                if item["index"] >= size:
+                    continue
+                item = dict(item, index=item["index"] + start)
+                if calibrate is not None:
+                    item["relevance_score"] = calibrate(item["relevance_score"])
+                ranking.append(item)
+            ranking.sort(key=_rank_key)
+            rankings.append(ranking)
+
+        merged = dict(results[0])
+        merged["results"] = list(islice(heapq.merge(*rankings, key=_rank_key), top_n))
+        metas = [result["meta"] for result in results if result.get("meta")]
+        if metas:
+            merged["meta"] = _sum_counters(metas)
+        return merged
+
+
+class _BatcherMetrics:
+    """Batch size and queue wait counters shared by EmbeddingBatcher and AsyncEmbeddingBatcher."""
+
+    def __init__(self, max_items: int, max_wait: float, max_concurrency: int, window_size: int):
+        if max_items < 1 or max_concurrency < 1:
+            raise ValueError("max_items and max_concurrency must be greater than 0")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        self.max_items = max_items
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+
+        self._metrics_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._max_batch_size = 0
+        self._waits: Deque[float] = deque(maxlen=window_size)
+
+    def _record(self, enqueued_at: Sequence[float]) -> None:
+        now = time.monotonic()
+        with self._metrics_lock:
+            self._batches += 1
+            self._items += len(enqueued_at)
+            self._max_batch_size = max(self._max_batch_size, len(enqueued_at))
+            self._waits.extend(now - queued for queued in enqueued_at)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return batching metrics: batches sent, items embedded, mean and max batch size,
+        and the mean, p50, p95 and max seconds items waited before their batch was sent
+        (over the last window_size items).
+        """
+        with self._metrics_lock:
+            waits = sorted(self._waits)
+            stats = {
+                "batches": self._batches,
+                "items": self._items,
+                "mean_batch_size": self._items / self._batches if self._batches else 0.0,
+                "max_batch_size": self._max_batch_size
+            }
+        stats["queue_wait_mean"] = sum(waits) / len(waits) if waits else 0.0
+        for name, percentile in (("queue_wait_p50", 50), ("queue_wait_p95", 95)):
+            stats[name] = waits[max(0, math.ceil(percentile / 100 * len(waits)) - 1)] if waits else 0.0
+        stats["queue_wait_max"] = waits[-1] if waits else 0.0
+        return stats
+
+    @staticmethod
+    def _validate(text: str) -> None:
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("Input text must be a non-empty string")
+
+
+def _batch_vectors(response: Any, count: int) -> List[Optional[Sequence[float]]]:
+    """The vector of each text of a batch by position, None where the response has none."""
+    vectors: List[Optional[Sequence[float]]] = [None] * count
+    for item in response.data:
+        if isinstance(item.index, int) and 0 <= item.index < count and vectors[item.index] is None:
+            vectors[item.index] = item.embedding
+    return vectors
+
+
+def _missing_vector() -> ValueError:
+    return ValueError("The embeddings response has no vector for this text")
+
+
+class EmbeddingBatcher(_BatcherMetrics):
+    """
+    Coalesces concurrent single-text embedding calls from many threads into batched requests.
+
+    Each embed() call queues its text and blocks on a future. A dispatcher thread
+    collects queued texts until max_items are waiting or max_wait seconds have passed
+    since the oldest one arrived, sends them with one create_embeddings call on a pool
+    of max_concurrency threads, and resolves every caller's future with its own
+    vector. A failed request fails the futures of its batch only.
+
+        batcher = EmbeddingBatcher(ModelAsAService(api_key, model_id), max_items=64, max_wait=0.005)
+        vector = batcher.embed("single query")
+    """
+
+    def __init__(self, client: Any, max_items: int = 64, max_wait: float = 0.005, max_concurrency: int = 4,
+                 window_size: int = 1000, **kwargs):
+        """
+        Initialize the batcher.
+
+        Args:
+            client (ModelAsAService): Client whose create_embeddings sends the batches.
+            max_items (int): Maximum texts per batch. Defaults to 64.
+            max_wait (float): Maximum seconds the oldest queued text waits for more to arrive. Defaults to 0.005.
+            max_concurrency (int): Maximum batch requests in flight. Defaults to 4.
+            window_size (int): Number of recent queue waits kept for stats(). Defaults to 1000.
+            **kwargs: Passed to every create_embeddings call (e.g. dimensions).
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        super().__init__(max_items, max_wait, max_concurrency, window_size)
+        self.client = client
+        self.kwargs = kwargs
+
+        self._queue: "queue.Queue[Optional[Tuple[str, Future, float]]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix="sify-embed-batch")
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, text: str) -> "Future[Sequence[float]]":
+        """
+        Queue text for the next batch and return a future of its embedding vector.
+
+        Raises:
+            ValueError: If text is empty or the batcher is closed.
+        """
+        self._validate(text)
+        future: "Future[Sequence[float]]" = Future()
+        with self._lock:
+            if self._closed:
+                raise ValueError("EmbeddingBatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch, name="sify-embed-batcher", daemon=True)
+                self._thread.start()
+            self._queue.put((text, future, time.monotonic()))
+        return future
+
+    def embed(self, text: str, timeout: Optional[float] = None) -> Sequence[float]:
+        """
+        Return the embedding vector of text, sent in a batch with other concurrent calls.
+
+        Args:
+            text (str): The text to embed.
+            timeout (Optional[float]): Seconds to wait for the vector. Defaults to None (no limit).
+
+        Raises:
+            ValueError: If text is empty, the batcher is closed or the batch request fails.
+        """
+        return self.submit(text).result(timeout)
+
+    def _dispatch(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = first[2] + self.max_wait
+            while len(batch) < self.max_items:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List[Tuple[str, "Future", float]]) -> None:
+        # Callers that cancelled their future are dropped from the batch
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        self._record([enqueued_at for _, _, enqueued_at in batch])
+        try:
+            response = self.client.create_embeddings([text for text, _, _ in batch], **self.kwargs)
+            vectors = _batch_vectors(response, len(batch))
+        except BaseException as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for (_, future, _), vector in zip(batch, vectors):
+            if vector is None:
+                future.set_exception(_missing_vector())
+            else:
+                future.set_result(vector)
+
+    def close(self) -> None:
+        """Send the texts already queued, wait for their batches and stop the dispatcher."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "EmbeddingBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncEmbeddingBatcher(_BatcherMetrics):
+    """
+    Async version of EmbeddingBatcher for coroutines on one event loop.
+
+    Texts passed to embed() are held until max_items are pending or max_wait seconds
+    have passed since the oldest one, then sent with one create_embeddings call of an
+    AsyncModelAsAService, at most max_concurrency at a time.
+    """
+
+    def __init__(self, client: Any, max_items: int = 64, max_wait: float = 0.005, max_concurrency: int = 4,
+                 window_size: int = 1000, **kwargs):
+        """
+        Initialize the batcher.
+
+        Args:
+            client (AsyncModelAsAService): Client whose create_embeddings sends the batches.
+            max_items (int): Maximum texts per batch. Defaults to 64.
+            max_wait (float): Maximum seconds the oldest pending text waits for more to arrive. Defaults to 0.005.
+            max_concurrency (int): Maximum batch requests in flight. Defaults to 4.
+            window_size (int): Number of recent queue waits kept for stats(). Defaults to 1000.
+            **kwargs: Passed to every create_embeddings call (e.g. dimensions).
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        super().__init__(max_items, max_wait, max_concurrency, window_size)
+        self.client = client
+        self.kwargs = kwargs
+
+        self._pending: List[Tuple[str, "asyncio.Future", float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set["asyncio.Task"] = set()
+        self._closed = False
+
+    async def embed(self, text: str) -> Sequence[float]:
+        """
+        Return the embedding vector of text, sent in a batch with other concurrent calls.
+
+        Raises:
+            ValueError: If text is empty, the batcher is closed or the batch request fails.
+        """
+        self._validate(text)
+        if self._closed:
+            raise ValueError("AsyncEmbeddingBatcher is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future, time.monotonic()))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, "asyncio.Future", float]]) -> None:
+        async with self._semaphore:
+            # Callers that were cancelled while waiting are dropped from the batch
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                return
+            self._record([enqueued_at for _, _, enqueued_at in batch])
+            try:
+                response = await self.client.create_embeddings([text for text, _, _ in batch], **self.kwargs)
+                vectors = _batch_vectors(response, len(batch))
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for (_, future, _), vector in zip(batch, vectors):
+            if future.done():
+                continue
+            if vector is None:
+                future.set_exception(_missing_vector())
+            else:
+                future.set_result(vector)
+
+    async def aclose(self) -> None:
+        """Send the pending texts and wait for all batches in flight."""
+        self._closed = True
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncEmbeddingBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,217 @@
+import base64
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sify.aiplatform.models.types import np
+
+# Keys per SELECT; stays under SQLite's default limit of 999 bound parameters
+_LOOKUP_CHUNK = 500
+
+# Seconds a hit's last-used time may lag before it is rewritten. LRU order only needs
+# to be approximate, and skipping the write keeps repeated lookups read-only.
+_TOUCH_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    text_hash BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    UNIQUE (model, dimensions, text_hash)
+);
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+CREATE TABLE IF NOT EXISTS cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+INSERT OR IGNORE INTO cache_size VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS embeddings_insert AFTER INSERT ON embeddings BEGIN
+    UPDATE cache_size SET bytes = bytes + length(NEW.vector) WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS embeddings_delete AFTER DELETE ON embeddings BEGIN
+    UPDATE cache_size SET bytes = bytes - length(OLD.vector) WHERE id = 0;
+END;
+"""
+
+
+def vector_bytes(embedding: Any) -> bytes:
+    """Pack an embedding (base64 string, list or array of floats) as little-endian float32 bytes."""
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    if np is not None and isinstance(embedding, np.ndarray):
+        return embedding.astype("<f4", copy=False).tobytes()
+    values = embedding if isinstance(embedding, array) and embedding.typecode == "f" else array("f", embedding)
+    if sys.byteorder == "big":
+        values = array("f", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def vector_value(vector: bytes, encoding_format: Optional[str]) -> Any:
+    """Return packed float32 bytes the way the API would have sent them for encoding_format."""
+    if encoding_format == "base64":
+        return base64.b64encode(vector).decode("ascii")
+    values = array("f")
+    values.frombytes(vector)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache in a local SQLite database.
+
+    Entries are keyed by (model, dimensions, sha256(text)) and hold the vector as
+    float32 bytes. When the stored vectors exceed max_bytes the least recently used
+    entries are evicted, down to 90% of the limit; last-used times are kept to the
+    minute. The database runs in WAL mode with a busy timeout, so threads and
+    processes on the same node can share one file; every thread (and every forked
+    process) opens its own connection.
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = 1 << 30, timeout: float = 30.0):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            max_bytes (Optional[int]): Maximum bytes of stored vectors, None for no limit. Defaults to 1 GiB.
+            timeout (float): Seconds to wait for another connection's write lock. Defaults to 30.0.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[Tuple[int, sqlite3.Connection]] = []
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        # Autocommit mode: transactions are opened explicitly where needed
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append((os.getpid(), connection))
+        return connection
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, model: str, dimensions: Optional[int], texts: Sequence[str]) -> List[Optional[bytes]]:
+        """
+        Look up the vectors of texts in bulk.
+
+        Returns:
+            List[Optional[bytes]]: The float32 bytes of each text's vector, None for a miss.
+        """
+        connection = self._connection()
+        keys = [self.key(text) for text in texts]
+        found: Dict[bytes, bytes] = {}
+        stale: List[int] = []
+        now = time.time()
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _LOOKUP_CHUNK):
+            chunk = unique[start:start + _LOOKUP_CHUNK]
+            rows = connection.execute(
+                "SELECT id, text_hash, vector, last_used FROM embeddings WHERE model = ? AND dimensions = ? "
+                f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                (model, dimensions or 0, *chunk)
+            )
+            for row_id, text_hash, vector, last_used in rows:
+                found[text_hash] = vector
+                if now - last_used > _TOUCH_INTERVAL:
+                    stale.append(row_id)
+
+        for start in range(0, len(stale), _LOOKUP_CHUNK):
+            chunk = stale[start:start + _LOOKUP_CHUNK]
+            connection.execute(
+                f"UPDATE embeddings SET last_used = ? WHERE id IN ({','.join('?' * len(chunk))})", (now, *chunk)
+            )
+
+        vectors = [found.get(key) for key in keys]
+        hits = sum(vector is not None for vector in vectors)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, model: str, dimensions: Optional[int], items: Sequence[Tuple[str, bytes]]) -> None:
+        """Store (text, float32 bytes) pairs, then evict least recently used entries if over max_bytes."""
+        if not items:
+            return
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, dimensions, text_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(model, dimensions or 0, self.key(text), vector, now) for text, vector in items]
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self.max_bytes is None:
+            return
+        size = connection.execute("SELECT bytes FROM cache_size WHERE id = 0").fetchone()[0]
+        if size <= self.max_bytes:
+            return
+        excess = size - int(self.max_bytes * 0.9)
+        victims = []
+        rows = connection.execute("SELECT id, length(vector) FROM embeddings ORDER BY last_used")
+        for row_id, length in rows:
+            victims.append((row_id,))
+            excess -= length
+            if excess <= 0:
+                break
+        rows.close()
+        connection.executemany("DELETE FROM embeddings WHERE id = ?", victims)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of entries, bytes of stored vectors, and this process's hits and misses."""
+        connection = self._connection()
+        entries = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        size = connection.execute("SELECT bytes FROM cache_size WHERE id = 0").fetchone()[0]
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._connection().execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        """Close the connections opened by this process."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for pid, connection in connections:
+            # Connections inherited through fork belong to the parent process
+            if pid == os.getpid():
+                connection.close()
+        self._local = threading.local()
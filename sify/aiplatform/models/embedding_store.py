@@ -0,0 +1,445 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sify.aiplatform.models._vectors import merge_top_k, normalize, require_numpy, top_k
+from sify.aiplatform.models.types import EmbeddingResponse, np
+
+STORE_DTYPES = ("float32", "float16", "int8")
+
+_FORMAT = "sify-embedding-store"
+_VERSION = 1
+
+# Rows scored per block; bounds the float32 copy of a quantized block at about 64 MB for 1024 dimensions
+_SEARCH_BLOCK = 16384
+
+# Cells of the temporary (queries x rows) score matrix per block
+_BLOCK_CELLS = 1 << 24
+
+# One <name>.bin file per array
+_FILES = ("vectors", "scales", "norms", "id_offsets", "ids", "index_hashes", "index_rows")
+
+
+def id_hash(embedding_id: str) -> int:
+    """64-bit hash of an embedding id, the key of the store's id index."""
+    return int.from_bytes(hashlib.blake2b(embedding_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def quantize(matrix: "np.ndarray", dtype: str) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """
+    Convert float32 rows to a store dtype.
+
+    int8 is symmetric per-row quantization: each row is scaled so its largest absolute
+    value maps to 127, and the scale is returned alongside so that row ~= q * scale.
+
+    Returns:
+        Tuple[np.ndarray, Optional[np.ndarray]]: The converted rows, and the per-row scales for int8.
+    """
+    if dtype == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(matrix / scales[:, None]).clip(-127, 127).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    return matrix.astype(dtype), None
+
+
+def dequantize(rows: "np.ndarray", scales: Optional["np.ndarray"]) -> "np.ndarray":
+    """Convert stored rows back to float32."""
+    matrix = rows.astype(np.float32)
+    if scales is not None:
+        matrix *= scales[:, None]
+    return matrix
+
+
+def _insert_sorted(hashes: "np.ndarray", rows: "np.ndarray", new_hashes: "np.ndarray",
+                   new_rows: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Merge (hash, row) pairs into an id index sorted by hash."""
+    order = np.argsort(new_hashes, kind="stable")
+    positions = np.searchsorted(hashes, new_hashes[order], side="right")
+    return np.insert(hashes, positions, new_hashes[order]), np.insert(rows, positions, new_rows[order])
+
+
+class EmbeddingStore:
+    """
+    On-disk embedding store read through memory maps.
+
+    A store is a directory holding a JSON header (model_id, dim, dtype, the committed
+    row count and free-form metadata) and one little-endian file per array: the vectors as
+    float32, float16 or int8 rows, the int8 scales, the row norms, the ids, and an id
+    index of 64-bit hashes sorted for binary search. Readers map the files read-only,
+    so any number of worker processes opening the same store share one copy of the
+    pages in the OS page cache, and nothing is loaded until a search or lookup touches it.
+
+    One writer appends rows. Appended rows become visible when flush() rewrites the
+    header, which is replaced atomically, so a reader sees the rows committed when it
+    opened the store and a writer reopening a store after a crash resumes from the
+    last flush. Similarity runs block by block on the stored rows: float16 and int8
+    blocks are only widened to float32 for the matrix product, and int8 scales are
+    applied to the scores rather than to the vectors.
+
+        store = EmbeddingStore.create("chunks.store", "embed-model", dim=1024, dtype="int8")
+        store.append(chunk_ids, client.create_embeddings(texts))
+        store.close()
+
+        store = EmbeddingStore.open("chunks.store")
+        scores, ids = store.search(client.create_embeddings(query), k=5)
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any], writable: bool):
+        """Use EmbeddingStore.create or EmbeddingStore.open."""
+        require_numpy("EmbeddingStore")
+        self.path = path
+        self.model_id: str = header["model_id"]
+        self.dim: int = header["dim"]
+        self.dtype: str = header["dtype"]
+        self.writable = writable
+        self.metadata: Dict[str, Any] = header.get("metadata", {})
+        self._count: int = header["count"]
+        self._files: Dict[str, Any] = {}
+        self._pending: Dict[str, int] = {}
+        self._pending_hashes: List[int] = []
+        self._index_hashes = np.empty(0, dtype=np.uint64)
+        self._index_rows = np.empty(0, dtype=np.int64)
+        self._map()
+        if writable:
+            self._open_for_append()
+
+    @classmethod
+    def create(cls, path: str, model_id: str, dim: int, dtype: str = "float32",
+               overwrite: bool = False) -> "EmbeddingStore":
+        """
+        Create an empty store and open it for writing.
+
+        Args:
+            path (str): Directory of the store.
+            model_id (str): Model that produced the embeddings.
+            dim (int): Vector dimensions.
+            dtype (str): Row storage, "float32", "float16" (half the size) or "int8" (a quarter,
+                plus 4 bytes of scale per row). Defaults to "float32".
+            overwrite (bool): Replace an existing store at path. Defaults to False.
+
+        Returns:
+            EmbeddingStore: The writable store.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the dtype or dim is invalid, or a store exists and overwrite is not set.
+        """
+        require_numpy("EmbeddingStore")
+        if dtype not in STORE_DTYPES:
+            raise ValueError(f"dtype must be one of {STORE_DTYPES}")
+        if dim < 1:
+            raise ValueError("dim must be greater than 0")
+        if os.path.exists(os.path.join(path, "header.json")) and not overwrite:
+            raise ValueError(f"An embedding store already exists at {path}")
+
+        os.makedirs(path, exist_ok=True)
+        for name in _FILES:
+            with open(os.path.join(path, f"{name}.bin"), "wb") as f:
+                if name == "id_offsets":
+                    np.zeros(1, dtype="<i8").tofile(f)
+        header = {"format": _FORMAT, "version": _VERSION, "model_id": model_id, "dim": dim, "dtype": dtype,
+                  "count": 0, "metadata": {}}
+        cls._write_header(path, header)
+        return cls(path, header, writable=True)
+
+    @classmethod
+    def open(cls, path: str, writable: bool = False) -> "EmbeddingStore":
+        """
+        Open an existing store.
+
+        Args:
+            path (str): Directory of the store.
+            writable (bool): Open for appending; rows written after the last flush are discarded.
+                Defaults to False.
+
+        Returns:
+            EmbeddingStore: The store.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If path does not hold an embedding store.
+        """
+        require_numpy("EmbeddingStore")
+        try:
+            with open(os.path.join(path, "header.json"), "r", encoding="utf-8") as f:
+                header = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"No embedding store at {path}") from None
+        if header.get("format") != _FORMAT or header.get("version") != _VERSION:
+            raise ValueError(f"{path} is not a version {_VERSION} embedding store")
+        return cls(path, header, writable)
+
+    @staticmethod
+    def _write_header(path: str, header: Dict[str, Any]) -> None:
+        temporary = os.path.join(path, f"header.json.tmp{os.getpid()}")
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(header, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, os.path.join(path, "header.json"))
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _map_file(self, name: str, dtype: Any, length: Optional[int] = None,
+                  columns: Optional[int] = None) -> "np.ndarray":
+        dtype = np.dtype(dtype)
+        if length is None:
+            length = os.path.getsize(self._file(name)) // dtype.itemsize // (columns or 1)
+        shape = (length, columns) if columns else (length,)
+        if length == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self._file(name), dtype=dtype, mode="r", shape=shape)
+
+    def _map(self) -> None:
+        """Map the committed part of every file."""
+        self._vectors = self._map_file("vectors", np.dtype(self.dtype).newbyteorder("<"), self._count, self.dim)
+        self._scales = self._map_file("scales", "<f4", self._count) if self.dtype == "int8" else None
+        self._norms = self._map_file("norms", "<f4", self._count)
+        self._id_offsets = self._map_file("id_offsets", "<i8", self._count + 1)
+        self._ids = self._map_file("ids", "u1", int(self._id_offsets[-1]))
+        hashes = self._map_file("index_hashes", "<u8")
+        rows = self._map_file("index_rows", "<i8")
+        if len(hashes) != len(rows):
+            # A flush is replacing the index files; start from the index mapped last time
+            hashes, rows = self._index_hashes, self._index_rows
+        if len(rows) > self._count:
+            # The index is ahead of the header (a flush in progress, or a writer that stopped
+            # before rewriting the header); drop the rows the header does not commit
+            committed = rows < self._count
+            hashes, rows = hashes[committed], rows[committed]
+        if len(rows) < self._count:
+            # Hash only the committed rows the index does not cover yet
+            new_rows = np.arange(len(rows), self._count, dtype=np.int64)
+            new_hashes = np.array([id_hash(embedding_id) for embedding_id in self.ids_at(new_rows.tolist())],
+                                  dtype=np.uint64)
+            hashes, rows = _insert_sorted(hashes, rows, new_hashes, new_rows)
+        self._index_hashes, self._index_rows = hashes, rows
+
+    def _open_for_append(self) -> None:
+        vectors_row = self.dim * np.dtype(self.dtype).itemsize
+        sizes = {
+            "vectors": self._count * vectors_row,
+            "scales": self._count * 4 if self.dtype == "int8" else 0,
+            "norms": self._count * 4,
+            "id_offsets": (self._count + 1) * 8,
+            "ids": int(self._id_offsets[-1])
+        }
+        for name, size in sizes.items():
+            f = open(self._file(name), "r+b")
+            # Drop whatever a crashed writer appended after the last flush
+            f.truncate(size)
+            f.seek(size)
+            self._files[name] = f
+        self._next_offset = sizes["ids"]
+
+    def __len__(self) -> int:
+        return self._count + len(self._pending)
+
+    def __contains__(self, embedding_id: str) -> bool:
+        return embedding_id in self._pending or self._committed_row(embedding_id) is not None
+
+    def _committed_row(self, embedding_id: str) -> Optional[int]:
+        key = np.uint64(id_hash(embedding_id))
+        start = int(np.searchsorted(self._index_hashes, key, side="left"))
+        end = int(np.searchsorted(self._index_hashes, key, side="right"))
+        for row in self._index_rows[start:end].tolist():
+            if self.ids_at([row])[0] == embedding_id:
+                return row
+        return None
+
+    def rows(self, ids: Sequence[str]) -> "np.ndarray":
+        """
+        Return the row of each committed id.
+
+        Raises:
+            ValueError: If an id is not in the store.
+        """
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, embedding_id in enumerate(ids):
+            row = self._committed_row(embedding_id)
+            if row is None:
+                raise ValueError(f"Unknown embedding id: {embedding_id!r}")
+            rows[i] = row
+        return rows
+
+    def ids_at(self, rows: Any) -> List[str]:
+        """Return the ids of committed rows."""
+        offsets = self._id_offsets
+        blob = self._ids
+        return [bytes(blob[offsets[row]:offsets[row + 1]]).decode("utf-8") for row in rows]
+
+    def get(self, ids: Sequence[str]) -> "np.ndarray":
+        """
+        Return the vectors of committed ids as a float32 (n, dim) array.
+
+        Raises:
+            ValueError: If an id is not in the store.
+        """
+        rows = self.rows(ids)
+        return dequantize(self._vectors[rows], None if self._scales is None else self._scales[rows])
+
+    @property
+    def vectors(self) -> "np.ndarray":
+        """The committed rows as stored, a read-only (n, dim) array of the store's dtype."""
+        return self._vectors
+
+    @property
+    def scales(self) -> Optional["np.ndarray"]:
+        """The per-row scales of an int8 store, None otherwise."""
+        return self._scales
+
+    def append(self, ids: Sequence[str], vectors: Any) -> None:
+        """
+        Append vectors, visible to readers after the next flush.
+
+        Args:
+            ids (Sequence[str]): One new, unique id per vector.
+            vectors (Any): (n, dim) array, list of vectors or EmbeddingResponse.
+
+        Raises:
+            ValueError: If the store is read-only, an id is already present, or the vectors have the wrong shape.
+        """
+        if not self.writable:
+            raise ValueError("The embedding store is open read-only")
+        if isinstance(vectors, EmbeddingResponse):
+            vectors = vectors.matrix
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if not len(ids) and not matrix.size:
+            return
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of {self.dim} dimensions, got shape {matrix.shape}")
+        if len(ids) != len(matrix):
+            raise ValueError(f"Got {len(ids)} ids for {len(matrix)} vectors")
+        ids = [str(embedding_id) for embedding_id in ids]
+        if len(set(ids)) != len(ids):
+            raise ValueError("ids must be unique")
+        hashes = np.array([id_hash(embedding_id) for embedding_id in ids], dtype=np.uint64)
+        # Only ids whose hash is already indexed need the exact (per-id) check
+        positions = np.searchsorted(self._index_hashes, hashes).clip(max=max(len(self._index_hashes) - 1, 0))
+        indexed = self._index_hashes[positions] == hashes if len(self._index_hashes) else np.zeros(len(ids), bool)
+        for i, embedding_id in enumerate(ids):
+            if embedding_id in self._pending or (indexed[i] and self._committed_row(embedding_id) is not None):
+                raise ValueError(f"Embedding id already in the store: {embedding_id!r}")
+
+        rows, scales = quantize(matrix, self.dtype)
+        norms = np.linalg.norm(dequantize(rows, scales), axis=1)
+        encoded = [embedding_id.encode("utf-8") for embedding_id in ids]
+        offsets = self._next_offset + np.cumsum([len(value) for value in encoded])
+
+        rows.astype(rows.dtype.newbyteorder("<")).tofile(self._files["vectors"])
+        if scales is not None:
+            scales.astype("<f4").tofile(self._files["scales"])
+        norms.astype("<f4").tofile(self._files["norms"])
+        offsets.astype("<i8").tofile(self._files["id_offsets"])
+        self._files["ids"].write(b"".join(encoded))
+        self._next_offset = int(offsets[-1]) if len(offsets) else self._next_offset
+
+        first = self._count + len(self._pending)
+        self._pending.update(zip(ids, range(first, first + len(ids))))
+        self._pending_hashes.extend(hashes.tolist())
+
+    def flush(self, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Commit the appended rows: sync the data files, merge the new ids into the index,
+        and rewrite the header. The index is rewritten whole, so flush after batches
+        of rows rather than after every one.
+
+        Args:
+            metadata (Optional[Dict[str, Any]]): JSON-serializable metadata to store in the header,
+                committed together with the rows, e.g. the position of a job writing the store.
+                Defaults to None (keep the current metadata).
+        """
+        if not self.writable or (not self._pending and metadata is None):
+            return
+        if metadata is not None:
+            self.metadata = metadata
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+
+        if self._pending:
+            hashes, rows = _insert_sorted(self._index_hashes, self._index_rows,
+                                          np.array(self._pending_hashes, dtype=np.uint64),
+                                          np.fromiter(self._pending.values(), dtype=np.int64))
+            for name, values in (("index_hashes", hashes), ("index_rows", rows)):
+                temporary = f"{self._file(name)}.tmp{os.getpid()}"
+                values.astype(values.dtype.newbyteorder("<")).tofile(temporary)
+                os.replace(temporary, self._file(name))
+
+        self._count += len(self._pending)
+        self._pending.clear()
+        self._pending_hashes.clear()
+        self._write_header(self.path, {
+            "format": _FORMAT, "version": _VERSION, "model_id": self.model_id, "dim": self.dim,
+            "dtype": self.dtype, "count": self._count, "metadata": self.metadata
+        })
+        self._map()
+
+    def search(self, queries: Any, k: int = 10, metric: str = "cosine") -> Tuple["np.ndarray", Any]:
+        """
+        Find the k most similar committed vectors for each query by exact search.
+
+        Args:
+            queries (Any): A vector, an (n, dim) array or list of vectors, or an EmbeddingResponse.
+            k (int): Results per query. Defaults to 10.
+            metric (str): "cosine" or "dot". Defaults to "cosine".
+
+        Returns:
+            Tuple[np.ndarray, Any]: (scores, ids): an (n, min(k, len)) array sorted by descending
+                score and a list of id lists, or a (min(k, len),) array and one id list for a single vector query.
+
+        Raises:
+            ValueError: If k is not positive, the metric is unknown, or the queries have the wrong shape.
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0")
+        if metric not in ("cosine", "dot"):
+            raise ValueError("metric must be 'cosine' or 'dot'")
+        single = not isinstance(queries, EmbeddingResponse) and np.ndim(queries) == 1
+        if isinstance(queries, EmbeddingResponse):
+            queries = queries.matrix
+        matrix = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        if metric == "cosine":
+            matrix = normalize(matrix)
+
+        k = min(k, self._count)
+        scores = np.full((len(matrix), k), -np.inf, dtype=np.float32)
+        rows = np.full((len(matrix), k), -1, dtype=np.int64)
+        block = max(k, min(_SEARCH_BLOCK, _BLOCK_CELLS // max(len(matrix), 1)))
+        for start in range(0, self._count if k else 0, block):
+            end = min(start + block, self._count)
+            block_scores = matrix @ self._vectors[start:end].astype(np.float32, copy=False).T
+            if self._scales is not None:
+                block_scores *= self._scales[start:end]
+            if metric == "cosine":
+                norms = self._norms[start:end]
+                block_scores /= np.where(norms == 0, 1.0, norms)
+            candidates = top_k(block_scores, np.arange(start, end, dtype=np.int64), k)
+            scores, rows = merge_top_k(scores, rows, *candidates, k)
+
+        ids = [self.ids_at(row) for row in rows.tolist()]
+        return (scores[0], ids[0]) if single else (scores, ids)
+
+    def close(self, flush: bool = True) -> None:
+        """
+        Close the store's files.
+
+        Args:
+            flush (bool): Commit the appended rows first; without it they are discarded
+                when the store is next opened for writing. Defaults to True.
+        """
+        if flush:
+            self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self.writable = False
+
+    def __enter__(self) -> "EmbeddingStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
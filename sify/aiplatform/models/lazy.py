@@ -0,0 +1,215 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from sify.aiplatform.models.types import (
+    NO_EXTRA,
+    ModelInfo,
+    ModelsListResponse,
+    EmbeddingData,
+    EmbeddingUsage,
+    EmbeddingResponse,
+    ChatMessage,
+    ChatChoice,
+    ChatUsage,
+    ChatCompletionResponse,
+    CompletionChoice,
+    CompletionUsage,
+    CompletionResponse,
+    RerankDocument,
+    RerankResponse,
+    known_fields
+)
+
+# Eager response type -> its lazy view, filled in as the views are defined
+LAZY_TYPES: Dict[type, type] = {}
+
+
+def lazy_type(cls: type) -> type:
+    """Return the lazy view of a response type, or the type itself if it has none."""
+    return LAZY_TYPES.get(cls, cls)
+
+
+def _to_raw(value: Any) -> Any:
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, list) and value and hasattr(value[0], "to_dict"):
+        return [item.to_dict() for item in value]
+    return value
+
+
+def _field(name: str, slot: Any, build: Optional[Callable[[Any], Any]]) -> property:
+    if build is None:
+        # Plain values are read from the dict on every access; a dict lookup is as cheap as a cache
+        def fget(self):
+            return self._data.get(name)
+
+        def fset(self, value):
+            # Copy on write: the dict belongs to the caller
+            self._data = {**self._data, name: value}
+
+        return property(fget, fset)
+
+    # Nested objects are cached in the slot of the eager type, which stays empty until first access
+    def fget_built(self):
+        try:
+            return slot.__get__(self, type(self))
+        except AttributeError:
+            value = build(self._data.get(name))
+            slot.__set__(self, value)
+            return value
+
+    def fset_built(self, value):
+        # The slot shadows the dict; to_dict() reads built fields from the slot
+        slot.__set__(self, value)
+
+    return property(fget_built, fset_built)
+
+
+def _extra_field(slot: Any, known: frozenset) -> property:
+    def fget(self):
+        try:
+            return slot.__get__(self, type(self))
+        except AttributeError:
+            value = {key: item for key, item in self._data.items() if key not in known} or NO_EXTRA
+            slot.__set__(self, value)
+            return value
+
+    return property(fget)
+
+
+def one(view: type) -> Callable[[Any], Any]:
+    """Builder for a nested object field."""
+    return lambda raw: None if raw is None else view(raw)
+
+
+def list_of(view: type) -> Callable[[Any], List[Any]]:
+    """Builder for a list-of-objects field."""
+    return lambda raw: [view(item) for item in raw or ()]
+
+
+class LazyView:
+    """
+    Base for read-through views over a decoded response dict.
+
+    A view subclasses the eager response type it stands in for, so isinstance checks
+    keep working, but its constructor only stores the dict. Plain fields are read
+    from the dict when accessed; nested objects are built as views of their own
+    sub-dicts on first access and cached. The dict is never modified: assigning a
+    field updates the view only, and to_dict() returns a copy with the built fields
+    converted back as the eager type converts them (embeddings as lists of floats);
+    nested fields absent from the dict are left out unless one was assigned.
+
+    Subclasses list the eager type as their second base, declare ``__slots__ = ("_data",)``
+    and map the fields holding nested objects to builders in ``_builders``. Fields
+    missing from the dict read as None instead of failing at construction.
+    """
+    __slots__ = ()
+
+    _builders: Dict[str, Callable[[Any], Any]] = {}
+    _builder_slots: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        eager = next(base for base in cls.__bases__ if not issubclass(base, LazyView))
+        known = known_fields(eager)
+        cls._builder_slots = {name: vars(eager)[name] for name in cls._builders}
+        for name in eager.__slots__:
+            slot = vars(eager)[name]
+            if name.startswith("_"):
+                # Private caches of the eager type work unchanged on the view
+                continue
+            if name == "extra":
+                setattr(cls, name, _extra_field(slot, known))
+            else:
+                setattr(cls, name, _field(name, slot, cls._builders.get(name)))
+        LAZY_TYPES[eager] = cls
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = dict(self._data)
+        for name, slot in self._builder_slots.items():
+            if name in self._data:
+                result[name] = _to_raw(getattr(self, name))
+                continue
+            # Fields missing from the payload stay missing unless a value was assigned
+            try:
+                value = slot.__get__(self, type(self))
+            except AttributeError:
+                continue
+            if value:
+                result[name] = _to_raw(value)
+        return result
+
+    @classmethod
+    def from_dict(cls: Type["LazyView"], data: Dict[str, Any]) -> "LazyView":
+        return cls(data)
+
+
+class LazyModelInfo(LazyView, ModelInfo):
+    __slots__ = ("_data",)
+
+
+class LazyModelsListResponse(LazyView, ModelsListResponse):
+    __slots__ = ("_data",)
+    _builders = {"models": list_of(LazyModelInfo)}
+
+
+class LazyEmbeddingData(LazyView, EmbeddingData):
+    __slots__ = ("_data",)
+    # EmbeddingData.embedding decodes this on first access and writes the list back
+    _embedding = _field("embedding", None, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self._data, "embedding": _to_raw(self.embedding)}
+
+
+class LazyEmbeddingUsage(LazyView, EmbeddingUsage):
+    __slots__ = ("_data",)
+
+
+class LazyEmbeddingResponse(LazyView, EmbeddingResponse):
+    __slots__ = ("_data",)
+    _builders = {"data": list_of(LazyEmbeddingData), "usage": one(LazyEmbeddingUsage)}
+
+
+class LazyChatMessage(LazyView, ChatMessage):
+    __slots__ = ("_data",)
+
+
+class LazyChatChoice(LazyView, ChatChoice):
+    __slots__ = ("_data",)
+    _builders = {"message": one(LazyChatMessage)}
+
+
+class LazyChatUsage(LazyView, ChatUsage):
+    __slots__ = ("_data",)
+
+
+class LazyChatCompletionResponse(LazyView, ChatCompletionResponse):
+    __slots__ = ("_data",)
+    _builders = {"choices": list_of(LazyChatChoice), "usage": one(LazyChatUsage)}
+
+
+class LazyCompletionChoice(LazyView, CompletionChoice):
+    __slots__ = ("_data",)
+
+
+class LazyCompletionUsage(LazyView, CompletionUsage):
+    __slots__ = ("_data",)
+
+
+class LazyCompletionResponse(LazyView, CompletionResponse):
+    __slots__ = ("_data",)
+    _builders = {"choices": list_of(LazyCompletionChoice), "usage": one(LazyCompletionUsage)}
+
+
+class LazyRerankDocument(LazyView, RerankDocument):
+    __slots__ = ("_data",)
+
+
+class LazyRerankResponse(LazyView, RerankResponse):
+    __slots__ = ("_data",)
+    _builders = {"results": list_of(LazyRerankDocument)}
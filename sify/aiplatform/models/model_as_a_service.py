@@ -1,6 +1,7 @@
 import json
+import time
 import requests
-from typing import Any, Dict, Generator, List, Optional, Union, BinaryIO
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union, BinaryIO
 
 from sify.aiplatform.models.types import (
     ModelsListResponse, 
@@ -12,35 +13,109 @@ from sify.aiplatform.models.types import (
     AudioTranscriptionResponse,
     AudioTranslationResponse,
     RerankResponse,
-    APIError
+    APIError,
+    APIRequestError
 )
+from sify.aiplatform.models.batching import (
+    Batch,
+    EmbeddingBatching,
+    RerankBatching,
+    _rank_key
+)
+from sify.aiplatform.models.embedding_cache import EmbeddingCache, vector_bytes, vector_value
+from sify.aiplatform.models.lazy import lazy_type
+from sify.aiplatform.models.rerank_cache import CachedResult, RerankCache
+from sify.aiplatform.models.streaming import ChatCompletionStream, CompletionStream, iter_text
+from sify.aiplatform.transport import (
+    HTTPTransport,
+    HedgingPolicy,
+    RateLimiter,
+    DeadlineExceededError,
+    SingleFlight,
+    TimeoutConfig,
+    check_deadline,
+    codec,
+    estimate_tokens,
+    get_default_transport,
+    request_key
+)
+from sify.aiplatform.transport.sse import EventStream, iter_data, iter_json
 # new lines for langfuse patching
 # 
 
 
 
 
-class ModelAsAService:
-    def __init__(self, api_key: str, model_id: str = None):
+# chunks: ChatCompletionChunk/CompletionChunk objects, text: text deltas, raw: undecoded event bytes
+STREAM_MODES = ("chunks", "text", "raw")
+
+# Wire formats create_embeddings can ask for; None leaves encoding_format to the server
+EMBEDDING_ENCODINGS = ("base64", "float", None)
+
+# POST endpoints without side effects, whose requests the transport may send again
+IDEMPOTENT_ENDPOINTS = frozenset(["/v1/embeddings", "/v1/rerank"])
+
+# Billed generation endpoints, only retried when the client opts in with retry_generation
+GENERATION_ENDPOINTS = frozenset(["/v1/chat/completions", "/v1/completions", "/v1/audio/speech"])
+
+
+class _ModelAsAServiceBase:
+    """Request building, validation and response parsing shared by the sync and async clients."""
+
+    def __init__(self, api_key: str, model_id: str = None, rate_limiter: Optional[RateLimiter] = None,
+                 hedging: Optional[HedgingPolicy] = None, single_flight: Any = None, lazy: bool = False,
+                 embedding_encoding: Optional[str] = "base64",
+                 embedding_batching: Optional[EmbeddingBatching] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None,
+                 rerank_batching: Optional[RerankBatching] = None,
+                 rerank_cache: Optional[RerankCache] = None, retry_generation: bool = False):
         
         if not api_key or not api_key.strip():
             raise ValueError("API key must be provided and cannot be empty")
+        if embedding_encoding not in EMBEDDING_ENCODINGS:
+            raise ValueError("embedding_encoding must be 'base64', 'float' or None")
 
         self.base_url = "https://infinitai.sifymdp.digital/maas"
         self.api_key = api_key.strip()
         self.model_id = model_id.strip() if model_id else None
-
-    def _send_request(
+        self.rate_limiter = rate_limiter
+        self.hedging = hedging
+        self.single_flight = single_flight
+        self.lazy = lazy
+        self.embedding_encoding = embedding_encoding
+        self.embedding_batching = embedding_batching or EmbeddingBatching()
+        self.embedding_cache = embedding_cache
+        self.rerank_batching = rerank_batching or RerankBatching()
+        self.rerank_cache = rerank_cache
+        self.retry_generation = retry_generation
+        if rerank_cache is not None and self.rerank_batching.anchors:
+            # Anchor-calibrated scores depend on the other documents of the request
+            raise ValueError("rerank_cache cannot be combined with RerankBatching(anchors=...)")
+
+    def _idempotent(self, endpoint: str, files: Optional[Dict[str, Any]]) -> Optional[bool]:
+        """Whether the transport may retry a request, None to decide by its method (GET yes, POST no)."""
+        if files:
+            # Uploaded file streams cannot be replayed
+            return False
+        if endpoint in IDEMPOTENT_ENDPOINTS:
+            return True
+        if endpoint in GENERATION_ENDPOINTS:
+            return self.retry_generation
+        return None
+
+    def _response_type(self, cls: type) -> type:
+        """The type to build responses with: cls, or its lazy view when the client is lazy."""
+        return lazy_type(cls) if self.lazy else cls
+
+    def _build_request(
         self,
         method: str,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
-        form_data: Optional[Dict[str, Any]] = None,
-        stream: bool = False,
-        return_binary: bool = False
-    ) -> Union[Dict[str, Any], Generator[Dict[str, Any], None, None], bytes]:
+        form_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         url = f"{self.base_url}{endpoint}"
         
         headers = {
@@ -51,129 +126,125 @@ class ModelAsAService:
         if not files and not form_data:
             headers["Content-Type"] = "application/json"
 
-        try:
-            # Prepare request arguments
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "headers": headers,
-                "stream": stream,
-                "timeout": 300
-            }
-
-            # Add data based on request type
-            if files:
-                request_kwargs["files"] = files
-                if form_data:
-                    request_kwargs["data"] = form_data
-            elif form_data:
-                request_kwargs["data"] = form_data
-            elif json_data:
-                request_kwargs["json"] = json_data
-
-            if params:
-                request_kwargs["params"] = params
-
-            response = requests.request(**request_kwargs)
-
-            # Handle error status codes
-            if response.status_code >= 400:
-                error_msg = "Request failed"
-                error_details = None
-                
-                try:
-                    error_response = response.json()
-                    if isinstance(error_response, dict):
-                        if 'error' in error_response:
-                            error_msg = error_response['error']
-                            error_details = error_response.get('details')
-                        elif 'message' in error_response:
-                            error_msg = error_response['message']
-                        elif 'detail' in error_response:
-                            error_msg = error_response['detail']
-                    else:
-                        error_msg = str(error_response)
-                except json.JSONDecodeError:
-                    error_msg = response.text if response.text else f"HTTP {response.status_code} Error"
-                
-                # Handle specific error codes
-                if response.status_code == 403:
-                    error_msg = f"Forbidden: API key is not subscribed for model '{self.model_id}' or access denied"
-                elif response.status_code == 401:
-                    error_msg = "Unauthorized: Invalid API key"
-                elif response.status_code == 404:
-                    error_msg = f"Not Found: Model '{self.model_id}' not found or endpoint not available"
-                elif response.status_code == 429:
-                    error_msg = "Rate limit exceeded: Too many requests"
-                elif response.status_code >= 500:
-                    error_msg = f"Server error: HTTP {response.status_code}"
-  
-                api_error = APIError(
-                    error=error_msg,
-                    details=error_details,
-                    status_code=response.status_code
-                )
-                raise ValueError(str(api_error))
+        # Prepare request arguments
+        request_kwargs = {
+            "method": method,
+            "url": url,
+            "headers": headers,
+            "idempotent": self._idempotent(endpoint, files)
+        }
 
-            # Handle streaming responses
-            if stream:
-                return self._handle_stream_response(response)
-
-            # Handle binary responses (e.g., audio files)
-            if return_binary or self._is_binary_response(response):
-                return response.content
-
-            # Handle JSON responses
-            if response.content:
-                try:
-                    result = response.json()
-                    return {"status_code": response.status_code, "result": result}
-                except json.JSONDecodeError:
-                    # If we can't parse JSON but expected it, check if it's HTML or other format
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'text/html' in content_type:
-                        raise ValueError(f"Received HTML response instead of JSON: {response.text[:200]}")
-                    elif 'text/plain' in content_type:
-                        raise ValueError(f"Received plain text response: {response.text}")
-                    else:
-                        raise ValueError(f"Failed to parse JSON response: {response.text[:200]}")
-            else:
-                return {"status_code": response.status_code, "result": {}}
+        # Add data based on request type
+        if files:
+            request_kwargs["files"] = files
+            if form_data:
+                request_kwargs["data"] = form_data
+        elif form_data:
+            request_kwargs["data"] = form_data
+        elif json_data:
+            request_kwargs["json"] = json_data
+
+        if params:
+            request_kwargs["params"] = params
+
+        if self.rate_limiter is not None:
+            payload = json_data or form_data or {}
+            key = (self.api_key, payload.get("model", self.model_id))
+            request_kwargs["rate_limit"] = self.rate_limiter.permit(key, self._estimate_tokens(json_data))
+
+        return request_kwargs
+
+    def _flight_key(self, method: str, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
+                    params: Optional[Dict[str, Any]] = None, **_: Any):
+        return request_key(method, f"{self.base_url}{endpoint}", json_data, params, self.api_key)
+
+    def _estimate_tokens(self, json_data: Optional[Dict[str, Any]]) -> int:
+        """Estimate the prompt plus completion tokens a request will be billed for."""
+        if not json_data:
+            return 1
+        texts = []
+        for message in json_data.get("messages") or []:
+            content = message.get("content")
+            texts.append(content if isinstance(content, str) else str(content))
+        for field in ("prompt", "query"):
+            if isinstance(json_data.get(field), str):
+                texts.append(json_data[field])
+        for field in ("input", "documents"):
+            value = json_data.get(field)
+            if isinstance(value, str):
+                texts.append(value)
+            elif isinstance(value, list):
+                texts.extend(item if isinstance(item, str) else str(item.get("text", "")) for item in value)
+        completion_tokens = json_data.get("max_tokens") or 0
+        return estimate_tokens("".join(texts)) + completion_tokens
+
+    def _raise_for_status(self, response) -> None:
+        """
+        Raise a ValueError describing the API error if the response status is 4xx/5xx.
 
-        except requests.RequestException as e:
-            error_msg = str(e).lower()
-            if "timeout" in error_msg:
-                raise ValueError("Request timeout - the API took too long to respond")
-            elif "connection" in error_msg:
-                raise ValueError("Connection error - unable to reach the API")
-            elif "ssl" in error_msg:
-                raise ValueError("SSL/TLS error - certificate verification failed")
-            else:
-                raise ValueError(f"Request failed: {str(e)}")
+        Works with both ``requests`` and ``httpx`` responses whose body has been read.
+        """
+        if response.status_code < 400:
+            return
 
-    def _handle_stream_response(self, response) -> Generator[Dict[str, Any], None, None]:
+        error_msg = "Request failed"
+        error_details = None
+        
         try:
-            for line in response.iter_lines(decode_unicode=True):
-                if line:
-                    # Handle server-sent events format
-                    if line.startswith("data: "):
-                        data_str = line[len("data: "):].strip()
-                        if data_str and data_str != "[DONE]":
-                            try:
-                                chunk_data = json.loads(data_str)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                # Skip malformed JSON chunks
-                                continue
-                    # Handle raw JSON lines
-                    elif line.strip():
-                        try:
-                            chunk_data = json.loads(line.strip())
-                            yield chunk_data
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            raise ValueError(f"Error processing stream: {str(e)}")
+            error_response = codec.loads(response.content)
+            if isinstance(error_response, dict):
+                if 'error' in error_response:
+                    error_msg = error_response['error']
+                    error_details = error_response.get('details')
+                elif 'message' in error_response:
+                    error_msg = error_response['message']
+                elif 'detail' in error_response:
+                    error_msg = error_response['detail']
+            else:
+                error_msg = str(error_response)
+        except json.JSONDecodeError:
+            error_msg = response.text if response.text else f"HTTP {response.status_code} Error"
+        
+        # Handle specific error codes
+        if response.status_code == 403:
+            error_msg = f"Forbidden: API key is not subscribed for model '{self.model_id}' or access denied"
+        elif response.status_code == 401:
+            error_msg = "Unauthorized: Invalid API key"
+        elif response.status_code == 404:
+            error_msg = f"Not Found: Model '{self.model_id}' not found or endpoint not available"
+        elif response.status_code == 429:
+            error_msg = "Rate limit exceeded: Too many requests"
+        elif response.status_code >= 500:
+            error_msg = f"Server error: HTTP {response.status_code}"
+
+        api_error = APIError(
+            error=error_msg,
+            details=error_details,
+            status_code=response.status_code
+        )
+        raise APIRequestError(str(api_error), response.status_code)
+
+    def _parse_response(self, response, return_binary: bool = False) -> Union[Dict[str, Any], bytes]:
+        # Handle binary responses (e.g., audio files)
+        if return_binary or self._is_binary_response(response):
+            return response.content
+
+        # Handle JSON responses
+        if response.content:
+            try:
+                result = codec.loads(response.content)
+                return {"status_code": response.status_code, "result": result}
+            except json.JSONDecodeError:
+                # If we can't parse JSON but expected it, check if it's HTML or other format
+                content_type = response.headers.get('Content-Type', '')
+                if 'text/html' in content_type:
+                    raise ValueError(f"Received HTML response instead of JSON: {response.text[:200]}")
+                elif 'text/plain' in content_type:
+                    raise ValueError(f"Received plain text response: {response.text}")
+                else:
+                    raise ValueError(f"Failed to parse JSON response: {response.text[:200]}")
+        else:
+            return {"status_code": response.status_code, "result": {}}
 
     def _is_binary_response(self, response) -> bool:
         content_type = response.headers.get("Content-Type", "").lower()
@@ -223,6 +294,342 @@ class ModelAsAService:
                 if isinstance(param_value, (int, float)) and param_value < 0:
                     raise ValueError(f"{param_name} must not be negative")
 
+    def _validate_stream_mode(self, stream_mode: str) -> None:
+        if stream_mode not in STREAM_MODES:
+            raise ValueError(f"stream_mode must be one of: {', '.join(STREAM_MODES)}")
+
+    def _require_model_id(self) -> None:
+        if self.model_id is None:
+            raise ValueError("Model ID must is not set for this instance")
+
+    def _prepare_audio_form(self, file: BinaryIO, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if file is None:
+            raise ValueError("File must be provided")
+        self._validate_optional_params(kwargs)
+        self._require_model_id()
+        
+        form_data = {"model": self.model_id}
+        form_data.update(kwargs)
+        return form_data
+
+    def _prepare_text_to_speech(self, input_text: str, voice: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "input": input_text,
+            "voice": voice
+        })
+        self._validate_optional_params(kwargs)
+        self._require_model_id()
+        
+        data = {
+            "model": self.model_id,
+            "input": input_text,
+            "voice": voice
+        }
+        data.update(kwargs)
+        return data
+
+    def _prepare_embeddings(self, input_data: Union[str, List[str]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"input": input_data})
+        self._validate_optional_params(kwargs)
+        
+        # Validate input_data structure
+        if isinstance(input_data, list):
+            for i, item in enumerate(input_data):
+                if not isinstance(item, str) or not item.strip():
+                    raise ValueError(f"Input item {i} must be a non-empty string")
+        elif not isinstance(input_data, str) or not input_data.strip():
+            raise ValueError("Input data must be a non-empty string or list of non-empty strings")
+        
+        self._require_model_id()
+        
+        data = {
+            "model": self.model_id,
+            "input": input_data
+        }
+        if self.embedding_encoding is not None:
+            data["encoding_format"] = self.embedding_encoding
+        data.update(kwargs)
+        return data
+
+    def _split_embeddings(self, data: Dict[str, Any]) -> List[Batch]:
+        if isinstance(data["input"], str):
+            return [(0, 1)]
+        return self.embedding_batching.split(data["input"])
+
+    @staticmethod
+    def _embeddings_batch(data: Dict[str, Any], batch: Batch) -> Dict[str, Any]:
+        start, end = batch
+        if isinstance(data["input"], str) or (start == 0 and end == len(data["input"])):
+            return data
+        return dict(data, input=data["input"][start:end])
+
+    @staticmethod
+    def _embedding_texts(data: Dict[str, Any]) -> List[str]:
+        return [data["input"]] if isinstance(data["input"], str) else data["input"]
+
+    @staticmethod
+    def _embeddings_to_cache(texts: List[str], misses: List[int],
+                             fetched: Dict[str, Any]) -> List[Tuple[str, bytes]]:
+        return [(texts[misses[item["index"]]], vector_bytes(item["embedding"])) for item in fetched["data"]]
+
+    @staticmethod
+    def _merge_cached_embeddings(data: Dict[str, Any], cached: List[Optional[bytes]], misses: List[int],
+                                 fetched: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if fetched is not None and len(misses) == len(cached):
+            return fetched
+        # Hits are put in the response as the server would have sent them, and cost no tokens
+        encoding_format = data.get("encoding_format")
+        items = [
+            None if vector is None else {"object": "embedding", "embedding": vector_value(vector, encoding_format),
+                                         "index": i}
+            for i, vector in enumerate(cached)
+        ]
+        result = {"object": "list", "model": data["model"], "usage": {"prompt_tokens": 0, "total_tokens": 0}}
+        if fetched is not None:
+            for item in fetched["data"]:
+                position = misses[item["index"]]
+                items[position] = dict(item, index=position)
+            result = dict(fetched)
+        result["data"] = items
+        return result
+
+    def _build_embeddings(self, result: Dict[str, Any], as_numpy: bool) -> EmbeddingResponse:
+        response_type = self._response_type(EmbeddingResponse)
+        if as_numpy:
+            return response_type.from_dict_as_numpy(result)
+        return response_type.from_dict(result)
+
+    def _base64_rejected(self, data: Dict[str, Any], error: ValueError) -> bool:
+        """
+        Whether a failed embeddings request should be resent with floats: the client asked for
+        base64 and the server's error names the encoding. Later requests then ask for floats.
+        """
+        if data.get("encoding_format") != "base64" or self.embedding_encoding != "base64":
+            return False
+        message = str(error).lower()
+        if "encoding_format" not in message and "base64" not in message:
+            return False
+        self.embedding_encoding = "float"
+        return True
+
+    def _prepare_chat_completion(self, messages: List[Dict[str, Any]], stream: bool,
+                                 kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"messages": messages})
+        self._validate_optional_params(kwargs)
+        
+        # Validate messages structure
+        for i, message in enumerate(messages):
+            if not isinstance(message, dict):
+                raise ValueError(f"Message {i} must be a dictionary")
+            if "role" not in message or not message["role"]:
+                raise ValueError(f"Message {i} must have a valid 'role' field")
+            if "content" not in message or not message["content"]:
+                raise ValueError(f"Message {i} must have a valid 'content' field")
+        
+        self._require_model_id()
+        
+        data = {
+            "model": self.model_id,
+            "messages": messages,
+            "stream": stream
+        }
+        data.update(kwargs)
+        return data
+
+    def _prepare_completion(self, prompt: str, stream: bool, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({"prompt": prompt})
+        self._validate_optional_params(kwargs)
+        self._require_model_id()
+        
+        data = {
+            "model": self.model_id,
+            "prompt": prompt,
+            "stream": stream
+        }
+        data.update(kwargs)
+        return data
+
+    def _prepare_rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]],
+                        kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        self._validate_required_params({
+            "query": query,
+            "documents": documents
+        })
+        self._validate_optional_params(kwargs)
+        
+        # Validate documents structure
+        for i, doc in enumerate(documents):
+            if isinstance(doc, str) and not doc.strip():
+                raise ValueError(f"Document {i} must not be empty")
+            elif isinstance(doc, dict):
+                if "text" not in doc or not doc["text"]:
+                    raise ValueError(f"Document {i} must have a valid 'text' field")
+            elif not isinstance(doc, (str, dict)):
+                raise ValueError(f"Document {i} must be a string or dictionary")
+        
+        self._require_model_id()
+        
+        data = {
+            "model": self.model_id,
+            "query": query,
+            "documents": documents
+        }
+        data.update(kwargs)
+        return data
+
+    @staticmethod
+    def _rerank_texts(data: Dict[str, Any]) -> List[str]:
+        return [document if isinstance(document, str) else document["text"] for document in data["documents"]]
+
+    @staticmethod
+    def _rerank_misses_request(data: Dict[str, Any], misses: List[int]) -> Dict[str, Any]:
+        request = dict(data, documents=[data["documents"][i] for i in misses])
+        # Every missing score is needed, both for the global ranking and for the cache
+        request.pop("top_n", None)
+        return request
+
+    @staticmethod
+    def _rerank_to_cache(texts: List[str], misses: List[int],
+                         fetched: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(texts[misses[item["index"]]], item) for item in fetched["results"]]
+
+    @staticmethod
+    def _merge_cached_rerank(data: Dict[str, Any], cached: List[Optional[CachedResult]], misses: List[int],
+                             fetched: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # Hits are the entries the server sent for the same documents, moved to their index in this call
+        results = [dict(hit[0], index=i) for i, hit in enumerate(cached) if hit is not None]
+        if fetched is not None:
+            results.extend(dict(item, index=misses[item["index"]]) for item in fetched["results"])
+        results.sort(key=_rank_key)
+        # When every document was a hit, report the response the best one came from
+        result = dict(fetched) if fetched is not None else {"id": cached[results[0]["index"]][1]}
+        if data.get("top_n") is not None:
+            del results[data["top_n"]:]
+        result["results"] = results
+        return result
+
+
+class ModelAsAService(_ModelAsAServiceBase):
+    def __init__(self, api_key: str, model_id: str = None, transport: Optional[HTTPTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None, hedging: Optional[HedgingPolicy] = None,
+                 single_flight: Optional[SingleFlight] = None, timeout: Optional[TimeoutConfig] = None,
+                 lazy: bool = False, embedding_encoding: Optional[str] = "base64",
+                 embedding_batching: Optional[EmbeddingBatching] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None,
+                 rerank_batching: Optional[RerankBatching] = None,
+                 rerank_cache: Optional[RerankCache] = None, retry_generation: bool = False):
+        """
+        Initialize the client.
+
+        Args:
+            api_key (str): The API key for authentication.
+            model_id (str): The model to use for requests made by this instance.
+            transport (Optional[HTTPTransport]): Pooled transport to send requests over.
+                Defaults to the process-wide shared transport.
+            rate_limiter (Optional[RateLimiter]): Client-side limiter applied per (api_key, model_id)
+                before every attempt. Defaults to None (no client-side limiting).
+            hedging (Optional[HedgingPolicy]): Sends a duplicate of slow non-streaming chat_completion
+                and create_embeddings requests; the first response wins. Defaults to None (no hedging).
+            single_flight (Optional[SingleFlight]): Shares one HTTP call between identical concurrent
+                list_models, create_embeddings and rerank calls; share the instance between clients to
+                coalesce across them. Defaults to None (no coalescing).
+            timeout (Optional[TimeoutConfig]): Connect, read, stream idle and total timeouts for this
+                client's requests. Defaults to the transport's timeouts.
+            lazy (bool): Return chat_completion, completion, create_embeddings, list_models and rerank
+                responses as lazy views over the decoded JSON: fields and nested objects are built on
+                first access and the JSON itself is never modified. Defaults to False.
+            embedding_encoding (Optional[str]): encoding_format create_embeddings requests by default.
+                "base64" sends each vector as packed float32, about 4x smaller than JSON floats and
+                decoded straight into the matrix by as_numpy or matrix; embeddings read as lists of
+                floats either way, decoded on first access. If the server rejects base64 the client
+                switches to "float"; None omits the field. Defaults to "base64".
+            embedding_batching (Optional[EmbeddingBatching]): How create_embeddings splits large inputs
+                into concurrent sub-batch requests. Defaults to a policy of at most 256 texts or
+                32768 estimated tokens per request and 4 requests in flight per call.
+            embedding_cache (Optional[EmbeddingCache]): Persistent cache create_embeddings looks texts up
+                in before sending only the misses. Defaults to None (no caching).
+            rerank_batching (Optional[RerankBatching]): How rerank splits large document lists into
+                concurrent sub-requests. Defaults to a policy of at most 128 documents or 32768
+                estimated tokens per request and 4 requests in flight per call.
+            rerank_cache (Optional[RerankCache]): Result cache rerank looks documents up in before
+                sending only the misses. Defaults to None (no caching).
+            retry_generation (bool): Let the transport retry chat_completion, completion and
+                text_to_speech requests on timeouts, 429 and 5xx. These calls are billed and not
+                idempotent, so a retry after the server accepted the request generates (and bills)
+                twice. Embeddings and rerank are always retried. Defaults to False.
+
+        Raises:
+            ValueError: If api_key is empty, embedding_encoding is not supported, or rerank_cache is given
+                with a rerank_batching that calibrates scores with anchors.
+        """
+        super().__init__(api_key, model_id, rate_limiter, hedging, single_flight, lazy, embedding_encoding,
+                         embedding_batching, embedding_cache, rerank_batching, rerank_cache, retry_generation)
+        self.transport = transport or get_default_transport()
+        self.timeout = timeout or self.transport.timeout
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        form_data: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        return_binary: bool = False,
+        raw_events: bool = False
+    ) -> Union[Dict[str, Any], EventStream, bytes]:
+        request_kwargs = self._build_request(method, endpoint, json_data, params, files, form_data)
+        request_kwargs["stream"] = stream
+        request_kwargs["timeout"] = self.timeout
+        expires_at = self.timeout.expires_at()
+
+        try:
+            response = self.transport.request(**request_kwargs)
+
+            # Handle error status codes
+            self._raise_for_status(response)
+
+            # Handle streaming responses
+            if stream:
+                return EventStream(self._handle_stream_response(response, expires_at, raw_events), response)
+
+            return self._parse_response(response, return_binary)
+
+        except requests.RequestException as e:
+            error_msg = str(e).lower()
+            if "timeout" in error_msg:
+                raise APIRequestError("Request timeout - the API took too long to respond")
+            elif "connection" in error_msg:
+                raise APIRequestError("Connection error - unable to reach the API")
+            elif "ssl" in error_msg:
+                raise ValueError("SSL/TLS error - certificate verification failed")
+            else:
+                raise ValueError(f"Request failed: {str(e)}")
+
+    def _send_hedged_request(self, **request: Any) -> Dict[str, Any]:
+        if self.hedging is None:
+            return self._send_request(**request)
+        return self.hedging.run(lambda: self._send_request(**request))
+
+    def _send_coalesced_request(self, hedge: bool = False, **request: Any) -> Dict[str, Any]:
+        send = self._send_hedged_request if hedge else self._send_request
+        if self.single_flight is None:
+            return send(**request)
+        return self.single_flight.do(self._flight_key(**request), lambda: send(**request))
+
+    def _handle_stream_response(self, response, expires_at: Optional[float] = None,
+                                raw_events: bool = False) -> Generator[Union[Dict[str, Any], bytes], None, None]:
+        events = iter_data if raw_events else iter_json
+        try:
+            for chunk_data in events(response.iter_content(chunk_size=None), response.headers.get("Content-Type")):
+                check_deadline(expires_at)
+                yield chunk_data
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error processing stream: {str(e)}")
+
     # Audio Service Methods
     def speech_to_text(self, file: BinaryIO, **kwargs) -> AudioTranscriptionResponse:
         """
@@ -243,15 +650,7 @@ class ModelAsAService:
         Raises:
             ValueError: If file is missing, or if the API request fails
         """
-        if file is None:
-            raise ValueError("File must be provided")
-        self._validate_optional_params(kwargs)
-
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        form_data = {"model": self.model_id}
-        form_data.update(kwargs)
+        form_data = self._prepare_audio_form(file, kwargs)
         
         response = self._send_request(
             method="POST",
@@ -280,15 +679,7 @@ class ModelAsAService:
         Raises:
             ValueError: If file is missing, or if the API request fails
         """
-        if file is None:
-            raise ValueError("File must be provided")
-        self._validate_optional_params(kwargs)
-
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        form_data = {"model": self.model_id}
-        form_data.update(kwargs)
+        form_data = self._prepare_audio_form(file, kwargs)
         
         response = self._send_request(
             method="POST",
@@ -316,21 +707,7 @@ class ModelAsAService:
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
-        self._validate_required_params({
-            "input": input_text,
-            "voice": voice
-        })
-        self._validate_optional_params(kwargs)
-
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        data = {
-            "model": self.model_id,
-            "input": input_text,
-            "voice": voice
-        }
-        data.update(kwargs)
+        data = self._prepare_text_to_speech(input_text, voice, kwargs)
         
         return self._send_request(
             method="POST",
@@ -340,14 +717,22 @@ class ModelAsAService:
         )
     
     # Embedding Service Methods
-    def create_embeddings(self, input_data: Union[str, List[str]], **kwargs) -> EmbeddingResponse:
+    def create_embeddings(self, input_data: Union[str, List[str]], as_numpy: bool = False,
+                          **kwargs) -> EmbeddingResponse:
         """
         Create embeddings for input text using embedding models.
 
         Args:
-            input_data (Union[str, List[str]]): Text string or list of text strings to embed
+            input_data (Union[str, List[str]]): Text string or list of text strings to embed. Lists over
+                the client's embedding_batching limits are sent as concurrent sub-batch requests and
+                merged into one response in input order, with usage summed. With an embedding_cache,
+                only the texts missing from the cache are sent; cached vectors cost no usage tokens
+            as_numpy (bool): Convert the embeddings to NumPy: the response's matrix holds them as a
+                contiguous float32 array of shape (n, dim) ordered by index, and each embedding is the
+                matching row. Requires numpy. Defaults to False.
             **kwargs: Additional parameters:
-                - encoding_format (str): Format to return embeddings ("float", "base64")
+                - encoding_format (str): Wire format of the embeddings ("float", "base64"). Defaults to
+                  the client's embedding_encoding; either way the response holds decoded vectors
                 - dimensions (int): Number of dimensions for the output embeddings (model-specific)
                 - user (str): Unique identifier representing your end-user
 
@@ -356,7 +741,8 @@ class ModelAsAService:
                 - object (str): Type of object returned (always "list")
                 - data (List[EmbeddingData]): List of embedding objects with:
                     - object (str): Type of object (always "embedding")
-                    - embedding (List[float]): The embedding vector
+                    - embedding (Sequence[float]): The embedding vector, a list of floats, or a row
+                      of the float32 matrix with as_numpy
                     - index (int): Index of the embedding in the input list
                 - model (str): The model used for embedding
                 - usage (EmbeddingUsage): Usage statistics with:
@@ -364,40 +750,53 @@ class ModelAsAService:
                     - total_tokens (int): Total tokens processed
 
         Raises:
-            ValueError: If required parameters are missing or if the API request fails
+            ValueError: If required parameters are missing or if the API request fails (for a
+                sub-batch, after its retries)
+            ImportError: If as_numpy is set and numpy is not installed
         """
-        self._validate_required_params({"input": input_data})
-        self._validate_optional_params(kwargs)
-        
-        # Validate input_data structure
-        if isinstance(input_data, list):
-            for i, item in enumerate(input_data):
-                if not isinstance(item, str) or not item.strip():
-                    raise ValueError(f"Input item {i} must be a non-empty string")
-        elif not isinstance(input_data, str) or not input_data.strip():
-            raise ValueError("Input data must be a non-empty string or list of non-empty strings")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        data = {
-            "model": self.model_id,
-            "input": input_data
-        }
-        data.update(kwargs)
-        
-        response = self._send_request(
-            method="POST",
-            endpoint="/v1/embeddings",
-            json_data=data
-        )
-        
-        return EmbeddingResponse.from_dict(response["result"])
+        data = self._prepare_embeddings(input_data, kwargs)
+        cache = self.embedding_cache
+        if cache is None:
+            return self._build_embeddings(self._fetch_embeddings(data), as_numpy)
+
+        texts = self._embedding_texts(data)
+        cached = cache.get_many(data["model"], data.get("dimensions"), texts)
+        misses = [i for i, vector in enumerate(cached) if vector is None]
+        fetched = None
+        if misses:
+            fetched = self._fetch_embeddings(dict(data, input=[texts[i] for i in misses]))
+            cache.put_many(data["model"], data.get("dimensions"), self._embeddings_to_cache(texts, misses, fetched))
+        return self._build_embeddings(self._merge_cached_embeddings(data, cached, misses, fetched), as_numpy)
+
+    def _fetch_embeddings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return self._fetch_embedding_batches(data)
+        except ValueError as e:
+            if not self._base64_rejected(data, e):
+                raise
+        return self._fetch_embedding_batches(dict(data, encoding_format="float"))
+
+    def _fetch_embedding_batches(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        batches = self._split_embeddings(data)
+
+        def send(batch: Batch) -> Dict[str, Any]:
+            response = self._send_coalesced_request(
+                hedge=True,
+                method="POST",
+                endpoint="/v1/embeddings",
+                json_data=self._embeddings_batch(data, batch)
+            )
+            return response["result"]
+
+        if len(batches) == 1:
+            return send(batches[0])
+        return self.embedding_batching.merge(self.embedding_batching.run(send, batches), batches)
 
     # LLM Service Methods
     
     def chat_completion(self, messages: List[Dict[str, Any]], 
-                       stream: bool = False, **kwargs) -> Union[ChatCompletionResponse, Generator[ChatCompletionChunk, None, None]]:
+                       stream: bool = False, stream_mode: str = "chunks",
+                       **kwargs) -> Union[ChatCompletionResponse, ChatCompletionStream, EventStream]:
         """
         Create a chat completion using large language models.
 
@@ -406,6 +805,9 @@ class ModelAsAService:
                 - role (str): The role of the message author ("system", "user", "assistant")
                 - content (str): The content of the message
             stream (bool): Whether to stream back partial message deltas. Defaults to False.
+            stream_mode (str): What a stream yields: "chunks" for ChatCompletionChunk objects, "text" for
+                               the content deltas of choice 0 as str, or "raw" for each event's undecoded
+                               JSON bytes. Defaults to "chunks".
             **kwargs: Additional parameters:
                 - temperature (float): Sampling temperature (0-2). Higher values make output more random
                 - max_tokens (int): Maximum number of tokens to generate
@@ -415,7 +817,7 @@ class ModelAsAService:
                 - stop (Union[str, List[str]]): Sequences where the API will stop generating
 
         Returns:
-            Union[ChatCompletionResponse, Generator]: 
+            Union[ChatCompletionResponse, ChatCompletionStream, EventStream]: 
                 - If stream=False: ChatCompletionResponse object containing:
                     - id (str): Unique identifier for the completion
                     - object (str): Object type (always "chat.completion")
@@ -423,120 +825,54 @@ class ModelAsAService:
                     - model (str): Model used for completion
                     - choices (List[ChatChoice]): List of completion choices
                     - usage (ChatUsage): Token usage statistics
-                - If stream=True: Generator yielding ChatCompletionChunk objects
+                - If stream=True: ChatCompletionStream yielding ChatCompletionChunk objects. Its
+                  get_final_response() returns the assembled ChatCompletionResponse and stats holds
+                  time to first token and inter-token latency.
+                - If stream=True and stream_mode is "text" or "raw": EventStream yielding str deltas or
+                  bytes, without building per-chunk objects. It can be closed like ChatCompletionStream.
 
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
-        self._validate_required_params({"messages": messages})
-        self._validate_optional_params(kwargs)
-        
-        # Validate messages structure
-        for i, message in enumerate(messages):
-            if not isinstance(message, dict):
-                raise ValueError(f"Message {i} must be a dictionary")
-            if "role" not in message or not message["role"]:
-                raise ValueError(f"Message {i} must have a valid 'role' field")
-            if "content" not in message or not message["content"]:
-                raise ValueError(f"Message {i} must have a valid 'content' field")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        data = {
-            "model": self.model_id,
-            "messages": messages,
-            "stream": stream
-        }
-        data.update(kwargs)
+        self._validate_stream_mode(stream_mode)
+        data = self._prepare_chat_completion(messages, stream, kwargs)
         
         def _non_stream_generator():
-            response = self._send_request(
+            response = self._send_hedged_request(
                 method="POST",
                 endpoint="/v1/chat/completions",
                 json_data=data
             )
-            return ChatCompletionResponse.from_dict(response["result"])   
+            return self._response_type(ChatCompletionResponse).from_dict(response["result"])   
         if stream:
-            def _stream_generator():
-                collected_text = ""
-                model_name = self.model_id
-                chunk_count = 0
-                first_chunk_time = None
-                last_chunk_time = None
-                
-                stream_generator = self._send_request(
-                    method="POST",
-                    endpoint="/v1/chat/completions",
-                    json_data=data,
-                    stream=True
-                )
-                
-                for chunk_data in stream_generator:
-                    if not chunk_data or not isinstance(chunk_data, dict):
-                        continue
-                        
-                    chunk_count += 1
-                    if first_chunk_time is None:
-                        first_chunk_time = chunk_data.get("created", 0)
-                    last_chunk_time = chunk_data.get("created", 0)
-                    
-                    # Extract content from chunk and accumulate
-                    if "choices" in chunk_data and chunk_data["choices"]:
-                        choice = chunk_data["choices"][0]
-                        if "delta" in choice and "content" in choice["delta"]:
-                            content = choice["delta"]["content"]
-                            if content:
-                                collected_text += content
-                                
-                    # Yield the chunk as-is for streaming
-                    yield ChatCompletionChunk.from_dict(chunk_data)
-                
-                # After streaming is complete, yield a final summary chunk with usage info
-                # if collected_text:
-                #     # Estimate token usage
-                #     prompt_text = " ".join([msg.get("content", "") for msg in messages])
-                #     estimated_prompt_tokens = len(prompt_text.split())
-                #     estimated_completion_tokens = len(collected_text.split())
-                #     estimated_total_tokens = estimated_prompt_tokens + estimated_completion_tokens
-                    
-                #     # Create a final summary chunk
-                #     summary_chunk = {
-                #         "id": f"chatcmpl-{chunk_count}",
-                #         "object": "chat.completion.chunk", 
-                #         "created": last_chunk_time or 0,
-                #         "model": model_name,
-                #         "choices": [{
-                #             "index": 0,
-                #             "delta": {},
-                #             "finish_reason": "stop"
-                #         }],
-                #         "usage": {
-                #             "prompt_tokens": estimated_prompt_tokens,
-                #             "completion_tokens": estimated_completion_tokens,
-                #             "total_tokens": estimated_total_tokens
-                #         },
-                #         "stream_summary": {
-                #             "collected_text": collected_text,
-                #             "chunk_count": chunk_count,
-                #             "model": model_name
-                #         }
-                #     }
-                #     yield ChatCompletionChunk.from_dict(summary_chunk)
-                    
-            return _stream_generator()
+            started_at = time.monotonic()
+            # Send now so the call's deadline and errors apply here rather than at first iteration
+            chunks = self._send_request(
+                method="POST",
+                endpoint="/v1/chat/completions",
+                json_data=data,
+                stream=True,
+                raw_events=stream_mode == "raw"
+            )
+            if stream_mode == "chunks":
+                return ChatCompletionStream(chunks, self.model_id, started_at)
+            return EventStream(iter_text(chunks), chunks) if stream_mode == "text" else chunks
         else:
             return _non_stream_generator()
 
             
 
-    def completion(self, prompt: str, stream: bool = False, **kwargs) -> Union[CompletionResponse, Generator[CompletionChunk, None, None]]:
+    def completion(self, prompt: str, stream: bool = False, stream_mode: str = "chunks",
+                   **kwargs) -> Union[CompletionResponse, CompletionStream, EventStream]:
         """
         Create a text completion using large language models.
 
         Args:
             prompt (str): The prompt text to complete
             stream (bool): Whether to stream back partial completions. Defaults to False.
+            stream_mode (str): What a stream yields: "chunks" for CompletionChunk objects, "text" for the
+                               text deltas of choice 0 as str, or "raw" for each event's undecoded JSON
+                               bytes. Defaults to "chunks".
             **kwargs: Additional parameters:
                 - temperature (float): Sampling temperature (0-2). Higher values make output more random
                 - max_tokens (int): Maximum number of tokens to generate
@@ -547,7 +883,7 @@ class ModelAsAService:
                 - echo (bool): Whether to echo back the prompt in the response
 
         Returns:
-            Union[CompletionResponse, Generator]: 
+            Union[CompletionResponse, CompletionStream, EventStream]: 
                 - If stream=False: CompletionResponse object containing:
                     - id (str): Unique identifier for the completion
                     - object (str): Object type (always "text_completion")
@@ -555,23 +891,15 @@ class ModelAsAService:
                     - model (str): Model used for completion
                     - choices (List[CompletionChoice]): List of completion choices
                     - usage (CompletionUsage): Token usage statistics
-                - If stream=True: Generator yielding completion chunks
+                - If stream=True: CompletionStream yielding CompletionChunk objects, with
+                  get_final_response() and stats as for chat_completion
+                - If stream=True and stream_mode is "text" or "raw": EventStream yielding str deltas or bytes
 
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
-        self._validate_required_params({"prompt": prompt})
-        self._validate_optional_params(kwargs)
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        data = {
-            "model": self.model_id,
-            "prompt": prompt,
-            "stream": stream
-        }
-        data.update(kwargs)
+        self._validate_stream_mode(stream_mode)
+        data = self._prepare_completion(prompt, stream, kwargs)
 
         def _non_stream_generator():
             response = self._send_request(
@@ -579,74 +907,20 @@ class ModelAsAService:
                 endpoint="/v1/completions",
                 json_data=data
             )
-            return CompletionResponse.from_dict(response["result"])
+            return self._response_type(CompletionResponse).from_dict(response["result"])
         if stream:
-            def _stream_generator():
-                collected_text = ""
-                model_name = self.model_id
-                chunk_count = 0
-                first_chunk_time = None
-                last_chunk_time = None
-
-                stream_generator = self._send_request(
-                    method="POST",
-                    endpoint="/v1/completions",
-                    json_data=data,
-                    stream=True
-                )
-
-                for chunk_data in stream_generator:
-                    if not chunk_data or not isinstance(chunk_data, dict):
-                        continue
-                        
-                    chunk_count += 1
-                    if first_chunk_time is None:
-                        first_chunk_time = chunk_data.get("created", 0)
-                    last_chunk_time = chunk_data.get("created", 0)
-                    
-                    # Extract content from chunk and accumulate
-                    if "choices" in chunk_data and chunk_data["choices"]:
-                        choice = chunk_data["choices"][0]
-                        if "delta" in choice and "content" in choice["delta"]:
-                            content = choice["delta"]["content"]
-                            if content:
-                                collected_text += content
-                                
-                    # Yield the chunk as-is for streaming
-                    yield CompletionChunk.from_dict(chunk_data)
-
-                # After streaming is complete, yield a final summary chunk with usage info
-                # if collected_text:
-                #     # Estimate token usage
-                #     prompt_text = prompt
-                #     estimated_prompt_tokens = len(prompt_text.split())
-                #     estimated_completion_tokens = len(collected_text.split())
-                #     estimated_total_tokens = estimated_prompt_tokens + estimated_completion_tokens
-                    
-                #     # Create a final summary chunk
-                #     summary_chunk = {
-                #         "id": f"cmpl-{chunk_count}",
-                #         "object": "completion.chunk", 
-                #         "created": last_chunk_time or 0,
-                #         "model": model_name,
-                #         "choices": [{
-                #             "index": 0,
-                #             "delta": {},
-                #             "finish_reason": "stop"
-                #         }],
-                #         "usage": {
-                #             "prompt_tokens": estimated_prompt_tokens,
-                #             "completion_tokens": estimated_completion_tokens,
-                #             "total_tokens": estimated_total_tokens
-                #         },
-                #         "stream_summary": {
-                #             "collected_text": collected_text,
-                #             "chunk_count": chunk_count,
-                #             "model": model_name
-                #         }
-                #     }
-                #     yield CompletionChunk.from_dict(summary_chunk)
-            return _stream_generator()
+            started_at = time.monotonic()
+            # Send now so the call's deadline and errors apply here rather than at first iteration
+            chunks = self._send_request(
+                method="POST",
+                endpoint="/v1/completions",
+                json_data=data,
+                stream=True,
+                raw_events=stream_mode == "raw"
+            )
+            if stream_mode == "chunks":
+                return CompletionStream(chunks, self.model_id, started_at)
+            return EventStream(iter_text(chunks), chunks) if stream_mode == "text" else chunks
         else:
             return _non_stream_generator()
              
@@ -668,12 +942,12 @@ class ModelAsAService:
         Raises:
             ValueError: If the API request fails
         """
-        response = self._send_request(
+        response = self._send_coalesced_request(
             method="GET",
             endpoint="/v1/models"
         )
         
-        return ModelsListResponse.from_dict(response["result"])
+        return self._response_type(ModelsListResponse).from_dict(response["result"])
 
     # Rerank Service Methods
     def rerank(self, query: str, documents: List[Union[str, Dict[str, Any]]], 
@@ -681,6 +955,12 @@ class ModelAsAService:
         """
         Rerank documents based on their relevance to a query using reranking models.
 
+        Document lists over the client's rerank_batching limits are sent as concurrent
+        sub-requests; their results are mapped back to indices in documents and merged
+        into one ranking.
+        With a rerank_cache, only documents without a cached result for the query are
+        sent, and the cached and fresh results are ranked together.
+
         Args:
             query (str): The search query to rank documents against
             documents (List[Union[str, Dict[str, Any]]]): List of documents to rerank.
@@ -704,36 +984,32 @@ class ModelAsAService:
         Raises:
             ValueError: If required parameters are missing or if the API request fails
         """
-        self._validate_required_params({
-            "query": query,
-            "documents": documents
-        })
-        self._validate_optional_params(kwargs)
-        
-        # Validate documents structure
-        for i, doc in enumerate(documents):
-            if isinstance(doc, str) and not doc.strip():
-                raise ValueError(f"Document {i} must not be empty")
-            elif isinstance(doc, dict):
-                if "text" not in doc or not doc["text"]:
-                    raise ValueError(f"Document {i} must have a valid 'text' field")
-            elif not isinstance(doc, (str, dict)):
-                raise ValueError(f"Document {i} must be a string or dictionary")
-        
-        if self.model_id is None:
-            raise ValueError("Model ID must is not set for this instance")
-        
-        data = {
-            "model": self.model_id,
-            "query": query,
-            "documents": documents
-        }
-        data.update(kwargs)
-        
-        response = self._send_request(
-            method="POST",
-            endpoint="/v1/rerank",
-            json_data=data
-        )
-        
-        return RerankResponse.from_dict(response["result"])
+        data = self._prepare_rerank(query, documents, kwargs)
+        cache = self.rerank_cache
+        if cache is None:
+            return self._response_type(RerankResponse).from_dict(self._fetch_rerank(data))
+
+        texts = self._rerank_texts(data)
+        cached = cache.get_many(data["model"], query, texts, data)
+        misses = [i for i, hit in enumerate(cached) if hit is None]
+        fetched = None
+        if misses:
+            fetched = self._fetch_rerank(self._rerank_misses_request(data, misses))
+            cache.put_many(data["model"], query, self._rerank_to_cache(texts, misses, fetched), fetched["id"], data)
+        return self._response_type(RerankResponse).from_dict(self._merge_cached_rerank(data, cached, misses, fetched))
+
+    def _fetch_rerank(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        batches = self.rerank_batching.split(data["documents"], data["query"])
+
+        def send(batch: Batch) -> Dict[str, Any]:
+            response = self._send_coalesced_request(
+                method="POST",
+                endpoint="/v1/rerank",
+                json_data=self.rerank_batching.request(data, batch, batches)
+            )
+            return response["result"]
+
+        if len(batches) == 1:
+            return send(batches[0])
+        results = self.rerank_batching.run(send, batches)
+        return self.rerank_batching.merge(results, batches, data.get("top_n"))
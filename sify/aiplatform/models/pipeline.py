@@ -0,0 +1,344 @@
+import csv
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sify.aiplatform.models._vectors import require_numpy
+from sify.aiplatform.models.embedding_store import EmbeddingStore
+from sify.aiplatform.models.types import np
+from sify.aiplatform.transport.codec import loads
+
+# (id, text) of one input record
+Record = Tuple[str, str]
+
+
+def _record(fields: Dict[str, Any], number: int, text_field: str, id_field: Optional[str], path: str) -> Record:
+    text = fields.get(text_field)
+    if not isinstance(text, str):
+        raise ValueError(f"Record {number} of {path} has no text field '{text_field}'")
+    embedding_id = fields.get(id_field) if id_field else None
+    return (str(number) if embedding_id is None else str(embedding_id)), text
+
+
+def read_jsonl(path: str, text_field: str = "text", id_field: Optional[str] = "id") -> Iterator[Record]:
+    """
+    Read (id, text) records from a JSON Lines file one line at a time.
+
+    Args:
+        path (str): Path of the file.
+        text_field (str): Field holding the text to embed. Defaults to "text".
+        id_field (Optional[str]): Field holding the record id. Records without it, or every
+            record when None, are identified by their position in the file. Defaults to "id".
+
+    Raises:
+        ValueError: If a record has no text.
+    """
+    with open(path, "rb") as f:
+        number = 0
+        for line in f:
+            if line.strip():
+                yield _record(loads(line), number, text_field, id_field, path)
+                number += 1
+
+
+def read_csv(path: str, text_field: str = "text", id_field: Optional[str] = "id") -> Iterator[Record]:
+    """
+    Read (id, text) records from a CSV file with a header row, one row at a time.
+
+    Args:
+        path (str): Path of the file.
+        text_field (str): Column holding the text to embed. Defaults to "text".
+        id_field (Optional[str]): Column holding the record id. Rows without it, or every
+            row when None, are identified by their position in the file. Defaults to "id".
+
+    Raises:
+        ValueError: If a row has no text.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for number, row in enumerate(csv.DictReader(f)):
+            yield _record(row, number, text_field, id_field, path)
+
+
+def _write_atomic(path: str, write: Any) -> None:
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+class EmbeddingSink(ABC):
+    """
+    Base of the outputs of an EmbeddingPipeline.
+
+    A sink buffers or writes the vectors it is given and makes them durable on commit,
+    together with the pipeline's checkpoint, so that after a crash the checkpoint it
+    returns from open() describes exactly the rows it holds.
+    """
+
+    @abstractmethod
+    def open(self, model_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Prepare for writing and return the last committed checkpoint, None for a new output."""
+
+    @abstractmethod
+    def write(self, ids: List[str], matrix: "np.ndarray") -> None:
+        """Accept a batch of rows; they are only durable after the next commit."""
+
+    @abstractmethod
+    def commit(self, checkpoint: Dict[str, Any]) -> None:
+        """Make the rows written so far durable, together with checkpoint."""
+
+    def close(self) -> None:
+        pass
+
+
+class EmbeddingStoreSink(EmbeddingSink):
+    """Writes to an EmbeddingStore, keeping the checkpoint in the metadata its flushes commit with the rows."""
+
+    def __init__(self, path: str, dtype: str = "float32"):
+        """
+        Initialize the sink.
+
+        Args:
+            path (str): Directory of the store; created on the first write if it does not exist.
+            dtype (str): Row storage of a new store, "float32", "float16" or "int8". Defaults to "float32".
+        """
+        self.path = path
+        self.dtype = dtype
+        self.store: Optional[EmbeddingStore] = None
+        self._model_id: Optional[str] = None
+
+    def open(self, model_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        self._model_id = model_id
+        if os.path.exists(os.path.join(self.path, "header.json")):
+            self.store = EmbeddingStore.open(self.path, writable=True)
+            return self.store.metadata.get("pipeline")
+        return None
+
+    def write(self, ids: List[str], matrix: "np.ndarray") -> None:
+        if self.store is None:
+            self.store = EmbeddingStore.create(self.path, self._model_id or "", matrix.shape[1], self.dtype)
+        self.store.append(ids, matrix)
+
+    def commit(self, checkpoint: Dict[str, Any]) -> None:
+        if self.store is not None:
+            self.store.flush({**self.store.metadata, "pipeline": checkpoint})
+
+    def close(self) -> None:
+        if self.store is not None:
+            # Rows written after the last commit are not covered by its checkpoint
+            self.store.close(flush=False)
+
+
+class _ShardSink(EmbeddingSink):
+    """
+    Writes every commit as one new shard file in a directory, then records the shard
+    count and checkpoint in checkpoint.json. Shards numbered past the checkpoint were
+    written by a crashed run and are removed when the sink is opened.
+    """
+    suffix = ""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.shards = 0
+        self._ids: List[str] = []
+        self._rows: List["np.ndarray"] = []
+
+    def shard_path(self, shard: int) -> str:
+        return os.path.join(self.directory, f"embeddings-{shard:05d}{self.suffix}")
+
+    def open(self, model_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        os.makedirs(self.directory, exist_ok=True)
+        state = {"shards": 0, "pipeline": None}
+        try:
+            with open(os.path.join(self.directory, "checkpoint.json"), "rb") as f:
+                state = loads(f.read())
+        except FileNotFoundError:
+            pass
+        self.shards = state["shards"]
+        self._ids, self._rows = [], []
+        for name in os.listdir(self.directory):
+            if name.startswith("embeddings-") and int(name[len("embeddings-"):][:5]) >= self.shards:
+                os.remove(os.path.join(self.directory, name))
+        return state["pipeline"]
+
+    def write(self, ids: List[str], matrix: "np.ndarray") -> None:
+        self._ids.extend(ids)
+        self._rows.append(matrix)
+
+    def commit(self, checkpoint: Dict[str, Any]) -> None:
+        if self._rows:
+            self._write_shard(self.shard_path(self.shards), self._ids, np.concatenate(self._rows))
+            self.shards += 1
+            self._ids, self._rows = [], []
+        state = json.dumps({"shards": self.shards, "pipeline": checkpoint}).encode("utf-8")
+        _write_atomic(os.path.join(self.directory, "checkpoint.json"), lambda f: f.write(state))
+
+    @abstractmethod
+    def _write_shard(self, path: str, ids: List[str], matrix: "np.ndarray") -> None:
+        """Write one shard file to path, atomically."""
+
+
+class NpyShardSink(_ShardSink):
+    """Writes each commit as embeddings-NNNNN.npy (float32 rows) and embeddings-NNNNN.ids.json (their ids)."""
+    suffix = ".npy"
+
+    def _write_shard(self, path: str, ids: List[str], matrix: "np.ndarray") -> None:
+        ids_path = path[:-len(self.suffix)] + ".ids.json"
+        _write_atomic(ids_path, lambda f: f.write(json.dumps(ids).encode("utf-8")))
+        _write_atomic(path, lambda f: np.save(f, matrix.astype(np.float32, copy=False)))
+
+
+class ParquetSink(_ShardSink):
+    """Writes each commit as embeddings-NNNNN.parquet with an id column and a fixed-size float32 list column."""
+    suffix = ".parquet"
+
+    def __init__(self, directory: str, compression: str = "zstd"):
+        """
+        Initialize the sink.
+
+        Args:
+            directory (str): Output directory, created if needed.
+            compression (str): Parquet compression codec. Defaults to "zstd".
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        # Imported here rather than at module level: pyarrow is slow to import and only this sink needs it
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("ParquetSink requires pyarrow. Install it with: pip install sify-ai-platform[parquet]")
+        super().__init__(directory)
+        self.compression = compression
+        self._pyarrow = pyarrow
+
+    def _write_shard(self, path: str, ids: List[str], matrix: "np.ndarray") -> None:
+        pyarrow = self._pyarrow
+        values = pyarrow.array(np.ascontiguousarray(matrix, dtype=np.float32).ravel())
+        table = pyarrow.table({
+            "id": pyarrow.array(ids, type=pyarrow.string()),
+            "embedding": pyarrow.FixedSizeListArray.from_arrays(values, matrix.shape[1])
+        })
+        _write_atomic(path, lambda f: pyarrow.parquet.write_table(table, f, compression=self.compression))
+
+
+class EmbeddingPipeline:
+    """
+    Streams records from an iterable (such as read_jsonl or read_csv) through
+    create_embeddings into a sink, in bounded memory.
+
+    Records are read lazily and grouped into batches of batch_size texts; at most
+    max_concurrency batches are requested at once, and results are written to the sink
+    in input order. Every commit_every batches the sink commits its rows together with
+    a checkpoint of how many records are done, so a job that crashes or is stopped
+    resumes by running the same pipeline again: the records already committed are
+    skipped (the input must yield them in the same order) and the sink drops anything
+    written after its last commit. Memory holds at most max_concurrency batches in
+    flight plus commit_every batches of vectors, whatever the size of the input.
+    """
+
+    def __init__(self, client: Any, sink: EmbeddingSink, batch_size: int = 256, max_concurrency: int = 4,
+                 commit_every: int = 16):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client (Any): ModelAsAService instance of the embedding model.
+            sink (EmbeddingSink): Output, e.g. EmbeddingStoreSink, NpyShardSink or ParquetSink.
+            batch_size (int): Texts per create_embeddings call. Defaults to 256.
+            max_concurrency (int): Maximum create_embeddings calls in flight. Defaults to 4.
+            commit_every (int): Batches per sink commit and checkpoint. Defaults to 16.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If a value is out of range.
+        """
+        require_numpy("EmbeddingPipeline")
+        if batch_size < 1 or max_concurrency < 1 or commit_every < 1:
+            raise ValueError("batch_size, max_concurrency and commit_every must be greater than 0")
+
+        self.client = client
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.commit_every = commit_every
+
+    def _embed(self, texts: List[str]) -> "np.ndarray":
+        matrix = self.client.create_embeddings(texts, as_numpy=True).matrix
+        if len(matrix) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, got {len(matrix)}")
+        return matrix
+
+    def run(self, records: Iterable[Record]) -> Dict[str, Any]:
+        """
+        Embed records into the sink, resuming from its last checkpoint.
+
+        Args:
+            records (Iterable[Record]): (id, text) pairs in a stable order.
+
+        Returns:
+            Dict[str, Any]: records (total committed), resumed_from (records skipped from an
+                earlier run), batches (sent by this run), seconds and records_per_second.
+
+        Raises:
+            ValueError: If a request fails, or the checkpoint was written for another model. Work
+                committed before the failure is kept, and running again resumes after it.
+        """
+        model_id = self.client.model_id
+        checkpoint = self.sink.open(model_id) or {"model": model_id, "records": 0}
+        if checkpoint.get("model") != model_id:
+            raise ValueError(f"The output holds embeddings of '{checkpoint['model']}', not '{model_id}'")
+
+        resumed_from = done = checkpoint["records"]
+        sent = uncommitted = 0
+        started_at = time.perf_counter()
+        source = islice(iter(records), resumed_from, None)
+        in_flight: Deque[Tuple[List[str], Future]] = deque()
+
+        def write_next() -> None:
+            nonlocal done, uncommitted
+            ids, future = in_flight.popleft()
+            self.sink.write(ids, future.result())
+            done += len(ids)
+            uncommitted += 1
+            if uncommitted >= self.commit_every:
+                self.sink.commit({"model": model_id, "records": done})
+                uncommitted = 0
+
+        with ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="sify-pipeline") as pool:
+            try:
+                while True:
+                    batch = list(islice(source, self.batch_size))
+                    if not batch:
+                        break
+                    if len(in_flight) >= self.max_concurrency:
+                        write_next()
+                    ids = [embedding_id for embedding_id, _ in batch]
+                    in_flight.append((ids, pool.submit(self._embed, [text for _, text in batch])))
+                    sent += 1
+                while in_flight:
+                    write_next()
+                self.sink.commit({"model": model_id, "records": done})
+            except BaseException:
+                for _, future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                self.sink.close()
+
+        elapsed = time.perf_counter() - started_at
+        return {
+            "records": done,
+            "resumed_from": resumed_from,
+            "batches": sent,
+            "seconds": elapsed,
+            "records_per_second": (done - resumed_from) / elapsed if elapsed else 0.0
+        }
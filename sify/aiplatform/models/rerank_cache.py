@@ -0,0 +1,133 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Request fields that change the scores, and so are part of the key
+SCORE_OPTIONS = ("max_chunks_per_doc",)
+
+# (result entry without its index, id of the response it came from)
+CachedResult = Tuple[Dict[str, Any], str]
+
+
+class RerankCache:
+    """
+    In-memory cache of rerank results.
+
+    Each document's result entry is stored as the server sent it, so a hit is returned
+    in the same shape as a fresh result. Entries are keyed by (model, query, scoring
+    options, return_documents, hash of the document text) and expire ttl seconds after
+    they were stored; when more than max_entries are held the least recently used ones
+    are evicted. Keys are fixed-size digests, so an entry takes a few hundred bytes
+    plus the document the server echoed, if any. The cache is shared safely between
+    threads and between the sync and async clients.
+
+    Caching assumes a document's score depends only on the query and the document,
+    which holds for cross-encoder rerankers; the clients refuse a rerank_cache together
+    with scores calibrated across a request, i.e. RerankBatching(anchors=...).
+    """
+
+    def __init__(self, max_entries: int = 100000, ttl: Optional[float] = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of results kept. Defaults to 100000.
+            ttl (Optional[float]): Seconds a result stays valid, None for no expiry. Defaults to 3600.0.
+
+        Raises:
+            ValueError: If max_entries or ttl is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # key -> (result entry, response id, expiry time), least recently used first
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], str, float]]" = OrderedDict()
+
+    @staticmethod
+    def _query_key(model: str, query: str, options: Optional[Dict[str, Any]]) -> bytes:
+        scoring = {name: options[name] for name in SCORE_OPTIONS if options and options.get(name) is not None}
+        return_documents = bool((options or {}).get("return_documents", True))
+        blob = json.dumps([model, query, scoring, return_documents], sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(blob, digest_size=16).digest()
+
+    @staticmethod
+    def _document_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get_many(self, model: str, query: str, texts: Sequence[str],
+                 options: Optional[Dict[str, Any]] = None) -> List[Optional[CachedResult]]:
+        """
+        Look up the results of documents for a query.
+
+        Args:
+            model (str): Rerank model.
+            query (str): The query.
+            texts (Sequence[str]): Document texts.
+            options (Optional[Dict[str, Any]]): The rerank request; its scoring options and
+                return_documents are part of the key.
+
+        Returns:
+            List[Optional[CachedResult]]: For each document its result entry, without the index, and
+                the id of the response it came from; None for a miss.
+        """
+        query_key = self._query_key(model, query, options)
+        keys = [query_key + self._document_key(text) for text in texts]
+        now = time.monotonic()
+        results: List[Optional[CachedResult]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[2] <= now:
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    results.append(None)
+                    continue
+                self._entries.move_to_end(key)
+                results.append((dict(entry[0]), entry[1]))
+            hits = sum(result is not None for result in results)
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def put_many(self, model: str, query: str, items: Sequence[Tuple[str, Dict[str, Any]]], response_id: str,
+                 options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store (document text, result entry) pairs from one rerank response, evicting the
+        least recently used entries if full. The entries' index fields are not stored.
+        """
+        query_key = self._query_key(model, query, options)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        entries = [(query_key + self._document_key(text),
+                    ({name: value for name, value in result.items() if name != "index"}, response_id, expires_at))
+                   for text, result in items]
+        with self._lock:
+            for key, entry in entries:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of entries, hits, misses and evictions."""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,406 @@
+import math
+import time
+from array import array
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+from sify.aiplatform.models.types import (
+    ChatChoice,
+    ChatCompletionChunk,
+    ChatCompletionResponse,
+    ChatMessage,
+    ChatUsage,
+    CompletionChoice,
+    CompletionChunk,
+    CompletionResponse,
+    CompletionUsage
+)
+
+
+class StreamStats:
+    """
+    Timing of a streamed completion.
+
+    Times are time.monotonic() seconds. A token is a chunk that carried text; most
+    servers send one token per chunk, so token_count approximates generated tokens.
+    """
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = started_at if started_at is not None else time.monotonic()
+        self.first_token_at: Optional[float] = None
+        self.last_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.chunk_count = 0
+        self.token_count = 0
+        self._intervals = array("d")
+
+    def record_chunk(self, has_text: bool, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self.chunk_count += 1
+        if not has_text:
+            return
+        self.token_count += 1
+        if self.first_token_at is None:
+            self.first_token_at = now
+        else:
+            self._intervals.append(now - self.last_token_at)
+        self.last_token_at = now
+
+    def finish(self) -> None:
+        if self.finished_at is None:
+            self.finished_at = time.monotonic()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from sending the request to the first chunk with text."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds from sending the request to the end of the stream."""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def mean_inter_token_latency(self) -> Optional[float]:
+        if not self._intervals:
+            return None
+        return sum(self._intervals) / len(self._intervals)
+
+    @property
+    def max_inter_token_latency(self) -> Optional[float]:
+        return max(self._intervals) if self._intervals else None
+
+    def inter_token_latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100] of the gaps between tokens."""
+        if not self._intervals:
+            return None
+        ordered = sorted(self._intervals)
+        rank = max(0, math.ceil(percentile / 100.0 * len(ordered)) - 1)
+        return ordered[min(rank, len(ordered) - 1)]
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Generation rate after the first token."""
+        if self.token_count < 2 or self.last_token_at == self.first_token_at:
+            return None
+        return (self.token_count - 1) / (self.last_token_at - self.first_token_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunk_count": self.chunk_count,
+            "token_count": self.token_count,
+            "time_to_first_token": self.time_to_first_token,
+            "duration": self.duration,
+            "mean_inter_token_latency": self.mean_inter_token_latency,
+            "p50_inter_token_latency": self.inter_token_latency_percentile(50),
+            "p95_inter_token_latency": self.inter_token_latency_percentile(95),
+            "max_inter_token_latency": self.max_inter_token_latency,
+            "tokens_per_second": self.tokens_per_second
+        }
+
+
+class _ChoiceState:
+    __slots__ = ("role", "parts", "finish_reason", "stop_reason", "logprobs")
+
+    def __init__(self):
+        self.role: Optional[str] = None
+        self.parts: List[str] = []
+        self.finish_reason: Optional[str] = None
+        self.stop_reason: Optional[str] = None
+        self.logprobs: Optional[Dict[str, Any]] = None
+
+
+class StreamAccumulator:
+    """
+    Collects streamed chat or text completion chunks into the non-streaming response.
+
+    Text deltas are kept as lists of parts per choice index and joined once when the
+    response is built, so accumulating is linear in the output length. The last usage
+    reported by the server wins; if the server reports none (for chat, pass
+    stream_options={"include_usage": True} to request it) completion_tokens is the
+    number of text chunks and prompt_tokens is 0, and usage_estimated is True.
+    """
+
+    def __init__(self, model: Optional[str] = None, started_at: Optional[float] = None):
+        """
+        Initialize the accumulator.
+
+        Args:
+            model (Optional[str]): Model reported if the chunks carry none. Defaults to None.
+            started_at (Optional[float]): time.monotonic() when the request was sent, used for
+                                          time to first token. Defaults to now.
+        """
+        self.id = ""
+        self.created = 0
+        self.model = model or ""
+        self.usage: Optional[ChatUsage] = None
+        self.stats = StreamStats(started_at)
+        self._choices: Dict[int, _ChoiceState] = {}
+
+    def add(self, chunk: Union[ChatCompletionChunk, CompletionChunk]) -> None:
+        """Consume one chunk."""
+        if not self.id and chunk.id:
+            self.id = chunk.id
+        if not self.created and chunk.created:
+            self.created = chunk.created
+        if chunk.model:
+            self.model = chunk.model
+        if chunk.usage is not None:
+            self.usage = chunk.usage
+
+        has_text = False
+        for choice in chunk.choices:
+            state = self._choices.get(choice.get("index", 0))
+            if state is None:
+                state = self._choices[choice.get("index", 0)] = _ChoiceState()
+
+            delta = choice.get("delta")
+            if delta:
+                if delta.get("role"):
+                    state.role = delta["role"]
+                text = delta.get("content")
+            else:
+                text = choice.get("text")
+            if text:
+                state.parts.append(text)
+                has_text = True
+
+            if choice.get("finish_reason") is not None:
+                state.finish_reason = choice["finish_reason"]
+            if choice.get("stop_reason") is not None:
+                state.stop_reason = choice["stop_reason"]
+            if choice.get("logprobs") is not None:
+                state.logprobs = choice["logprobs"]
+        self.stats.record_chunk(has_text)
+
+    @property
+    def usage_estimated(self) -> bool:
+        return self.usage is None
+
+    def text(self, index: int = 0) -> str:
+        """Return the text received so far for a choice."""
+        state = self._choices.get(index)
+        return "".join(state.parts) if state is not None else ""
+
+    def finish_reasons(self) -> Dict[int, Optional[str]]:
+        return {index: state.finish_reason for index, state in sorted(self._choices.items())}
+
+    def _usage_counts(self) -> Dict[str, int]:
+        if self.usage is not None:
+            return self.usage.to_dict()
+        completion_tokens = self.stats.token_count
+        return {"prompt_tokens": 0, "completion_tokens": completion_tokens, "total_tokens": completion_tokens}
+
+    def chat_completion_response(self) -> ChatCompletionResponse:
+        """Build the ChatCompletionResponse for the chunks added so far."""
+        choices = [
+            ChatChoice(
+                index=index,
+                message=ChatMessage(role=state.role or "assistant", content="".join(state.parts)),
+                finish_reason=state.finish_reason
+            )
+            for index, state in sorted(self._choices.items())
+        ]
+        return ChatCompletionResponse(
+            id=self.id,
+            object="chat.completion",
+            created=self.created,
+            model=self.model,
+            choices=choices,
+            usage=ChatUsage(**self._usage_counts())
+        )
+
+    def completion_response(self) -> CompletionResponse:
+        """Build the CompletionResponse for the chunks added so far."""
+        choices = [
+            CompletionChoice(
+                index=index,
+                text="".join(state.parts),
+                logprobs=state.logprobs,
+                finish_reason=state.finish_reason,
+                stop_reason=state.stop_reason
+            )
+            for index, state in sorted(self._choices.items())
+        ]
+        return CompletionResponse(
+            id=self.id,
+            object="text_completion",
+            created=self.created,
+            model=self.model,
+            choices=choices,
+            usage=CompletionUsage(**self._usage_counts())
+        )
+
+
+def _choice_text(chunk_data: Dict[str, Any]) -> Optional[str]:
+    for choice in chunk_data.get("choices") or ():
+        if choice.get("index", 0) == 0:
+            delta = choice.get("delta")
+            return delta.get("content") if delta else choice.get("text")
+    return None
+
+
+def iter_text(events: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the non-empty text deltas of choice 0 from decoded chat or text completion events."""
+    for chunk_data in events:
+        if isinstance(chunk_data, dict):
+            text = _choice_text(chunk_data)
+            if text:
+                yield text
+
+
+async def aiter_text(events: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Async version of iter_text."""
+    async for chunk_data in events:
+        if isinstance(chunk_data, dict):
+            text = _choice_text(chunk_data)
+            if text:
+                yield text
+
+
+class _Stream:
+    _chunk_type: type = ChatCompletionChunk
+
+    def __init__(self, chunks: Iterator[Dict[str, Any]], model: Optional[str] = None,
+                 started_at: Optional[float] = None):
+        self._chunks = chunks
+        self.accumulator = StreamAccumulator(model, started_at)
+
+    def __iter__(self) -> "_Stream":
+        return self
+
+    def __next__(self) -> Any:
+        while True:
+            try:
+                chunk_data = next(self._chunks)
+            except StopIteration:
+                self.accumulator.stats.finish()
+                raise
+            if not chunk_data or not isinstance(chunk_data, dict):
+                continue
+            chunk = self._chunk_type.from_dict(chunk_data)
+            self.accumulator.add(chunk)
+            return chunk
+
+    @property
+    def stats(self) -> StreamStats:
+        """Time to first token and inter-token latency of this stream."""
+        return self.accumulator.stats
+
+    def until_done(self) -> None:
+        """Consume the rest of the stream."""
+        for _ in self:
+            pass
+
+    def close(self) -> None:
+        """Stop reading and release the connection, e.g. when the consumer goes away early."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "_Stream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ChatCompletionStream(_Stream):
+    """
+    Iterator of ChatCompletionChunk objects returned by chat_completion(stream=True).
+
+    Every chunk is also added to a StreamAccumulator, so after (or instead of)
+    iterating, get_final_response() returns the assembled ChatCompletionResponse.
+    Use it as a context manager, or call close(), to release the connection when
+    not reading to the end; it is also released when the stream is garbage collected.
+    """
+
+    _chunk_type = ChatCompletionChunk
+
+    def get_final_response(self) -> ChatCompletionResponse:
+        """Consume the rest of the stream and return the complete response."""
+        self.until_done()
+        return self.accumulator.chat_completion_response()
+
+
+class CompletionStream(_Stream):
+    """Iterator of CompletionChunk objects returned by completion(stream=True); see ChatCompletionStream."""
+
+    _chunk_type = CompletionChunk
+
+    def get_final_response(self) -> CompletionResponse:
+        """Consume the rest of the stream and return the complete response."""
+        self.until_done()
+        return self.accumulator.completion_response()
+
+
+class _AsyncStream:
+    _chunk_type: type = ChatCompletionChunk
+
+    def __init__(self, chunks: AsyncIterator[Dict[str, Any]], model: Optional[str] = None,
+                 started_at: Optional[float] = None):
+        self._chunks = chunks
+        self.accumulator = StreamAccumulator(model, started_at)
+
+    def __aiter__(self) -> "_AsyncStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        while True:
+            try:
+                chunk_data = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self.accumulator.stats.finish()
+                raise
+            if not chunk_data or not isinstance(chunk_data, dict):
+                continue
+            chunk = self._chunk_type.from_dict(chunk_data)
+            self.accumulator.add(chunk)
+            return chunk
+
+    @property
+    def stats(self) -> StreamStats:
+        """Time to first token and inter-token latency of this stream."""
+        return self.accumulator.stats
+
+    async def until_done(self) -> None:
+        """Consume the rest of the stream."""
+        async for _ in self:
+            pass
+
+    async def aclose(self) -> None:
+        """Stop reading and release the connection, e.g. when the consumer goes away early."""
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "_AsyncStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class AsyncChatCompletionStream(_AsyncStream):
+    """Async version of ChatCompletionStream."""
+
+    _chunk_type = ChatCompletionChunk
+
+    async def get_final_response(self) -> ChatCompletionResponse:
+        """Consume the rest of the stream and return the complete response."""
+        await self.until_done()
+        return self.accumulator.chat_completion_response()
+
+
+class AsyncCompletionStream(_AsyncStream):
+    """Async version of CompletionStream."""
+
+    _chunk_type = CompletionChunk
+
+    async def get_final_response(self) -> CompletionResponse:
+        """Consume the rest of the stream and return the complete response."""
+        await self.until_done()
+        return self.accumulator.completion_response()
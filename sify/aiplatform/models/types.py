@@ -1,13 +1,127 @@
-from typing import Any, Dict, List, Optional, Union
-import json
+import base64
+import collections.abc
+import inspect
+import sys
+from array import array
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _NoExtra(collections.abc.Mapping):
+    """Empty read-only mapping shared by every object the API sent no unknown fields for."""
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "{}"
+
+    def __reduce__(self) -> str:
+        # Pickles and copies as the singleton
+        return "NO_EXTRA"
+
+
+NO_EXTRA: Mapping[str, Any] = _NoExtra()
+
+def decode_embedding(value: Union[str, List[float]]) -> Sequence[float]:
+    """
+    Decode an embedding sent with encoding_format="base64" (little-endian float32).
+
+    Returns a read-only float32 ndarray over the decoded bytes when numpy is installed,
+    otherwise an array('f'). Embeddings sent as a JSON list are returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+    raw = base64.b64decode(value)
+    if np is not None:
+        return np.frombuffer(raw, dtype="<f4")
+    values = array("f")
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+# Class -> names of the fields its __init__ takes, filled in on first use
+_KNOWN_FIELDS: Dict[type, frozenset] = {}
+
+
+def known_fields(cls: type) -> frozenset:
+    """Names of the fields cls takes as constructor parameters; the others go to its extra mapping."""
+    known = _KNOWN_FIELDS.get(cls)
+    if known is None:
+        parameters = inspect.signature(cls.__init__).parameters.values()
+        known = _KNOWN_FIELDS[cls] = frozenset(
+            parameter.name for parameter in parameters if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+    return known
+
+
+def _extra(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of data that cls has no parameter for, to keep in its extra mapping."""
+    known = known_fields(cls)
+    return {key: value for key, value in data.items() if key not in known}
+
+
+def _require_numpy(feature: str) -> None:
+    if np is None:
+        raise ImportError(f"{feature} requires numpy. Install it with: pip install sify-ai-platform[data]")
+
+
+def embedding_list(value: Union[str, List[float]]) -> List[float]:
+    """Decode an embedding like decode_embedding, but always return a list of floats."""
+    if isinstance(value, str):
+        return decode_embedding(value).tolist()
+    return value
+
+
+def _embedding_matrix(values: Sequence[Any]) -> "np.ndarray":
+    # Base64 vectors are decoded into one buffer, without a list of floats per vector
+    if values and all(isinstance(value, str) for value in values):
+        raw = bytearray()
+        size = None
+        for value in values:
+            decoded = base64.b64decode(value)
+            if size is None:
+                size = len(decoded)
+            if len(decoded) != size or size % 4:
+                raise ValueError("Embeddings have different dimensions and cannot form a matrix")
+            raw += decoded
+        return np.frombuffer(raw, dtype="<f4").astype(np.float32, copy=False).reshape(len(values), -1)
+    if not values:
+        return np.empty((0, 0), dtype=np.float32)
+    matrix = np.array([decode_embedding(value) for value in values], dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("Embeddings have different dimensions and cannot form a matrix")
+    return matrix
+
 
 class ModelInfo:
+    """
+    Model metadata. Fields the API returns beyond the known ones are kept in the
+    read-only extra mapping and can still be read as attributes.
+    """
+    __slots__ = ("id", "name", "model_type", "max_tokens", "dimensions", "language", "extra")
+
     id: str
     name: str
     model_type: str
-    max_tokens: Optional[int] = None
-    dimensions: Optional[int] = None
-    language: Optional[List[str]] = None
+    max_tokens: Optional[int]
+    dimensions: Optional[int]
+    language: Optional[List[str]]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, name: str, model_type: str, max_tokens: Optional[int] = None,
                  dimensions: Optional[int] = None, language: Optional[List[str]] = None, **kwargs):
@@ -19,8 +133,16 @@ class ModelInfo:
         self.language = language
 
         # Store any additional fields
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self.extra = kwargs or NO_EXTRA
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots
+        if name != "extra":
+            try:
+                return self.extra[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -34,6 +156,7 @@ class ModelInfo:
             result["dimensions"] = self.dimensions
         if self.language is not None:
             result["language"] = self.language
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -42,37 +165,64 @@ class ModelInfo:
 
 class ModelsListResponse:
     """Response object for listing models."""
+    __slots__ = ("models", "extra")
+
     models: List[ModelInfo]
+    extra: Mapping[str, Any]
 
-    def __init__(self, models: List[ModelInfo]):
+    def __init__(self, models: List[ModelInfo], **extra):
         self.models = models
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "models": [model.to_dict() for model in self.models]
+            "models": [model.to_dict() for model in self.models],
+            **self.extra
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ModelsListResponse":
         models = [ModelInfo.from_dict(model_data) for model_data in data.get("models", [])]
-        return cls(models=models)
+        return cls(models=models, **_extra(cls, data))
 
 class EmbeddingData:
-    """Individual embedding data."""
+    """
+    Individual embedding data. embedding is a list of floats however the server
+    encoded it; a base64 embedding is decoded on first access, so a caller that only
+    reads EmbeddingResponse.matrix never builds the list. EmbeddingResponse.as_numpy()
+    turns it into a row of a float32 matrix.
+    """
+    __slots__ = ("object", "_embedding", "index", "extra")
+
     object: str
-    embedding: List[float]
+    _embedding: Union[str, Sequence[float]]
     index: int
+    extra: Mapping[str, Any]
 
-    def __init__(self, object: str, embedding: List[float], index: int):
+    def __init__(self, object: str, embedding: Union[str, Sequence[float]], index: int, **extra):
         self.object = object
-        self.embedding = embedding
+        self._embedding = embedding
         self.index = index
+        self.extra = extra or NO_EXTRA
+
+    @property
+    def embedding(self) -> Sequence[float]:
+        embedding = self._embedding
+        if isinstance(embedding, str):
+            embedding = self._embedding = embedding_list(embedding)
+        return embedding
+
+    @embedding.setter
+    def embedding(self, value: Sequence[float]) -> None:
+        self._embedding = value
 
     def to_dict(self) -> Dict[str, Any]:
+        embedding = self.embedding
         return {
             "object": self.object,
-            "embedding": self.embedding,
-            "index": self.index
+            "embedding": embedding if isinstance(embedding, list) else embedding.tolist(),
+            "index": self.index,
+            **self.extra
         }
 
     @classmethod
@@ -80,52 +230,123 @@ class EmbeddingData:
         return cls(
             object=data["object"],
             embedding=data["embedding"],
-            index=data["index"]
+            index=data["index"],
+            **_extra(cls, data)
         )
 
 class EmbeddingUsage:
     """Usage statistics for embeddings."""
+    __slots__ = ("prompt_tokens", "total_tokens", "extra")
+
     prompt_tokens: int
     total_tokens: int
+    extra: Mapping[str, Any]
 
-    def __init__(self, prompt_tokens: int, total_tokens: int):
+    def __init__(self, prompt_tokens: int, total_tokens: int, **extra):
         self.prompt_tokens = prompt_tokens
         self.total_tokens = total_tokens
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "prompt_tokens": self.prompt_tokens,
-            "total_tokens": self.total_tokens
+            "total_tokens": self.total_tokens,
+            **self.extra
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingUsage":
         return cls(
             prompt_tokens=data["prompt_tokens"],
-            total_tokens=data["total_tokens"]
+            total_tokens=data["total_tokens"],
+            **_extra(cls, data)
         )
 
 class EmbeddingResponse:
     """Response object for embeddings."""
+    __slots__ = ("object", "data", "model", "usage", "extra", "_matrix")
+
     object: str
     data: List[EmbeddingData]
     model: str
     usage: EmbeddingUsage
+    extra: Mapping[str, Any]
 
-    def __init__(self, object: str, data: List[EmbeddingData], model: str, usage: EmbeddingUsage):
+    def __init__(self, object: str, data: List[EmbeddingData], model: str, usage: EmbeddingUsage, **extra):
         self.object = object
         self.data = data
         self.model = model
         self.usage = usage
+        self.extra = extra or NO_EXTRA
+
+    @property
+    def matrix(self) -> "np.ndarray":
+        """
+        The embeddings as a contiguous float32 array of shape (n, dim), where row i is
+        the embedding with index i. Built on first access and cached.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the embeddings do not all have the same dimension.
+        """
+        try:
+            return self._matrix
+        except AttributeError:
+            pass
+        _require_numpy("EmbeddingResponse.matrix")
+        ordered = sorted(self.data, key=attrgetter("index"))
+        # Undecoded base64 embeddings go straight into the matrix
+        matrix = _embedding_matrix([item._embedding for item in ordered])
+        self._matrix = matrix
+        return matrix
+
+    def as_numpy(self) -> "np.ndarray":
+        """
+        Convert the embeddings to NumPy in place and return matrix.
+
+        data is sorted by index and each item's embedding becomes the matching row of
+        matrix (a view, not a copy), so the Python float lists can be freed.
+
+        Returns:
+            np.ndarray: The float32 (n, dim) embedding matrix.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the embeddings do not all have the same dimension.
+        """
+        matrix = self.matrix
+        ordered = sorted(self.data, key=attrgetter("index"))
+        for item, row in zip(ordered, matrix):
+            item.embedding = row
+        self.data = ordered
+        return matrix
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "object": self.object,
             "data": [item.to_dict() for item in self.data],
             "model": self.model,
-            "usage": self.usage.to_dict()
+            "usage": self.usage.to_dict(),
+            **self.extra
         }
 
+    @classmethod
+    def from_dict_as_numpy(cls, data: Dict[str, Any]) -> "EmbeddingResponse":
+        """
+        Build the response and convert it like as_numpy(), decoding base64 embeddings
+        straight into the matrix instead of through lists of floats.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the embeddings do not all have the same dimension.
+        """
+        _require_numpy("EmbeddingResponse.as_numpy")
+        items = sorted(data["data"], key=itemgetter("index"))
+        matrix = _embedding_matrix([item["embedding"] for item in items])
+        response = cls.from_dict(dict(data, data=[dict(item, embedding=row) for item, row in zip(items, matrix)]))
+        response._matrix = matrix
+        return response
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingResponse":
         embedding_data = [EmbeddingData.from_dict(item) for item in data["data"]]
@@ -134,44 +355,55 @@ class EmbeddingResponse:
             object=data["object"],
             data=embedding_data,
             model=data["model"],
-            usage=usage
+            usage=usage,
+            **_extra(cls, data)
         )
 
 class ChatMessage:
     """Chat message object."""
+    __slots__ = ("role", "content", "extra")
+
     role: str
     content: str
+    extra: Mapping[str, Any]
 
-    def __init__(self, role: str, content: str):
+    def __init__(self, role: str, content: str, **extra):
         self.role = role
         self.content = content
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "role": self.role,
-            "content": self.content
+            "content": self.content,
+            **self.extra
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChatMessage":
-        return cls(role=data["role"], content=data["content"])
+        return cls(role=data["role"], content=data["content"], **_extra(cls, data))
 
 class ChatChoice:
     """Chat completion choice."""
+    __slots__ = ("index", "message", "finish_reason", "extra")
+
     index: int
     message: ChatMessage
     finish_reason: Optional[str]
+    extra: Mapping[str, Any]
 
-    def __init__(self, index: int, message: ChatMessage, finish_reason: Optional[str] = None):
+    def __init__(self, index: int, message: ChatMessage, finish_reason: Optional[str] = None, **extra):
         self.index = index
         self.message = message
         self.finish_reason = finish_reason
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "index": self.index,
             "message": self.message.to_dict(),
-            "finish_reason": self.finish_reason
+            "finish_reason": self.finish_reason,
+            **self.extra
         }
 
     @classmethod
@@ -180,25 +412,31 @@ class ChatChoice:
         return cls(
             index=data["index"],
             message=message,
-            finish_reason=data.get("finish_reason")
+            finish_reason=data.get("finish_reason"),
+            **_extra(cls, data)
         )
 
 class ChatUsage:
     """Usage statistics for chat completion."""
+    __slots__ = ("prompt_tokens", "completion_tokens", "total_tokens", "extra")
+
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    extra: Mapping[str, Any]
 
-    def __init__(self, prompt_tokens: int, completion_tokens: int, total_tokens: int):
+    def __init__(self, prompt_tokens: int, completion_tokens: int, total_tokens: int, **extra):
         self.prompt_tokens = prompt_tokens
         self.completion_tokens = completion_tokens
         self.total_tokens = total_tokens
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
-            "total_tokens": self.total_tokens
+            "total_tokens": self.total_tokens,
+            **self.extra
         }
 
     @classmethod
@@ -206,26 +444,31 @@ class ChatUsage:
         return cls(
             prompt_tokens=data["prompt_tokens"],
             completion_tokens=data["completion_tokens"],
-            total_tokens=data["total_tokens"]
+            total_tokens=data["total_tokens"],
+            **_extra(cls, data)
         )
 
 class ChatCompletionResponse:
     """Response object for chat completion."""
+    __slots__ = ("id", "object", "created", "model", "choices", "usage", "extra")
+
     id: str
     object: str
     created: int
     model: str
     choices: List[ChatChoice]
     usage: ChatUsage
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, object: str, created: int, model: str, 
-                 choices: List[ChatChoice], usage: ChatUsage):
+                 choices: List[ChatChoice], usage: ChatUsage, **extra):
         self.id = id
         self.object = object
         self.created = created
         self.model = model
         self.choices = choices
         self.usage = usage
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -234,7 +477,8 @@ class ChatCompletionResponse:
             "created": self.created,
             "model": self.model,
             "choices": [choice.to_dict() for choice in self.choices],
-            "usage": self.usage.to_dict()
+            "usage": self.usage.to_dict(),
+            **self.extra
         }
 
     @classmethod
@@ -247,21 +491,25 @@ class ChatCompletionResponse:
             created=data["created"],
             model=data["model"],
             choices=choices,
-            usage=usage
+            usage=usage,
+            **_extra(cls, data)
         )
 
 class ChatCompletionChunk:
     """Streaming chat completion chunk."""
+    __slots__ = ("id", "object", "created", "model", "choices", "usage", "stream_summary", "extra")
+
     id: str
     object: str
     created: int
     model: str
     choices: List[Dict[str, Any]]
-    usage: Optional[ChatUsage] = None
-    stream_summary: Optional[Dict[str, Any]] = None
+    usage: Optional[ChatUsage]
+    stream_summary: Optional[Dict[str, Any]]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, object: str, created: int, model: str, choices: List[Dict[str, Any]], 
-                 usage: Optional[ChatUsage] = None, stream_summary: Optional[Dict[str, Any]] = None):
+                 usage: Optional[ChatUsage] = None, stream_summary: Optional[Dict[str, Any]] = None, **extra):
         self.id = id
         self.object = object
         self.created = created
@@ -269,6 +517,7 @@ class ChatCompletionChunk:
         self.choices = choices
         self.usage = usage
         self.stream_summary = stream_summary
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -282,6 +531,7 @@ class ChatCompletionChunk:
             result["usage"] = self.usage.to_dict()
         if self.stream_summary:
             result["stream_summary"] = self.stream_summary
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -297,26 +547,31 @@ class ChatCompletionChunk:
             model=data.get("model", ""),
             choices=data.get("choices", []),
             usage=usage,
-            stream_summary=data.get("stream_summary")
+            stream_summary=data.get("stream_summary"),
+            **_extra(cls, data)
         )
     
 class CompletionChunk:
     """Streaming completion chunk."""
+    __slots__ = ("id", "object", "created", "model", "choices", "usage", "extra")
+
     id: str
     object: str
     created: int
     model: str
     choices: List[Dict[str, Any]]
-    usage: Optional[ChatUsage] = None
+    usage: Optional[ChatUsage]
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, object: str, created: int, model: str, choices: List[Dict[str, Any]], 
-                 usage: Optional[ChatUsage] = None):
+                 usage: Optional[ChatUsage] = None, **extra):
         self.id = id
         self.object = object
         self.created = created
         self.model = model
         self.choices = choices
         self.usage = usage
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -328,6 +583,7 @@ class CompletionChunk:
         }
         if self.usage:
             result["usage"] = self.usage.to_dict()
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -343,52 +599,66 @@ class CompletionChunk:
             model=data.get("model", ""),
             choices=data.get("choices", []),
             usage=usage,
+            **_extra(cls, data)
         )
 
 class AudioTranscriptionResponse:
     """Response object for audio transcription."""
+    __slots__ = ("text", "extra")
+
     text: str
+    extra: Mapping[str, Any]
 
-    def __init__(self, text: str):
+    def __init__(self, text: str, **extra):
         self.text = text
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"text": self.text}
+        return {"text": self.text, **self.extra}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AudioTranscriptionResponse":
-        return cls(text=data["text"])
+        return cls(text=data["text"], **_extra(cls, data))
 
 class AudioTranslationResponse:
     """Response object for audio translation."""
+    __slots__ = ("text", "extra")
+
     text: str
+    extra: Mapping[str, Any]
 
-    def __init__(self, text: str):
+    def __init__(self, text: str, **extra):
         self.text = text
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"text": self.text}
+        return {"text": self.text, **self.extra}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AudioTranslationResponse":
-        return cls(text=data["text"])
+        return cls(text=data["text"], **_extra(cls, data))
 
 class RerankDocument:
     """Document for reranking."""
+    __slots__ = ("index", "relevance_score", "document", "extra")
+
     index: int
     relevance_score: float
     document: Union[str, Dict[str, Any]]
+    extra: Mapping[str, Any]
 
-    def __init__(self, index: int, relevance_score: float, document: Union[str, Dict[str, Any]]):
+    def __init__(self, index: int, relevance_score: float, document: Union[str, Dict[str, Any]], **extra):
         self.index = index
         self.relevance_score = relevance_score
         self.document = document
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "index": self.index,
             "relevance_score": self.relevance_score,
-            "document": self.document
+            "document": self.document,
+            **self.extra
         }
 
     @classmethod
@@ -396,19 +666,24 @@ class RerankDocument:
         return cls(
             index=data["index"],
             relevance_score=data["relevance_score"],
-            document=data["document"]
+            document=data["document"],
+            **_extra(cls, data)
         )
 
 class RerankResponse:
     """Response object for document reranking."""
+    __slots__ = ("id", "results", "meta", "extra")
+
     id: str
     results: List[RerankDocument]
-    meta: Optional[Dict[str, Any]] = None
+    meta: Optional[Dict[str, Any]]
+    extra: Mapping[str, Any]
 
-    def __init__(self, id: str, results: List[RerankDocument], meta: Optional[Dict[str, Any]] = None):
+    def __init__(self, id: str, results: List[RerankDocument], meta: Optional[Dict[str, Any]] = None, **extra):
         self.id = id
         self.results = results
         self.meta = meta
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -417,6 +692,7 @@ class RerankResponse:
         }
         if self.meta:
             result["meta"] = self.meta
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -425,27 +701,32 @@ class RerankResponse:
         return cls(
             id=data["id"],
             results=results,
-            meta=data.get("meta")
+            meta=data.get("meta"),
+            **_extra(cls, data)
         )
 
 class CompletionChoice:
     """Text completion choice."""
+    __slots__ = ("index", "text", "logprobs", "finish_reason", "stop_reason", "prompt_logprobs", "extra")
+
     index: int
     text: str
-    logprobs: Optional[Dict[str, Any]] = None
-    finish_reason: Optional[str] = None
-    stop_reason: Optional[str] = None
-    prompt_logprobs: Optional[Dict[str, Any]] = None
+    logprobs: Optional[Dict[str, Any]]
+    finish_reason: Optional[str]
+    stop_reason: Optional[str]
+    prompt_logprobs: Optional[Dict[str, Any]]
+    extra: Mapping[str, Any]
 
     def __init__(self, index: int, text: str, logprobs: Optional[Dict[str, Any]] = None,
                  finish_reason: Optional[str] = None, stop_reason: Optional[str] = None,
-                 prompt_logprobs: Optional[Dict[str, Any]] = None):
+                 prompt_logprobs: Optional[Dict[str, Any]] = None, **extra):
         self.index = index
         self.text = text
         self.logprobs = logprobs
         self.finish_reason = finish_reason
         self.stop_reason = stop_reason
         self.prompt_logprobs = prompt_logprobs
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -460,6 +741,7 @@ class CompletionChoice:
             result["stop_reason"] = self.stop_reason
         if self.prompt_logprobs is not None:
             result["prompt_logprobs"] = self.prompt_logprobs
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -470,25 +752,31 @@ class CompletionChoice:
             logprobs=data.get("logprobs"),
             finish_reason=data.get("finish_reason"),
             stop_reason=data.get("stop_reason"),
-            prompt_logprobs=data.get("prompt_logprobs")
+            prompt_logprobs=data.get("prompt_logprobs"),
+            **_extra(cls, data)
         )
 
 class CompletionUsage:
     """Usage statistics for text completion."""
+    __slots__ = ("prompt_tokens", "total_tokens", "completion_tokens", "extra")
+
     prompt_tokens: int
     total_tokens: int
     completion_tokens: int
+    extra: Mapping[str, Any]
 
-    def __init__(self, prompt_tokens: int, total_tokens: int, completion_tokens: int):
+    def __init__(self, prompt_tokens: int, total_tokens: int, completion_tokens: int, **extra):
         self.prompt_tokens = prompt_tokens
         self.total_tokens = total_tokens
         self.completion_tokens = completion_tokens
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "prompt_tokens": self.prompt_tokens,
             "total_tokens": self.total_tokens,
-            "completion_tokens": self.completion_tokens
+            "completion_tokens": self.completion_tokens,
+            **self.extra
         }
 
     @classmethod
@@ -496,26 +784,31 @@ class CompletionUsage:
         return cls(
             prompt_tokens=data["prompt_tokens"],
             total_tokens=data["total_tokens"],
-            completion_tokens=data["completion_tokens"]
+            completion_tokens=data["completion_tokens"],
+            **_extra(cls, data)
         )
 
 class CompletionResponse:
     """Response object for text completion."""
+    __slots__ = ("id", "object", "created", "model", "choices", "usage", "extra")
+
     id: str
     object: str
     created: int
     model: str
     choices: List[CompletionChoice]
     usage: CompletionUsage
+    extra: Mapping[str, Any]
 
     def __init__(self, id: str, object: str, created: int, model: str, 
-                 choices: List[CompletionChoice], usage: CompletionUsage):
+                 choices: List[CompletionChoice], usage: CompletionUsage, **extra):
         self.id = id
         self.object = object
         self.created = created
         self.model = model
         self.choices = choices
         self.usage = usage
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -524,7 +817,8 @@ class CompletionResponse:
             "created": self.created,
             "model": self.model,
             "choices": [choice.to_dict() for choice in self.choices],
-            "usage": self.usage.to_dict()
+            "usage": self.usage.to_dict(),
+            **self.extra
         }
 
     @classmethod
@@ -537,20 +831,41 @@ class CompletionResponse:
             created=data["created"],
             model=data["model"],
             choices=choices,
-            usage=usage
+            usage=usage,
+            **_extra(cls, data)
         )
 
+class APIRequestError(ValueError):
+    """
+    ValueError for a request the API did not complete: an error response, with its
+    status_code, or a timeout or connection failure, with status_code None.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def transient(self) -> bool:
+        """True for timeouts, connection failures, 429 and 5xx, which may succeed if sent again."""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
 class APIError:
     """API error response."""
+    __slots__ = ("error", "details", "status_code", "extra")
+
     error: str
-    details: Optional[Union[str, Dict[str, Any]]] = None
-    status_code: Optional[int] = None
+    details: Optional[Union[str, Dict[str, Any]]]
+    status_code: Optional[int]
+    extra: Mapping[str, Any]
 
     def __init__(self, error: str, details: Optional[Union[str, Dict[str, Any]]] = None, 
-                 status_code: Optional[int] = None):
+                 status_code: Optional[int] = None, **extra):
         self.error = error
         self.details = details
         self.status_code = status_code
+        self.extra = extra or NO_EXTRA
 
     def to_dict(self) -> Dict[str, Any]:
         result = {"error": self.error}
@@ -558,6 +873,7 @@ class APIError:
             result["details"] = self.details
         if self.status_code is not None:
             result["status_code"] = self.status_code
+        result.update(self.extra)
         return result
 
     @classmethod
@@ -565,7 +881,8 @@ class APIError:
         return cls(
             error=data["error"],
             details=data.get("details"),
-            status_code=data.get("status_code")
+            status_code=data.get("status_code"),
+            **_extra(cls, data)
         )
 
     def __str__(self) -> str:
@@ -0,0 +1,545 @@
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sify.aiplatform.models._vectors import merge_top_k, normalize, require_numpy, top_k
+from sify.aiplatform.models.types import EmbeddingResponse, np
+
+METRICS = ("cosine", "dot")
+
+_MAGIC = b"SIFYVIX1"
+_ALIGN = 64
+
+# Cells of the temporary (queries x rows) score matrix per block, i.e. 64 MB of float32
+_BLOCK_CELLS = 1 << 24
+
+# Queries scored together by the brute-force search
+_QUERY_CHUNK = 1024
+
+# k-means runs on at most this many sampled vectors per list
+_TRAIN_POINTS_PER_LIST = 64
+
+# kind -> index class, for VectorIndex.load
+_INDEX_TYPES: Dict[str, Type["VectorIndex"]] = {}
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _write_arrays(path: str, header: Dict[str, Any], arrays: Dict[str, List["np.ndarray"]]) -> None:
+    """
+    Write a header and arrays (each given as chunks concatenated along the first axis)
+    to path: magic, header length, JSON header, then each array little-endian and
+    64-byte aligned. The file is written next to path and renamed over it.
+    """
+    specs = {}
+    offset = 0
+    for name, chunks in arrays.items():
+        dtype = chunks[0].dtype.newbyteorder("<")
+        shape = [sum(len(chunk) for chunk in chunks), *chunks[0].shape[1:]]
+        offset = _aligned(offset)
+        specs[name] = {"dtype": dtype.str, "shape": shape, "offset": offset}
+        offset += math.prod(shape) * dtype.itemsize
+    blob = json.dumps({**header, "arrays": specs}).encode("utf-8")
+    data_start = _aligned(len(_MAGIC) + 8 + len(blob))
+
+    temporary = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(blob).to_bytes(8, "little"))
+            f.write(blob)
+            for name, chunks in arrays.items():
+                f.seek(data_start + specs[name]["offset"])
+                dtype = np.dtype(specs[name]["dtype"])
+                for chunk in chunks:
+                    np.ascontiguousarray(chunk, dtype=dtype).tofile(f)
+            # Pad to the end of the last array so every slice of the mapping is in the file
+            f.truncate(data_start + offset)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _read_arrays(path: str, mmap: bool) -> Tuple[Dict[str, Any], Dict[str, "np.ndarray"]]:
+    """Read a file written by _write_arrays; with mmap the arrays are read-only views of the mapped file."""
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a vector index file")
+        length = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(length))
+    data_start = _aligned(len(_MAGIC) + 8 + length)
+
+    buffer = np.memmap(path, dtype=np.uint8, mode="r") if mmap else np.fromfile(path, dtype=np.uint8)
+    arrays = {}
+    for name, spec in header.pop("arrays").items():
+        dtype = np.dtype(spec["dtype"])
+        start = data_start + spec["offset"]
+        size = math.prod(spec["shape"]) * dtype.itemsize
+        arrays[name] = buffer[start:start + size].view(dtype).reshape(spec["shape"])
+    return header, arrays
+
+
+class _Rows:
+    """Growable (vectors, ids) storage. Read-only arrays, e.g. mapped from a file, are copied on first write."""
+    __slots__ = ("vectors", "ids", "size")
+
+    def __init__(self, dim: int, vectors: Optional["np.ndarray"] = None, ids: Optional["np.ndarray"] = None):
+        self.vectors = np.empty((0, dim), dtype=np.float32) if vectors is None else vectors
+        self.ids = np.empty(0, dtype=np.int64) if ids is None else ids
+        self.size = len(self.ids)
+
+    def view(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        return self.vectors[:self.size], self.ids[:self.size]
+
+    def append(self, vectors: "np.ndarray", ids: "np.ndarray") -> None:
+        end = self.size + len(ids)
+        if end > len(self.ids) or not self.ids.flags.writeable:
+            capacity = max(end, 2 * self.size, 16)
+            grown = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.vectors[:self.size]
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            grown_ids[:self.size] = self.ids[:self.size]
+            self.vectors, self.ids = grown, grown_ids
+        self.vectors[self.size:end] = vectors
+        self.ids[self.size:end] = ids
+        self.size = end
+
+    def remove(self, ids: "np.ndarray") -> int:
+        vectors, own_ids = self.view()
+        keep = ~np.isin(own_ids, ids)
+        removed = self.size - int(keep.sum())
+        if removed:
+            self.vectors, self.ids = vectors[keep], own_ids[keep]
+            self.size = len(self.ids)
+        return removed
+
+
+class VectorIndex(ABC):
+    """
+    Base of the in-process vector indexes.
+
+    Vectors are float32 rows identified by int64 ids. With metric="cosine" they are
+    normalized on the way in, so scores are cosine similarities; with metric="dot"
+    they are stored as given and scored by inner product. Vectors and queries can be
+    arrays, lists of floats or an EmbeddingResponse from create_embeddings, so a
+    corpus embedded once can be searched without another round trip:
+
+        index = FlatIndex(dim=1024)
+        index.add(client.create_embeddings(texts))
+        scores, ids = index.search(client.create_embeddings(query), k=5)
+
+    An index is not safe for concurrent writes; concurrent searches are fine.
+
+    Subclasses set kind, the name save() records for load(), and implement the
+    abstract methods below; _header() adds their own settings to the saved header.
+    """
+    kind = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _INDEX_TYPES[cls.kind] = cls
+
+    def __init__(self, dim: int, metric: str = "cosine"):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim (int): Vector dimensions.
+            metric (str): "cosine" or "dot". Defaults to "cosine".
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If dim is not positive or the metric is unknown.
+        """
+        require_numpy("VectorIndex")
+        if dim < 1:
+            raise ValueError("dim must be greater than 0")
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+
+        self.dim = dim
+        self.metric = metric
+        self._next_id = 0
+
+    def _prepare(self, vectors: Any) -> "np.ndarray":
+        if isinstance(vectors, EmbeddingResponse):
+            vectors = vectors.matrix
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1) if matrix.size else matrix.reshape(0, self.dim)
+        if matrix.ndim != 2 or (len(matrix) and matrix.shape[1] != self.dim):
+            raise ValueError(f"Expected vectors of {self.dim} dimensions, got shape {matrix.shape}")
+        return normalize(matrix) if self.metric == "cosine" else matrix
+
+    def _ids_for(self, count: int, ids: Any) -> "np.ndarray":
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+            if len(ids) != count:
+                raise ValueError(f"Got {len(ids)} ids for {count} vectors")
+            if len(np.unique(ids)) != count:
+                raise ValueError("ids must be unique")
+        if count:
+            self._next_id = max(self._next_id, int(ids.max()) + 1)
+        return ids
+
+    def add(self, vectors: Any, ids: Any = None) -> "np.ndarray":
+        """
+        Add vectors to the index. Adding an id that is already present replaces its vector.
+
+        Args:
+            vectors (Any): (n, dim) array, list of vectors or EmbeddingResponse.
+            ids (Any): n int64 ids. Defaults to consecutive ids after the largest one used so far.
+
+        Returns:
+            np.ndarray: The ids of the added vectors.
+
+        Raises:
+            ValueError: If the vectors have the wrong shape or ids do not match them.
+        """
+        matrix = self._prepare(vectors)
+        replace = ids is not None
+        ids = self._ids_for(len(matrix), ids)
+        if len(matrix):
+            if replace:
+                self.delete(ids)
+            self._add(matrix, ids)
+        return ids
+
+    def delete(self, ids: Any) -> int:
+        """Remove vectors by id and return how many were present."""
+        return self._delete(np.asarray(ids, dtype=np.int64).reshape(-1))
+
+    def search(self, queries: Any, k: int = 10) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Find the k best-scoring vectors for each query.
+
+        Args:
+            queries (Any): A vector, an (n, dim) array or list of vectors, or an EmbeddingResponse.
+            k (int): Results per query. Defaults to 10.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (scores, ids), each (n, k) with rows sorted by descending
+                score, or (k,) for a single vector query. Missing results have id -1 and score -inf.
+
+        Raises:
+            ValueError: If k is not positive or the queries have the wrong shape.
+        """
+        return self._search_with(queries, k)
+
+    def _search_with(self, queries: Any, k: int, **options: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+        if k < 1:
+            raise ValueError("k must be greater than 0")
+        single = not isinstance(queries, EmbeddingResponse) and np.ndim(queries) == 1
+        matrix = self._prepare(queries)
+        scores = np.full((len(matrix), k), -np.inf, dtype=np.float32)
+        ids = np.full((len(matrix), k), -1, dtype=np.int64)
+        if len(self):
+            scores, ids = self._search(matrix, k, scores, ids, **options)
+        return (scores[0], ids[0]) if single else (scores, ids)
+
+    def save(self, path: str) -> None:
+        """Write the index to path in a format VectorIndex.load can memory-map."""
+        header = {"kind": self.kind, "dim": self.dim, "metric": self.metric, "next_id": self._next_id}
+        header.update(self._header())
+        _write_arrays(path, header, self._arrays())
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "VectorIndex":
+        """
+        Load an index written by save.
+
+        With mmap the vectors stay in the file and are paged in by the OS as searches
+        touch them, so processes loading the same file share the memory. The mapped
+        arrays are read-only; the parts of the index that are later changed are copied
+        into memory first, and the file itself is never modified.
+
+        Args:
+            path (str): Path of the index file.
+            mmap (bool): Map the file instead of reading it into memory. Defaults to True.
+
+        Returns:
+            VectorIndex: The index, of the class that saved it.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the file is not an index file, or holds another kind of index than cls.
+        """
+        require_numpy("VectorIndex")
+        header, arrays = _read_arrays(path, mmap)
+        index_type = _INDEX_TYPES.get(header["kind"])
+        if index_type is None or not issubclass(index_type, cls):
+            raise ValueError(f"{path} holds a {header['kind']} index, not a {cls.__name__}")
+        index = index_type.__new__(index_type)
+        VectorIndex.__init__(index, header["dim"], header["metric"])
+        index._next_id = header["next_id"]
+        index._restore(header, arrays)
+        return index
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of vectors in the index."""
+
+    @abstractmethod
+    def _add(self, matrix: "np.ndarray", ids: "np.ndarray") -> None:
+        """Store prepared rows under ids that are not in the index."""
+
+    @abstractmethod
+    def _delete(self, ids: "np.ndarray") -> int:
+        """Remove ids and return how many were present."""
+
+    @abstractmethod
+    def _search(self, matrix: "np.ndarray", k: int, scores: "np.ndarray", ids: "np.ndarray",
+                **options: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Fold the k best rows for each prepared query into the running (scores, ids) and return them sorted."""
+
+    def _header(self) -> Dict[str, Any]:
+        return {}
+
+    @abstractmethod
+    def _arrays(self) -> Dict[str, List["np.ndarray"]]:
+        """Arrays to save, each as chunks concatenated along the first axis."""
+
+    @abstractmethod
+    def _restore(self, header: Dict[str, Any], arrays: Dict[str, "np.ndarray"]) -> None:
+        """Rebuild the index from a loaded header and its (possibly memory-mapped) arrays."""
+
+
+class FlatIndex(VectorIndex):
+    """
+    Exact search by brute force: every query is scored against every vector with one
+    matrix product per block of rows. Best for corpora up to a few hundred thousand
+    vectors, and as the ground truth when tuning an IVFIndex.
+    """
+    kind = "flat"
+
+    def __init__(self, dim: int, metric: str = "cosine"):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim (int): Vector dimensions.
+            metric (str): "cosine" or "dot". Defaults to "cosine".
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If dim is not positive or the metric is unknown.
+        """
+        super().__init__(dim, metric)
+        self._rows = _Rows(dim)
+
+    def __len__(self) -> int:
+        return self._rows.size
+
+    def _add(self, matrix: "np.ndarray", ids: "np.ndarray") -> None:
+        self._rows.append(matrix, ids)
+
+    def _delete(self, ids: "np.ndarray") -> int:
+        return self._rows.remove(ids)
+
+    def _search(self, matrix: "np.ndarray", k: int, scores: "np.ndarray", ids: "np.ndarray",
+                **options: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+        vectors, row_ids = self._rows.view()
+        for start in range(0, len(matrix), _QUERY_CHUNK):
+            queries = matrix[start:start + _QUERY_CHUNK]
+            block = max(k, _BLOCK_CELLS // len(queries))
+            best_scores, best_ids = scores[start:start + len(queries)], ids[start:start + len(queries)]
+            for row in range(0, len(vectors), block):
+                candidates = top_k(queries @ vectors[row:row + block].T, row_ids[row:row + block], k)
+                best_scores, best_ids = merge_top_k(best_scores, best_ids, *candidates, k)
+            scores[start:start + len(queries)], ids[start:start + len(queries)] = best_scores, best_ids
+        return scores, ids
+
+    def _arrays(self) -> Dict[str, List["np.ndarray"]]:
+        vectors, ids = self._rows.view()
+        return {"vectors": [vectors], "ids": [ids]}
+
+    def _restore(self, header: Dict[str, Any], arrays: Dict[str, "np.ndarray"]) -> None:
+        self._rows = _Rows(self.dim, arrays["vectors"], arrays["ids"])
+
+
+class IVFIndex(VectorIndex):
+    """
+    Approximate search over an inverted file: k-means partitions the vectors into
+    n_lists clusters, and a query is only scored against the vectors of the n_probe
+    clusters whose centroids score best for it. Raising n_probe trades speed for
+    recall; n_probe = n_lists is an exact search. Vectors are assigned to clusters
+    by the same score the index searches with, so both steps agree for "dot" too.
+
+    The centroids are trained on the first vectors added (or explicitly with train),
+    so that batch should be representative of the corpus. Later additions are
+    assigned to the best-scoring existing centroid; call train again to rebalance
+    the lists after the corpus has drifted.
+    """
+    kind = "ivf"
+
+    def __init__(self, dim: int, metric: str = "cosine", n_lists: Optional[int] = None, n_probe: int = 16):
+        """
+        Initialize an empty, untrained index.
+
+        Args:
+            dim (int): Vector dimensions.
+            metric (str): "cosine" or "dot". Defaults to "cosine".
+            n_lists (Optional[int]): Number of clusters. Defaults to sqrt(n) for the n training vectors.
+            n_probe (int): Clusters scored per query. Defaults to 16.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If a value is out of range or the metric is unknown.
+        """
+        super().__init__(dim, metric)
+        if n_lists is not None and n_lists < 1:
+            raise ValueError("n_lists must be greater than 0")
+        if n_probe < 1:
+            raise ValueError("n_probe must be greater than 0")
+
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.centroids: Optional["np.ndarray"] = None
+        self._lists: List[_Rows] = []
+
+    def __len__(self) -> int:
+        return sum(rows.size for rows in self._lists)
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def train(self, vectors: Any, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train the centroids with k-means. Vectors already in the index are reassigned to the new lists.
+
+        Args:
+            vectors (Any): Training vectors, at least n_lists of them; a sample is used when there are many.
+            iterations (int): k-means iterations. Defaults to 10.
+            seed (int): Seed of the sampling and initial centroids. Defaults to 0.
+
+        Raises:
+            ValueError: If there are fewer training vectors than lists.
+        """
+        self._train(self._prepare(vectors), iterations, seed)
+
+    def _train(self, matrix: "np.ndarray", iterations: int = 10, seed: int = 0) -> None:
+        n_lists = self.n_lists or max(1, min(len(matrix), int(math.sqrt(len(matrix)))))
+        if len(matrix) < n_lists:
+            raise ValueError(f"Training needs at least n_lists ({n_lists}) vectors, got {len(matrix)}")
+
+        rng = np.random.default_rng(seed)
+        if len(matrix) > n_lists * _TRAIN_POINTS_PER_LIST:
+            matrix = matrix[rng.choice(len(matrix), n_lists * _TRAIN_POINTS_PER_LIST, replace=False)]
+        centroids = matrix[rng.choice(len(matrix), n_lists, replace=False)]
+        for _ in range(iterations):
+            labels = self._assign(matrix, centroids)
+            counts = np.bincount(labels, minlength=n_lists)
+            filled = np.flatnonzero(counts)
+            starts = np.concatenate([[0], np.cumsum(counts[filled])[:-1]])
+            sums = np.add.reduceat(matrix[np.argsort(labels, kind="stable")], starts, axis=0)
+            empty = np.flatnonzero(counts == 0)
+            centroids[filled] = sums / counts[filled, None]
+            # Empty clusters restart from random vectors
+            centroids[empty] = matrix[rng.choice(len(matrix), len(empty), replace=False)]
+            if self.metric == "cosine":
+                centroids = normalize(centroids)
+
+        existing = [rows.view() for rows in self._lists]
+        self.n_lists = n_lists
+        self.centroids = centroids.astype(np.float32)
+        self._lists = [_Rows(self.dim) for _ in range(n_lists)]
+        for vectors, ids in existing:
+            if len(ids):
+                self._add(vectors, ids)
+
+    def _assign(self, matrix: "np.ndarray", centroids: "np.ndarray") -> "np.ndarray":
+        # Best centroid by inner product, the score search probes lists with. For cosine
+        # the centroids are unit length, so this is also the nearest by Euclidean distance.
+        block = max(1, _BLOCK_CELLS // len(centroids))
+        return np.concatenate([
+            np.argmax(matrix[start:start + block] @ centroids.T, axis=1)
+            for start in range(0, len(matrix), block)
+        ]) if len(matrix) else np.empty(0, dtype=np.int64)
+
+    def _add(self, matrix: "np.ndarray", ids: "np.ndarray") -> None:
+        if self.centroids is None:
+            self._train(matrix)
+        labels = self._assign(matrix, self.centroids)
+        order = np.argsort(labels, kind="stable")
+        lists, starts = np.unique(labels[order], return_index=True)
+        for lst, part in zip(lists, np.split(order, starts[1:])):
+            self._lists[lst].append(matrix[part], ids[part])
+
+    def _delete(self, ids: "np.ndarray") -> int:
+        return sum(rows.remove(ids) for rows in self._lists if rows.size)
+
+    def search(self, queries: Any, k: int = 10, n_probe: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Find the (approximately) k best-scoring vectors for each query.
+
+        Args:
+            queries (Any): A vector, an (n, dim) array or list of vectors, or an EmbeddingResponse.
+            k (int): Results per query. Defaults to 10.
+            n_probe (Optional[int]): Clusters scored per query. Defaults to the index's n_probe.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (scores, ids), each (n, k) with rows sorted by descending
+                score, or (k,) for a single vector query. Missing results have id -1 and score -inf.
+
+        Raises:
+            ValueError: If k or n_probe is not positive or the queries have the wrong shape.
+        """
+        if n_probe is not None and n_probe < 1:
+            raise ValueError("n_probe must be greater than 0")
+        return self._search_with(queries, k, n_probe=n_probe or self.n_probe)
+
+    def _search(self, matrix: "np.ndarray", k: int, scores: "np.ndarray", ids: "np.ndarray",
+                **options: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+        n_probe = min(options["n_probe"], self.n_lists)
+        centroid_scores = matrix @ self.centroids.T
+        if n_probe < self.n_lists:
+            probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+        else:
+            probes = np.broadcast_to(np.arange(self.n_lists), centroid_scores.shape)
+
+        # Group the (query, list) pairs by list so each list is scored once for all queries probing it
+        lists = probes.ravel()
+        order = np.argsort(lists, kind="stable")
+        queries_of = np.repeat(np.arange(len(matrix)), n_probe)[order]
+        probed, starts = np.unique(lists[order], return_index=True)
+        for lst, queries in zip(probed, np.split(queries_of, starts[1:])):
+            vectors, row_ids = self._lists[lst].view()
+            if not len(row_ids):
+                continue
+            candidates = top_k(matrix[queries] @ vectors.T, row_ids, k)
+            scores[queries], ids[queries] = merge_top_k(scores[queries], ids[queries], *candidates, k)
+        return scores, ids
+
+    def _header(self) -> Dict[str, Any]:
+        return {"n_lists": self.n_lists, "n_probe": self.n_probe}
+
+    def _arrays(self) -> Dict[str, List["np.ndarray"]]:
+        if self.centroids is None:
+            raise ValueError("Cannot save an untrained IVFIndex")
+        views = [rows.view() for rows in self._lists]
+        sizes = [len(ids) for _, ids in views]
+        return {
+            "centroids": [self.centroids],
+            "offsets": [np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)],
+            "vectors": [vectors for vectors, _ in views],
+            "ids": [ids for _, ids in views]
+        }
+
+    def _restore(self, header: Dict[str, Any], arrays: Dict[str, "np.ndarray"]) -> None:
+        self.n_lists = header["n_lists"]
+        self.n_probe = header["n_probe"]
+        self.centroids = arrays["centroids"]
+        offsets = arrays["offsets"].tolist()
+        self._lists = [
+            _Rows(self.dim, arrays["vectors"][start:end], arrays["ids"][start:end])
+            for start, end in zip(offsets, offsets[1:])
+        ]
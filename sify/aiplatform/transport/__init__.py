@@ -0,0 +1,21 @@
+from .http import HTTPTransport, get_default_transport, set_default_transport
+from .async_http import AsyncHTTPTransport
+from .retry import RetryPolicy, parse_retry_after
+from .rate_limit import RateLimiter, RateLimitPermit, TokenBucket, estimate_tokens
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from .hedging import HedgeCancelledError, HedgingPolicy
+from .single_flight import AsyncSingleFlight, SingleFlight, request_key
+from .timeouts import DeadlineExceededError, TimeoutConfig, check_deadline, deadline, remaining_time
+from .codec import JSONCodec, available_codecs, get_codec, set_codec
+from .sse import (
+    AsyncEventStream,
+    EventStream,
+    SSEParser,
+    ServerSentEvent,
+    aiter_data,
+    aiter_json,
+    aiter_sse,
+    iter_data,
+    iter_json,
+    iter_sse
+)
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from typing import Any, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .circuit_breaker import CircuitBreakerRegistry
+from .codec import encode_json_kwargs
+from .rate_limit import RateLimitPermit
+from .retry import RetryPolicy
+from .timeouts import TimeoutConfig
+
+
+class AsyncHTTPTransport:
+    """
+    Pooled asyncio HTTP transport used by the async platform clients.
+
+    Wraps a single ``httpx.AsyncClient`` so thousands of concurrent requests on one
+    event loop share a bounded set of keep-alive connections. A transport is bound
+    to the event loop it is first used on; create one per loop.
+    """
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None, timeout: Optional[TimeoutConfig] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            max_connections (int): Maximum number of concurrent connections across all hosts. Defaults to 100.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive. Defaults to 20.
+            keepalive_expiry (float): Seconds an idle connection is kept before closing. Defaults to 30.0.
+            retry_policy (Optional[RetryPolicy]): Retry schedule for 429/5xx and connection errors.
+                                                  Defaults to RetryPolicy(); pass RetryPolicy(max_attempts=1) to disable.
+            circuit_breakers (Optional[CircuitBreakerRegistry]): Per-endpoint circuit breakers consulted before
+                                                                 every attempt. Defaults to None (no breakers).
+            timeout (Optional[TimeoutConfig]): Timeouts for requests that do not pass their own.
+                                               Defaults to TimeoutConfig().
+
+        Raises:
+            ImportError: If httpx is not installed.
+            ValueError: If max_connections or max_keepalive_connections is less than 1.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncHTTPTransport requires httpx. Install it with: pip install sify-ai-platform[async]"
+            )
+        if max_connections < 1 or max_keepalive_connections < 1:
+            raise ValueError("max_connections and max_keepalive_connections must be greater than 0")
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers
+        self.timeout = timeout or TimeoutConfig()
+
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+
+    async def request(self, method: str, url: str, stream: bool = False, idempotent: Optional[bool] = None,
+                      rate_limit: Optional[RateLimitPermit] = None,
+                      timeout: Union[TimeoutConfig, float, Tuple[float, float], None] = None,
+                      **kwargs: Any) -> "httpx.Response":
+        """
+        Send a request over the pooled client, retrying transient failures.
+
+        Accepts the same keyword arguments as ``httpx.AsyncClient.build_request``, except
+        that a json body is encoded once with the configured JSON codec and timeout is a
+        TimeoutConfig (or seconds, or a (connect, read) tuple) defaulting to the
+        transport's. Every attempt's timeouts are capped by the call's total budget and
+        any deadline() in effect. When stream is True the body is not read; the caller
+        must close the response.
+        Set idempotent to True for side-effect free POSTs (or False to never retry).
+        A rate_limit permit is awaited before every attempt and told each attempt's
+        status. If every attempt fails with a retryable status the last response is returned.
+
+        Raises:
+            CircuitOpenError: If circuit breakers are configured and the endpoint's circuit is open.
+            DeadlineExceededError: If the time budget runs out before an attempt can be sent.
+        """
+        timeouts = TimeoutConfig.coerce(timeout, self.timeout)
+        kwargs = encode_json_kwargs(kwargs, "content")
+        policy = self.retry_policy
+        retry = policy.allows(method, idempotent)
+        breaker = self.circuit_breakers.get(url) if self.circuit_breakers is not None else None
+
+        started_at = time.monotonic()
+        expires_at = timeouts.expires_at(started_at)
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                if rate_limit is not None:
+                    await rate_limit.wait_async()
+                connect, read = timeouts.attempt_timeouts(expires_at, stream)
+                request = self.client.build_request(
+                    method=method, url=url, timeout=httpx.Timeout(read, connect=connect, pool=connect), **kwargs
+                )
+                sent_at = time.monotonic()
+                response = await self.client.send(request, stream=stream)
+            except httpx.TransportError:
+                if breaker is not None:
+                    breaker.record(False, time.monotonic() - sent_at)
+                delay = policy.next_delay(attempt, started_at) if retry else None
+                if delay is None or not self._fits(delay, expires_at):
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record(response.status_code < 500, time.monotonic() - sent_at)
+            retry_after = response.headers.get("Retry-After")
+            if rate_limit is not None:
+                rate_limit.record(response.status_code, retry_after)
+            if not retry or not policy.is_retryable_status(response.status_code):
+                return response
+            delay = policy.next_delay(attempt, started_at, retry_after)
+            if delay is None or not self._fits(delay, expires_at):
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _fits(delay: float, expires_at: Optional[float]) -> bool:
+        return expires_at is None or time.monotonic() + delay < expires_at
+
+    async def aclose(self) -> None:
+        """Close the client and every pooled connection."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
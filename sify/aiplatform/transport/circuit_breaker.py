@@ -0,0 +1,224 @@
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class CircuitOpenError(ValueError):
+    """Raised without contacting the server while an endpoint's circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {name}: failing fast, retry in {retry_in:.1f}s")
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one endpoint.
+
+    The breaker tracks the outcome of the last window_size calls. Once at least
+    minimum_calls have been seen and the failure rate or the slow call rate reaches
+    its threshold, the circuit opens and calls fail fast with CircuitOpenError. After
+    reset_timeout seconds it lets half_open_max_calls trial calls through; if they all
+    succeed the circuit closes, otherwise it opens again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            name (str): Identifier of the endpoint, used in errors and snapshots.
+            failure_rate_threshold (float): Fraction of failed calls that opens the circuit. Defaults to 0.5.
+            slow_call_duration (Optional[float]): Seconds after which a call counts as slow. None disables
+                                                  latency tracking. Defaults to None.
+            slow_call_rate_threshold (float): Fraction of slow calls that opens the circuit. Defaults to 0.5.
+            window_size (int): Number of most recent calls considered. Defaults to 20.
+            minimum_calls (int): Calls required in the window before the circuit can open. Defaults to 10.
+            reset_timeout (float): Seconds the circuit stays open before trial calls. Defaults to 30.0.
+            half_open_max_calls (int): Trial calls allowed while half-open. Defaults to 1.
+
+        Raises:
+            ValueError: If a threshold or size is out of range.
+        """
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("Rate thresholds must be between 0 and 1")
+        if window_size < 1 or minimum_calls < 1 or half_open_max_calls < 1:
+            raise ValueError("window_size, minimum_calls and half_open_max_calls must be greater than 0")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._calls.clear()
+
+    def before_call(self) -> None:
+        """
+        Reserve permission for a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial calls in flight.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == self.OPEN:
+                raise CircuitOpenError(self.name, self.reset_timeout - (now - self._opened_at))
+            if self._state == self.HALF_OPEN:
+                if self._half_open_in_flight >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_in_flight += 1
+
+    def record(self, success: bool, duration: float) -> None:
+        """
+        Record the outcome of a call admitted by before_call.
+
+        Args:
+            success (bool): False for connection errors, timeouts and 5xx responses.
+            duration (float): Seconds the call took to return response headers.
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if not success or slow:
+                    self._open(now)
+                    return
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._state = self.CLOSED
+                    self._calls.clear()
+                return
+            if self._state == self.OPEN:
+                return
+
+            self._calls.append((success, slow))
+            calls = len(self._calls)
+            if calls < self.minimum_calls:
+                return
+            failures = sum(1 for ok, _ in self._calls if not ok)
+            slow_calls = sum(1 for _, is_slow in self._calls if is_slow)
+            if failures / calls >= self.failure_rate_threshold or \
+                    (self.slow_call_duration is not None and slow_calls / calls >= self.slow_call_rate_threshold):
+                self._open(now)
+
+    def release(self) -> None:
+        """Give back a call admitted by before_call that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker's state and window statistics, e.g. for a health check endpoint."""
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            calls = len(self._calls)
+            failures = sum(1 for ok, _ in self._calls if not ok)
+            slow_calls = sum(1 for _, is_slow in self._calls if is_slow)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "calls": calls,
+                "failure_rate": failures / calls if calls else 0.0,
+                "slow_call_rate": slow_calls / calls if calls else 0.0,
+                "retry_in": max(0.0, self.reset_timeout - (now - self._opened_at)) if self._state == self.OPEN else 0.0
+            }
+
+
+# Path segments that identify a resource rather than an endpoint (UUIDs, numbers, long hex ids)
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$")
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Return the breaker key for a URL: scheme, host and path with resource ids collapsed.
+
+    For example ``https://host/v1/datasets/<uuid>/documents`` maps to
+    ``https://host/v1/datasets/{id}/documents``.
+    """
+    parts = urlsplit(url)
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in parts.path.split("/")]
+    return f"{parts.scheme}://{parts.netloc}{'/'.join(segments)}"
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers created on demand per base URL and endpoint.
+
+    Attach one to an HTTPTransport or AsyncHTTPTransport to protect every client
+    sharing the transport; the keyword arguments configure each CircuitBreaker.
+    """
+
+    def __init__(self, **breaker_kwargs: Any):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CircuitBreaker:
+        key = endpoint_key(url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(key, **self.breaker_kwargs)
+                    self._breakers[key] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return every breaker's snapshot keyed by endpoint."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+    def is_healthy(self) -> bool:
+        """True when no breaker is open."""
+        return all(s["state"] != CircuitBreaker.OPEN for s in self.snapshot().values())
@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder used for request bodies, responses and stream events.
+
+    loads accepts bytes or str so response bodies can be decoded without first
+    copying them into a str, and raises json.JSONDecodeError on invalid input
+    whichever backend is in use.
+    """
+
+    name = "json"
+
+    _decoder = json.JSONDecoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if not isinstance(data, str):
+            # Skips json's encoding detection; the API always sends UTF-8
+            try:
+                data = bytes(data).decode("utf-8") if isinstance(data, memoryview) else data.decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from None
+        return self._decoder.decode(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Types orjson does not support (e.g. int keys) still encode like before
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from None
+
+
+_CODECS = {"orjson": OrjsonCodec, "ujson": UjsonCodec, "json": JSONCodec}
+_codec: Optional[JSONCodec] = None
+_codec_lock = threading.Lock()
+
+
+def available_codecs() -> Dict[str, bool]:
+    """Return which codec backends are importable."""
+    return {"orjson": orjson is not None, "ujson": ujson is not None, "json": True}
+
+
+def _create(name: str) -> JSONCodec:
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Choose one of: {', '.join(_CODECS)}")
+    if not available_codecs()[name]:
+        raise ImportError(f"JSON codec '{name}' is not installed. Install it with: pip install {name}")
+    return _CODECS[name]()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Return the process-wide JSON codec.
+
+    Defaults to the SIFY_JSON_CODEC environment variable if set, otherwise the
+    fastest installed backend: orjson, then ujson, then the standard library.
+    """
+    global _codec
+
+    if _codec is None:
+        with _codec_lock:
+            if _codec is None:
+                name = os.environ.get("SIFY_JSON_CODEC")
+                if name:
+                    _codec = _create(name)
+                else:
+                    _codec = next(_CODECS[n]() for n, ok in available_codecs().items() if ok)
+    return _codec
+
+
+def set_codec(codec: Union[str, JSONCodec]) -> None:
+    """
+    Replace the process-wide JSON codec with a backend name or a JSONCodec instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named backend is not installed.
+    """
+    global _codec
+
+    with _codec_lock:
+        _codec = _create(codec) if isinstance(codec, str) else codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj to UTF-8 JSON bytes with the current codec."""
+    return get_codec().dumps(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON bytes or str with the current codec."""
+    return get_codec().loads(data)
+
+
+def encode_json_kwargs(kwargs: Dict[str, Any], body_param: str = "data") -> Dict[str, Any]:
+    """
+    Replace a ``json=`` request argument with a body encoded by the current codec.
+
+    The body is stored under body_param ("data" for requests, "content" for httpx)
+    and a JSON Content-Type header is added unless one is already set. Requests
+    that also carry files or an explicit body are left untouched.
+    """
+    if kwargs.get("json") is None or kwargs.get("files") or kwargs.get(body_param) is not None:
+        return kwargs
+    kwargs = dict(kwargs)
+    kwargs[body_param] = dumps(kwargs.pop("json"))
+    headers = dict(kwargs.get("headers") or {})
+    if not any(key.lower() == "content-type" for key in headers):
+        headers["Content-Type"] = "application/json"
+    kwargs["headers"] = headers
+    return kwargs
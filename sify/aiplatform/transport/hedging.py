@@ -0,0 +1,353 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class HedgeCancelledError(Exception):
+    """Raised inside a hedged call whose other copy has already succeeded."""
+
+    def __init__(self, message: str = "Hedged request cancelled - the other request answered first"):
+        super().__init__(message)
+
+
+class _Attempt:
+    """One copy of a hedged call; transports register how to abort its in-flight I/O."""
+
+    def __init__(self):
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._ids = itertools.count()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        with self._lock:
+            if self.cancelled:
+                callback()
+                return lambda: None
+            key = next(self._ids)
+            self._callbacks[key] = callback
+
+        def unregister() -> None:
+            with self._lock:
+                self._callbacks.pop(key, None)
+        return unregister
+
+    def cancel(self) -> None:
+        # Callbacks run under the lock so none can fire after its unregister() returned
+        with self._lock:
+            self.cancelled = True
+            callbacks, self._callbacks = list(self._callbacks.values()), {}
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    pass
+
+
+_current_attempt: contextvars.ContextVar[Optional[_Attempt]] = contextvars.ContextVar(
+    "sify_hedge_attempt", default=None
+)
+
+
+def on_cancel(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register callback to abort the current hedged call's I/O if the other copy wins.
+
+    Transports call this with a way to close the connection a request is using; the
+    callback runs on the winning thread. Outside a hedged call it is never called.
+
+    Returns:
+        Callable[[], None]: Unregisters the callback, e.g. once the connection is released.
+    """
+    attempt = _current_attempt.get()
+    if attempt is None:
+        return lambda: None
+    return attempt.on_cancel(callback)
+
+
+def check_cancelled() -> None:
+    """
+    Raise HedgeCancelledError if the current hedged call has lost to its other copy.
+
+    Raises:
+        HedgeCancelledError: If the other copy of the call has already succeeded.
+    """
+    attempt = _current_attempt.get()
+    if attempt is not None and attempt.cancelled:
+        raise HedgeCancelledError()
+
+
+class _HedgedCall:
+    """State shared by the primary copy of a call, its hedge and the scheduler."""
+
+    def __init__(self, call: Callable[[], Any], context: contextvars.Context):
+        self.call = call
+        self.context = context
+        self.primary = _Attempt()
+        self.hedge_attempt = _Attempt()
+        self.hedge: Optional[Future] = None
+        self.finished = False
+        self.winner: Optional[_Attempt] = None
+        self.lock = threading.Lock()
+
+    def claim(self, attempt: _Attempt) -> bool:
+        with self.lock:
+            if self.winner is None:
+                self.winner = attempt
+            return self.winner is attempt
+
+
+class HedgingPolicy:
+    """
+    Hedged requests: if a call has not finished within a delay derived from recent
+    latencies, a duplicate is started and whichever succeeds first wins.
+
+    The delay is the given percentile of the last window_size call latencies (or
+    initial_delay until min_samples have been seen). Hedges are limited to
+    max_hedge_ratio of all calls so a slow backend is not hit with double traffic.
+    A synchronous call runs on the caller's thread; a scheduler thread starts its
+    hedge on a small pool once the delay has passed. The loser is cancelled by
+    closing the connection it is using (HTTPTransport registers its connections for
+    this), so it stops waiting for the server and frees its pool slot. Asynchronous
+    losers are cancelled.
+
+    Only hedge calls that are safe to send twice, since both copies reach the server.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: Optional[float] = None,
+        window_size: int = 200,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        max_workers: int = 32
+    ):
+        """
+        Initialize the hedging policy.
+
+        Args:
+            percentile (float): Latency percentile after which a hedge is sent. Defaults to 95.0.
+            initial_delay (float): Hedge delay in seconds until min_samples latencies are known. Defaults to 1.0.
+            min_delay (float): Lower bound for the hedge delay in seconds. Defaults to 0.01.
+            max_delay (Optional[float]): Upper bound for the hedge delay in seconds. Defaults to None.
+            window_size (int): Number of recent latencies kept. Defaults to 200.
+            min_samples (int): Latencies required before the percentile is used. Defaults to 20.
+            max_hedge_ratio (float): Maximum fraction of calls that may be hedged. Defaults to 0.1.
+            max_workers (int): Threads available to synchronous hedges; primaries run on the caller's
+                thread. Defaults to 32.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+        if window_size < 1 or max_workers < 1:
+            raise ValueError("window_size and max_workers must be greater than 0")
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_workers = max_workers
+
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._requests = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # (hedge time, sequence, call) heap served by the scheduler thread
+        self._schedule: List[Tuple[float, int, _HedgedCall]] = []
+        self._sequence = itertools.count()
+        self._scheduled = threading.Condition(threading.Lock())
+        self._scheduler: Optional[threading.Thread] = None
+        self._closed = False
+
+    def delay(self) -> float:
+        """Return the current hedge delay in seconds."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(self._latencies)
+                index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+                delay = ordered[index]
+        delay = max(self.min_delay, delay)
+        if self.max_delay is not None:
+            delay = min(self.max_delay, delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for calls, hedges fired and hedges that won, plus the current delay."""
+        with self._lock:
+            counters = {
+                "requests": self._requests,
+                "hedges_fired": self._hedges_fired,
+                "hedges_won": self._hedges_won
+            }
+        counters["delay"] = self.delay()
+        return counters
+
+    def _start(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges_fired + 1 > self.max_hedge_ratio * self._requests:
+                return False
+            self._hedges_fired += 1
+            return True
+
+    def _finish(self, started_at: float, hedge_won: bool = False) -> None:
+        with self._lock:
+            self._latencies.append(time.monotonic() - started_at)
+            if hedge_won:
+                self._hedges_won += 1
+
+    def _schedule_hedge(self, state: _HedgedCall, hedge_at: float) -> None:
+        with self._scheduled:
+            if self._closed:
+                return
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._run_scheduler, name="sify-hedge-scheduler",
+                                                   daemon=True)
+                self._scheduler.start()
+            heapq.heappush(self._schedule, (hedge_at, next(self._sequence), state))
+            if self._schedule[0][2] is state:
+                self._scheduled.notify()
+
+    def _run_scheduler(self) -> None:
+        with self._scheduled:
+            while not self._closed:
+                if not self._schedule:
+                    self._scheduled.wait()
+                    continue
+                hedge_at, _, state = self._schedule[0]
+                remaining = hedge_at - time.monotonic()
+                if remaining > 0 and not state.finished:
+                    self._scheduled.wait(remaining)
+                    continue
+                heapq.heappop(self._schedule)
+                self._fire(state)
+
+    def _fire(self, state: _HedgedCall) -> None:
+        with state.lock:
+            if state.finished or not self._acquire_hedge():
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="sify-hedge")
+            state.hedge = self._executor.submit(state.context.run, self._run_hedge, state)
+
+    @staticmethod
+    def _run_hedge(state: _HedgedCall) -> Any:
+        _current_attempt.set(state.hedge_attempt)
+        result = state.call()
+        if state.claim(state.hedge_attempt):
+            state.primary.cancel()
+        return result
+
+    def run(self, call: Callable[[], T]) -> T:
+        """
+        Run call, hedging it with a second call if it is slower than the hedge delay.
+
+        Returns the result of the first call to succeed; the other one is cancelled.
+        If both fail, the first call's exception is raised.
+        """
+        self._start()
+        started_at = time.monotonic()
+        state = _HedgedCall(call, contextvars.copy_context())
+        self._schedule_hedge(state, started_at + self.delay())
+
+        token = _current_attempt.set(state.primary)
+        try:
+            result = call()
+        except Exception as error:
+            failure: Optional[Exception] = error
+        else:
+            failure = None
+        finally:
+            _current_attempt.reset(token)
+            with state.lock:
+                state.finished = True
+                hedge = state.hedge
+
+        if failure is None and state.claim(state.primary):
+            state.hedge_attempt.cancel()
+            self._finish(started_at)
+            return result
+        if hedge is None:
+            raise failure
+        try:
+            result = hedge.result()
+        except Exception:
+            if failure is None:
+                raise
+            raise failure
+        self._finish(started_at, hedge_won=True)
+        return result
+
+    async def run_async(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async version of run: the losing call's task is cancelled, closing its connection.
+        """
+        self._start()
+        started_at = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if done:
+                result = primary.result()
+                self._finish(started_at)
+                return result
+
+            if not self._acquire_hedge():
+                result = await primary
+                self._finish(started_at)
+                return result
+
+            hedge = asyncio.ensure_future(call())
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._finish(started_at, hedge_won=task is hedge)
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()
+
+    def close(self) -> None:
+        """Stop the hedge scheduler and shut down the thread pool used for synchronous hedges."""
+        with self._scheduled:
+            self._closed = True
+            self._schedule.clear()
+            self._scheduled.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,229 @@
+import socket
+import threading
+import time
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .circuit_breaker import CircuitBreakerRegistry
+from .codec import encode_json_kwargs
+from .hedging import HedgeCancelledError, check_cancelled, on_cancel
+from .rate_limit import RateLimitPermit
+from .retry import RetryPolicy
+from .timeouts import TimeoutConfig
+
+
+def _abort(connection: Any) -> None:
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _HedgeAwarePoolMixin:
+    """
+    Registers every checked-out connection with the hedged call using it, so a losing
+    copy's socket can be shut down and the connection discarded instead of waited on.
+    """
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        connection = super()._get_conn(timeout)
+        connection._sify_hedge_release = on_cancel(lambda: _abort(connection))
+        return connection
+
+    def _put_conn(self, connection: Any) -> None:
+        # Unregister before the connection can be handed to another request
+        release = getattr(connection, "_sify_hedge_release", None)
+        if release is not None:
+            connection._sify_hedge_release = None
+            release()
+        super()._put_conn(connection)
+
+
+class _HedgeAwareHTTPConnectionPool(_HedgeAwarePoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _HedgeAwareHTTPSConnectionPool(_HedgeAwarePoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _HTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HedgeAwareHTTPConnectionPool,
+            "https": _HedgeAwareHTTPSConnectionPool
+        }
+
+
+class HTTPTransport:
+    """
+    Pooled HTTP transport shared by the platform clients.
+
+    Wraps a single ``requests.Session`` whose adapters keep connections alive, so
+    ModelAsAService, AIApplication, DataMind and AiPlatform instances that share a
+    transport reuse warm TCP/TLS connections instead of handshaking on every call.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 pool_block: bool = False, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None, timeout: Optional[TimeoutConfig] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools to keep cached. Defaults to 10.
+            pool_maxsize (int): Maximum number of connections kept alive per host. Defaults to 20.
+            pool_block (bool): If True, never open more than pool_maxsize connections to a host;
+                               callers wait for a free connection instead. Defaults to False.
+            retry_policy (Optional[RetryPolicy]): Retry schedule for 429/5xx and connection errors.
+                                                  Defaults to RetryPolicy(); pass RetryPolicy(max_attempts=1) to disable.
+            circuit_breakers (Optional[CircuitBreakerRegistry]): Per-endpoint circuit breakers consulted before
+                                                                 every attempt. Defaults to None (no breakers).
+            timeout (Optional[TimeoutConfig]): Timeouts for requests that do not pass their own.
+                                               Defaults to TimeoutConfig().
+
+        Raises:
+            ValueError: If pool_connections or pool_maxsize is less than 1.
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be greater than 0")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers
+        self.timeout = timeout or TimeoutConfig()
+
+        self.session = requests.Session()
+        adapter = _HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None,
+                rate_limit: Optional[RateLimitPermit] = None,
+                timeout: Union[TimeoutConfig, float, Tuple[float, float], None] = None,
+                **kwargs: Any) -> requests.Response:
+        """
+        Send a request over the pooled session, retrying transient failures.
+
+        Accepts the same keyword arguments as ``requests.request``; a json body is
+        encoded once with the configured JSON codec, and timeout may also be a
+        TimeoutConfig and defaults to the transport's. Every attempt's timeouts are capped
+        by the call's total budget and any deadline() in effect. Set idempotent to
+        True for side-effect free POSTs (or False to never retry). A rate_limit permit
+        is waited on before every attempt and told each attempt's status. If every
+        attempt fails with a retryable status the last response is returned for the
+        caller to report. Inside a hedged call, the connection is shut down if the
+        other copy wins.
+
+        Raises:
+            CircuitOpenError: If circuit breakers are configured and the endpoint's circuit is open.
+            DeadlineExceededError: If the time budget runs out before an attempt can be sent.
+            HedgeCancelledError: If this is the losing copy of a hedged call.
+        """
+        timeouts = TimeoutConfig.coerce(timeout, self.timeout)
+        kwargs = encode_json_kwargs(kwargs)
+        policy = self.retry_policy
+        retry = policy.allows(method, idempotent)
+        breaker = self.circuit_breakers.get(url) if self.circuit_breakers is not None else None
+
+        started_at = time.monotonic()
+        expires_at = timeouts.expires_at(started_at)
+        attempt = 0
+        while True:
+            attempt += 1
+            check_cancelled()
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                if rate_limit is not None:
+                    rate_limit.wait()
+                attempt_timeout = timeouts.attempt_timeouts(expires_at, kwargs.get("stream", False))
+                sent_at = time.monotonic()
+                response = self.session.request(method=method, url=url, timeout=attempt_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                try:
+                    # A losing hedge's socket is shut down on purpose; that says nothing about the endpoint
+                    check_cancelled()
+                except HedgeCancelledError:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                if breaker is not None:
+                    breaker.record(False, time.monotonic() - sent_at)
+                delay = policy.next_delay(attempt, started_at) if retry else None
+                if delay is None or not self._fits(delay, expires_at):
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record(response.status_code < 500, time.monotonic() - sent_at)
+            retry_after = response.headers.get("Retry-After")
+            if rate_limit is not None:
+                rate_limit.record(response.status_code, retry_after)
+            if not retry or not policy.is_retryable_status(response.status_code):
+                return response
+            delay = policy.next_delay(attempt, started_at, retry_after)
+            if delay is None or not self._fits(delay, expires_at):
+                return response
+            response.close()
+            time.sleep(delay)
+
+    @staticmethod
+    def _fits(delay: float, expires_at: Optional[float]) -> bool:
+        return expires_at is None or time.monotonic() + delay < expires_at
+
+    def close(self) -> None:
+        """Close the session and every pooled connection."""
+        self.session.close()
+
+    def __enter__(self) -> "HTTPTransport":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """
+    Return the process-wide transport used by clients created without one.
+    """
+    global _default_transport
+
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: HTTPTransport) -> None:
+    """
+    Replace the process-wide transport, e.g. to change pool sizes at startup.
+
+    Clients created before the call keep the transport they were built with.
+    """
+    global _default_transport
+
+    with _default_transport_lock:
+        _default_transport = transport
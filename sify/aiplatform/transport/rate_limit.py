@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+from .retry import parse_retry_after
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate limiting: about four characters per token."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at ``rate`` tokens per second.
+
+    Reservations may drive the balance negative; the caller then waits until the
+    debt is repaid. This keeps waiters in arrival order without holding a lock while
+    sleeping, so the same bucket serves both threads and coroutines.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, amount: float = 1) -> float:
+        """
+        Take amount tokens and return the seconds to wait before using them.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket so no capacity frees up for the given number of seconds."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class _KeyLimits:
+    def __init__(self, requests_per_second: Optional[float], tokens_per_minute: Optional[float], burst: float):
+        self.requests = TokenBucket(requests_per_second, max(1.0, requests_per_second * burst)) if requests_per_second else None
+        self.tokens = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute) if tokens_per_minute else None
+        self.factor = 1.0
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with requests-per-second and tokens-per-minute buckets.
+
+    Buckets are kept per key, typically ``(api_key, model_id)``, so every worker thread
+    or coroutine sharing a limiter stays under the limits of the key it calls with.
+    When adaptive is enabled a 429 halves the key's rates (and honors Retry-After),
+    and each successful response restores a step of the configured rate.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst: float = 1.0,
+        adaptive: bool = True,
+        min_factor: float = 0.1,
+        recovery_step: float = 0.05
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second (Optional[float]): Request rate per key. None disables the request bucket.
+            tokens_per_minute (Optional[float]): Estimated token rate per key. None disables the token bucket.
+            burst (float): Seconds' worth of requests that may be sent back to back. Defaults to 1.0.
+            adaptive (bool): Slow down on 429 responses and recover on success. Defaults to True.
+            min_factor (float): Lowest fraction of the configured rates adaptation may reach. Defaults to 0.1.
+            recovery_step (float): Fraction of the configured rates restored per successful response. Defaults to 0.05.
+
+        Raises:
+            ValueError: If neither limit is set or a value is out of range.
+        """
+        if requests_per_second is None and tokens_per_minute is None:
+            raise ValueError("requests_per_second or tokens_per_minute must be provided")
+        if (requests_per_second is not None and requests_per_second <= 0) or \
+                (tokens_per_minute is not None and tokens_per_minute <= 0):
+            raise ValueError("Rate limits must be greater than 0")
+        if burst <= 0:
+            raise ValueError("burst must be greater than 0")
+        if not 0 < min_factor <= 1:
+            raise ValueError("min_factor must be between 0 and 1")
+
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_factor = min_factor
+        self.recovery_step = recovery_step
+        self._limits: Dict[Hashable, _KeyLimits] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable) -> _KeyLimits:
+        limits = self._limits.get(key)
+        if limits is None:
+            with self._lock:
+                limits = self._limits.get(key)
+                if limits is None:
+                    limits = _KeyLimits(self.requests_per_second, self.tokens_per_minute, self.burst)
+                    self._limits[key] = limits
+        return limits
+
+    def _reserve(self, key: Hashable, tokens: int) -> float:
+        limits = self._get(key)
+        wait = 0.0
+        if limits.requests is not None:
+            wait = max(wait, limits.requests.reserve(1))
+        if limits.tokens is not None:
+            wait = max(wait, limits.tokens.reserve(min(tokens, limits.tokens.capacity)))
+        return wait
+
+    def acquire(self, key: Hashable, tokens: int = 1) -> None:
+        """Block until one request carrying the given number of tokens may be sent."""
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, key: Hashable, tokens: int = 1) -> None:
+        """Wait, without blocking the event loop, until the request may be sent."""
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _apply_factor(self, limits: _KeyLimits) -> None:
+        if limits.requests is not None:
+            limits.requests.set_rate(self.requests_per_second * limits.factor)
+        if limits.tokens is not None:
+            limits.tokens.set_rate(self.tokens_per_minute / 60.0 * limits.factor)
+
+    def record(self, key: Hashable, status_code: int, retry_after: Optional[str] = None) -> None:
+        """
+        Feed a response status back into the limiter for adaptive rate control.
+        """
+        if not self.adaptive:
+            return
+        limits = self._get(key)
+        if status_code == 429:
+            with self._lock:
+                limits.factor = max(self.min_factor, limits.factor / 2)
+                self._apply_factor(limits)
+            pause = parse_retry_after(retry_after)
+            if pause:
+                for bucket in (limits.requests, limits.tokens):
+                    if bucket is not None:
+                        bucket.pause(pause)
+        elif status_code < 400 and limits.factor < 1.0:
+            with self._lock:
+                limits.factor = min(1.0, limits.factor + self.recovery_step)
+                self._apply_factor(limits)
+
+    def current_rates(self, key: Hashable) -> Tuple[Optional[float], Optional[float]]:
+        """Return the (requests per second, tokens per minute) currently enforced for key."""
+        limits = self._get(key)
+        return (
+            limits.requests.rate if limits.requests is not None else None,
+            limits.tokens.rate * 60.0 if limits.tokens is not None else None
+        )
+
+    def permit(self, key: Hashable, tokens: int = 1) -> "RateLimitPermit":
+        """Bind a key and token estimate for a transport to acquire before each attempt."""
+        return RateLimitPermit(self, key, tokens)
+
+
+class RateLimitPermit:
+    """A pending request's claim on a RateLimiter, used by the transports for every attempt."""
+
+    def __init__(self, limiter: RateLimiter, key: Hashable, tokens: int = 1):
+        self.limiter = limiter
+        self.key = key
+        self.tokens = tokens
+
+    def wait(self) -> None:
+        self.limiter.acquire(self.key, self.tokens)
+
+    async def wait_async(self) -> None:
+        await self.limiter.acquire_async(self.key, self.tokens)
+
+    def record(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        self.limiter.record(self.key, status_code, retry_after)
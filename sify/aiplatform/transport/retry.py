@@ -0,0 +1,135 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a number of seconds.
+
+    Args:
+        value (Optional[str]): Header value, either delta-seconds or an HTTP-date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry schedule for transient HTTP failures.
+
+    Responses with a retryable status (429 and 5xx by default) and connection/timeout
+    errors are retried with capped exponential backoff and full jitter, honoring the
+    server's Retry-After header. Only idempotent methods are retried unless a request
+    is explicitly marked idempotent. Retries happen before a response is handed to the
+    caller, so a streaming body that has started to be consumed is never replayed.
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    DEFAULT_ALLOWED_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Optional[Iterable[int]] = None,
+        allowed_methods: Optional[Iterable[str]] = None,
+        respect_retry_after: bool = True,
+        total_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts (int): Total attempts including the first one. 1 disables retries. Defaults to 3.
+            backoff_base (float): Base delay in seconds; attempt n sleeps up to backoff_base * 2**(n-1). Defaults to 0.5.
+            backoff_max (float): Upper bound of the jittered backoff in seconds. Defaults to 30.0.
+            retry_statuses (Optional[Iterable[int]]): HTTP statuses to retry. Defaults to 429, 500, 502, 503, 504.
+            allowed_methods (Optional[Iterable[str]]): Methods retried without an explicit idempotent flag.
+                                                       Defaults to GET, HEAD, OPTIONS, PUT, DELETE.
+            respect_retry_after (bool): Wait for the Retry-After header when present. Defaults to True.
+            total_timeout (Optional[float]): Overall budget in seconds for all attempts and waits. Defaults to None.
+
+        Raises:
+            ValueError: If max_attempts is less than 1 or a delay is negative.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be greater than 0")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must not be negative")
+        if total_timeout is not None and total_timeout <= 0:
+            raise ValueError("total_timeout must be greater than 0")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses) if retry_statuses is not None else self.DEFAULT_RETRY_STATUSES
+        self.allowed_methods = (
+            frozenset(m.upper() for m in allowed_methods) if allowed_methods is not None
+            else self.DEFAULT_ALLOWED_METHODS
+        )
+        self.respect_retry_after = respect_retry_after
+        self.total_timeout = total_timeout
+
+    def allows(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """Return True if a request with this method may be retried."""
+        if self.max_attempts <= 1:
+            return False
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.allowed_methods
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait after the given (1-based) failed attempt.
+
+        Uses the Retry-After header when allowed and present, otherwise full jitter:
+        a uniform draw between 0 and min(backoff_max, backoff_base * 2**(attempt-1)).
+        """
+        if self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                return server_delay
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(self, attempt: int, started_at: float, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Delay before the next attempt, or None if the request should not be retried.
+
+        Args:
+            attempt (int): Number of attempts made so far.
+            started_at (float): time.monotonic() value when the first attempt started.
+            retry_after (Optional[str]): Retry-After header of the failed response, if any.
+
+        Returns:
+            Optional[float]: Seconds to sleep, or None when attempts or the total budget are exhausted.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt, retry_after)
+        if self.total_timeout is not None:
+            remaining = self.total_timeout - (time.monotonic() - started_at)
+            if delay >= remaining:
+                return None
+        return delay
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from .timeouts import DeadlineExceededError, remaining_time
+
+T = TypeVar("T")
+
+
+def request_key(method: str, url: str, json_data: Optional[Dict[str, Any]] = None,
+                params: Optional[Dict[str, Any]] = None, *extra: Hashable) -> Hashable:
+    """
+    Build a coalescing key from a request's method, URL and canonicalized JSON body and params.
+
+    Bodies that differ only in key order or whitespace map to the same key.
+    """
+    def canonical(value: Optional[Dict[str, Any]]) -> Optional[str]:
+        if value is None:
+            return None
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    return (method.upper(), url, canonical(json_data), canonical(params)) + extra
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls across threads.
+
+    While a call for a key is in flight, other threads calling do() with the same key
+    wait for it and receive the same result (or exception) instead of repeating it.
+    Results are not cached: the next call after completion runs again. Share one
+    instance between clients to coalesce across them. A waiter gives up with
+    DeadlineExceededError when its own deadline() runs out first.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn for key, or wait for the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._shared += 1
+
+        if not leader:
+            remaining = remaining_time()
+            if not call.done.wait(None if remaining is None else max(0.0, remaining)):
+                raise DeadlineExceededError()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls were executed and how many waiters shared another call's result."""
+        with self._lock:
+            return {"executed": self._executed, "shared": self._shared}
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical concurrent coroutine calls on one event loop.
+
+    The shared call runs as its own task, so a waiter being cancelled does not
+    cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._executed = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn for key, or the identical call already in flight."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            self._executed += 1
+            future.add_done_callback(lambda _: self._forget(key))
+        else:
+            self._shared += 1
+        remaining = remaining_time()
+        if remaining is None:
+            return await asyncio.shield(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), max(0.0, remaining))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError()
+
+    def _forget(self, key: Hashable) -> None:
+        future = self._calls.pop(key, None)
+        if future is not None and not future.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls were executed and how many waiters shared another call's result."""
+        return {"executed": self._executed, "shared": self._shared}
@@ -0,0 +1,352 @@
+import asyncio
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Set
+
+from . import codec
+
+DONE = b"[DONE]"
+
+
+class ServerSentEvent:
+    """One dispatched event. data is the raw bytes of its (joined) data lines."""
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(self, data: bytes, event: str = "message", id: Optional[str] = None, retry: Optional[int] = None):
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def json(self) -> Any:
+        """Decode data as JSON with the configured codec."""
+        return codec.loads(self.data)
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, id={self.id!r}, data={self.data[:60]!r})"
+
+
+class SSEParser:
+    """
+    Incremental parser for ``text/event-stream`` bodies fed as raw byte chunks.
+
+    Implements the SSE field rules: data lines are joined with newlines, event/id/retry
+    fields are honored, comment lines (starting with ":") are ignored, and any of
+    CRLF, LF or CR ends a line.
+
+    The same parser reads newline-delimited JSON, dispatching every non-empty line as
+    an event. The framing is fixed for the whole stream: pass ndjson (e.g. from the
+    response Content-Type), or leave it None to pick NDJSON when the first non-blank
+    byte is "{" or "[" and SSE otherwise.
+    """
+
+    def __init__(self, ndjson: Optional[bool] = None):
+        self._buffer = b""
+        self._data: List[bytes] = []
+        self._event = ""
+        self._last_id: Optional[str] = None
+        self._retry: Optional[int] = None
+        self._ndjson = ndjson
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Consume a chunk and return the events it completed."""
+        buffer = self._buffer + chunk if self._buffer else chunk
+        held = b""
+        if b"\r" in buffer:
+            # Hold back a trailing CR: the next chunk may start with its LF
+            if buffer.endswith(b"\r"):
+                held = b"\r"
+                buffer = buffer[:-1]
+            buffer = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if self._ndjson is None:
+            start = buffer.lstrip()[:1]
+            if not start:
+                self._buffer = buffer + held
+                return []
+            self._ndjson = start in (b"{", b"[")
+
+        events: List[ServerSentEvent] = []
+        if self._ndjson:
+            lines = buffer.split(b"\n")
+            self._buffer = lines.pop() + held
+            for line in lines:
+                line = line.strip()
+                if line:
+                    events.append(ServerSentEvent(line, "message", self._last_id, self._retry))
+            return events
+
+        # SSE: work on whole events (blocks ending in a blank line) so the common
+        # single "data:" line event is handled without splitting it into lines
+        blocks = buffer.split(b"\n\n")
+        self._buffer = blocks.pop() + held
+        for block in blocks:
+            if block.startswith(b"data:") and b"\n" not in block:
+                data = block[6:] if block[5:6] == b" " else block[5:]
+                events.append(ServerSentEvent(data, "message", self._last_id, self._retry))
+                continue
+            for line in block.split(b"\n"):
+                event = self._process_line(line)
+                if event is not None:
+                    events.append(event)
+            event = self._dispatch()
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """Finish the stream, dispatching a final event that was not followed by a blank line."""
+        buffer, self._buffer = self._buffer, b""
+        if self._ndjson:
+            line = buffer.strip()
+            return [ServerSentEvent(line, "message", self._last_id, self._retry)] if line else []
+        events: List[ServerSentEvent] = []
+        for line in buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n"):
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        if not self._data:
+            self._event = ""
+            return None
+        data = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+        event = ServerSentEvent(data, self._event or "message", self._last_id, self._retry)
+        self._data = []
+        self._event = ""
+        return event
+
+    def _process_line(self, line: bytes) -> Optional[ServerSentEvent]:
+        if not line:
+            return self._dispatch()
+        first = line[0]
+        if first == 0x3A:  # ":" comment
+            return None
+
+        field, sep, value = line.partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8", "replace")
+        elif field == b"id":
+            if b"\x00" not in value:
+                self._last_id = value.decode("utf-8", "replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self._retry = int(value)
+        return None
+
+
+_NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+
+def _parser(content_type: Optional[str]) -> SSEParser:
+    """Return a parser framed by a response Content-Type, sniffing the body if it names neither format."""
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return SSEParser(ndjson=False)
+    if media_type in _NDJSON_TYPES:
+        return SSEParser(ndjson=True)
+    return SSEParser()
+
+
+def iter_sse(chunks: Iterable[bytes], content_type: Optional[str] = None) -> Iterator[ServerSentEvent]:
+    """
+    Parse an iterable of byte chunks (e.g. ``response.iter_content(None)``) into events.
+
+    content_type is the response Content-Type, used to choose between SSE and NDJSON framing.
+    """
+    parser = _parser(content_type)
+    for chunk in chunks:
+        if chunk:
+            yield from parser.feed(chunk)
+    yield from parser.flush()
+
+
+async def aiter_sse(chunks: AsyncIterable[bytes],
+                    content_type: Optional[str] = None) -> AsyncIterator[ServerSentEvent]:
+    """Parse an async iterable of byte chunks (e.g. ``response.aiter_bytes()``) into events."""
+    parser = _parser(content_type)
+    async for chunk in chunks:
+        if chunk:
+            for event in parser.feed(chunk):
+                yield event
+    for event in parser.flush():
+        yield event
+
+
+def iter_data(chunks: Iterable[bytes], content_type: Optional[str] = None) -> Iterator[bytes]:
+    """Yield the undecoded data of every event in an SSE or NDJSON byte stream, skipping [DONE]."""
+    for event in iter_sse(chunks, content_type):
+        if event.data and event.data.strip() != DONE:
+            yield event.data
+
+
+async def aiter_data(chunks: AsyncIterable[bytes], content_type: Optional[str] = None) -> AsyncIterator[bytes]:
+    """Async version of iter_data."""
+    async for event in aiter_sse(chunks, content_type):
+        if event.data and event.data.strip() != DONE:
+            yield event.data
+
+
+def _decode_events(events: List[ServerSentEvent], loads: Callable[[bytes], Any]) -> List[Any]:
+    payloads = [event.data for event in events if event.data and event.data.strip() != DONE]
+    if len(payloads) > 1:
+        # Events that arrived in the same network chunk are decoded with a single
+        # loads call; malformed events make the batch fail and fall back below.
+        try:
+            values = loads(b"[" + b",".join(payloads) + b"]")
+        except json.JSONDecodeError:
+            pass
+        else:
+            if len(values) == len(payloads):
+                return values
+
+    values = []
+    for data in payloads:
+        try:
+            values.append(loads(data))
+        except json.JSONDecodeError:
+            # Skip malformed JSON chunks
+            continue
+    return values
+
+
+def iter_json(chunks: Iterable[bytes], content_type: Optional[str] = None) -> Iterator[Any]:
+    """Yield the JSON payload of every event in an SSE or NDJSON byte stream, skipping [DONE]."""
+    loads = codec.get_codec().loads
+    parser = _parser(content_type)
+    for chunk in chunks:
+        if chunk:
+            yield from _decode_events(parser.feed(chunk), loads)
+    yield from _decode_events(parser.flush(), loads)
+
+
+async def aiter_json(chunks: AsyncIterable[bytes], content_type: Optional[str] = None) -> AsyncIterator[Any]:
+    """Async version of iter_json."""
+    loads = codec.get_codec().loads
+    parser = _parser(content_type)
+    async for chunk in chunks:
+        if chunk:
+            for value in _decode_events(parser.feed(chunk), loads):
+                yield value
+    for value in _decode_events(parser.flush(), loads):
+        yield value
+
+
+class EventStream:
+    """
+    Iterator over the decoded events of a streaming HTTP response that owns the response.
+
+    The response is closed when the events run out or iteration raises, on close() or
+    leaving a with block, and when the stream is garbage collected, so a consumer
+    that stops early does not keep the connection checked out of the pool.
+    """
+
+    def __init__(self, events: Iterator[Any], response: Any):
+        self._events = events
+        self.response = response
+        self.closed = False
+
+    def __iter__(self) -> "EventStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self.closed:
+            raise StopIteration
+        try:
+            return next(self._events)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop the stream and close the response. Safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            close = getattr(self._events, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self.response.close()
+
+    def __enter__(self) -> "EventStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+_closing: Set["asyncio.Task"] = set()
+
+
+def _aclose_soon(aclose: Callable[[], Awaitable[None]]) -> None:
+    """Run aclose() on the running event loop, for finalizers that cannot await."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(aclose())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+class AsyncEventStream:
+    """
+    Async version of EventStream.
+
+    Prefer ``async with`` or aclose(): a stream garbage collected while its event
+    loop is running is closed in a background task, otherwise not at all.
+    """
+
+    def __init__(self, events: AsyncIterator[Any], response: Any):
+        self._events = events
+        self.response = response
+        self.closed = False
+
+    def __aiter__(self) -> "AsyncEventStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.closed:
+            raise StopAsyncIteration
+        try:
+            return await self._events.__anext__()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Stop the stream and close the response. Safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            aclose = getattr(self._events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        finally:
+            await self.response.aclose()
+
+    async def __aenter__(self) -> "AsyncEventStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __del__(self) -> None:
+        if not self.closed:
+            _aclose_soon(self.aclose)
@@ -0,0 +1,126 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple, Union
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("sify_aiplatform_deadline", default=None)
+
+
+class DeadlineExceededError(ValueError):
+    """Raised when a call's end-to-end time budget runs out."""
+
+    def __init__(self, message: str = "Deadline exceeded - the request budget ran out"):
+        super().__init__(message)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every request made inside the block, across retries and multi-request
+    operations, to finish within seconds from now.
+
+    Nested deadlines can only shorten the enclosing one. The deadline follows the
+    context into asyncio tasks and hedged/batched worker threads started inside the block.
+
+        with deadline(2.0):
+            client.chat_completion(messages)
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(current, expires_at)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time(expires_at: Optional[float] = None) -> Optional[float]:
+    """
+    Return the seconds left until expires_at (a time.monotonic() value), or until the
+    deadline() in effect when expires_at is None. Returns None when there is no deadline.
+    """
+    if expires_at is None:
+        expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def check_deadline(expires_at: Optional[float]) -> None:
+    """Raise DeadlineExceededError if expires_at has passed."""
+    if expires_at is not None and time.monotonic() >= expires_at:
+        raise DeadlineExceededError()
+
+
+class TimeoutConfig:
+    """
+    Timeouts applied by the transports to every request.
+
+    connect bounds establishing a connection and read bounds each wait for response
+    data. For streaming responses stream_idle, if set, replaces read as the longest
+    gap allowed between chunks. total is an end-to-end budget per call covering
+    retries and backoff; it combines with any deadline() in effect, the earlier one winning.
+    """
+
+    def __init__(self, connect: float = 10.0, read: float = 300.0, stream_idle: Optional[float] = None,
+                 total: Optional[float] = None):
+        """
+        Initialize the timeout configuration.
+
+        Args:
+            connect (float): Seconds to wait for a connection. Defaults to 10.0.
+            read (float): Seconds to wait for response data. Defaults to 300.0.
+            stream_idle (Optional[float]): Seconds to wait for each streamed chunk. Defaults to read.
+            total (Optional[float]): End-to-end seconds per call, including retries. Defaults to None.
+
+        Raises:
+            ValueError: If a timeout is not greater than 0.
+        """
+        for name, value in (("connect", connect), ("read", read), ("stream_idle", stream_idle), ("total", total)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} timeout must be greater than 0")
+        self.connect = connect
+        self.read = read
+        self.stream_idle = stream_idle
+        self.total = total
+
+    @classmethod
+    def coerce(cls, value: Union["TimeoutConfig", float, Tuple[float, float], None],
+               default: Optional["TimeoutConfig"] = None) -> "TimeoutConfig":
+        """Accept a TimeoutConfig, a single timeout or a (connect, read) tuple as ``requests`` does."""
+        if value is None:
+            return default or cls()
+        if isinstance(value, TimeoutConfig):
+            return value
+        if isinstance(value, tuple):
+            return cls(connect=value[0], read=value[1])
+        return cls(connect=value, read=value)
+
+    def expires_at(self, started_at: Optional[float] = None) -> Optional[float]:
+        """Return the monotonic time a call started at started_at (default: now) must finish by."""
+        if started_at is None:
+            started_at = time.monotonic()
+        expires_at = _deadline.get()
+        if self.total is not None:
+            own = started_at + self.total
+            expires_at = own if expires_at is None else min(expires_at, own)
+        return expires_at
+
+    def attempt_timeouts(self, expires_at: Optional[float], stream: bool = False) -> Tuple[float, float]:
+        """
+        Return the (connect, read) timeouts for the next attempt, capped by the time left.
+
+        Raises:
+            DeadlineExceededError: If expires_at has passed.
+        """
+        read = self.stream_idle if stream and self.stream_idle is not None else self.read
+        connect = self.connect
+        if expires_at is not None:
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError()
+            connect = min(connect, remaining)
+            read = min(read, remaining)
+        return connect, read
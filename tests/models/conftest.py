@@ -0,0 +1,78 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from sify.aiplatform.models import ModelAsAService
+
+
+def embed_text(text: str) -> List[float]:
+    """Deterministic 4-dimensional embedding of a text."""
+    return [float(len(text)), float(ord(text[0])), float(sum(map(ord, text)) % 97), 1.0]
+
+
+def rerank_score(query: str, text: str) -> float:
+    """Cross-encoder style score: depends only on the (query, document) pair."""
+    words = text.lower().split()
+    return sum(words.count(word) for word in query.lower().split()) + len(text) / 1000
+
+
+class StubClient(ModelAsAService):
+    """
+    ModelAsAService answering embeddings and rerank requests locally.
+
+    Every request payload is recorded in requests. fail_on(endpoint, payload) may return
+    an exception to raise instead of answering. With normalize_scores, rerank scores are
+    min-max scaled across the documents of each request, like a listwise reranker.
+    """
+
+    def __init__(self, model_id: str = "stub-model", normalize_scores: bool = False, **kwargs: Any):
+        kwargs.setdefault("embedding_encoding", "float")
+        super().__init__("test-key", model_id, **kwargs)
+        self.normalize_scores = normalize_scores
+        self.fail_on: Optional[Callable[[str, Dict[str, Any]], Optional[Exception]]] = None
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _send_request(self, method: str, endpoint: str, json_data: Optional[Dict[str, Any]] = None,
+                      **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.requests.append(json_data)
+        if self.fail_on is not None:
+            error = self.fail_on(endpoint, json_data)
+            if error is not None:
+                raise error
+        if endpoint == "/v1/embeddings":
+            return {"status_code": 200, "result": self._embeddings(json_data)}
+        if endpoint == "/v1/rerank":
+            return {"status_code": 200, "result": self._rerank(json_data)}
+        raise AssertionError(f"Unexpected request to {endpoint}")
+
+    def _embeddings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        texts = [data["input"]] if isinstance(data["input"], str) else data["input"]
+        items = [{"object": "embedding", "embedding": embed_text(text), "index": i} for i, text in enumerate(texts)]
+        tokens = sum(len(text.split()) for text in texts)
+        # Out of order on purpose: clients must place vectors by index
+        return {"object": "list", "data": items[::-1], "model": data["model"],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens}}
+
+    def _rerank(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        texts = [doc if isinstance(doc, str) else doc["text"] for doc in data["documents"]]
+        scores = [rerank_score(data["query"], text) for text in texts]
+        if self.normalize_scores and len(scores) > 1:
+            low, high = min(scores), max(scores)
+            scores = [(score - low) / ((high - low) or 1.0) for score in scores]
+        results = []
+        for i, score in enumerate(scores):
+            document = {"text": texts[i]} if data.get("return_documents", True) else None
+            results.append({"index": i, "relevance_score": score, "document": document})
+        results.sort(key=lambda item: (-item["relevance_score"], item["index"]))
+        if data.get("top_n") is not None:
+            results = results[:data["top_n"]]
+        return {"id": f"rerank-{len(self.requests)}", "results": results,
+                "meta": {"billed_units": {"search_units": 1}}}
+
+
+@pytest.fixture
+def make_client() -> Callable[..., StubClient]:
+    return StubClient
@@ -0,0 +1,57 @@
+import pytest
+
+from conftest import embed_text
+from sify.aiplatform.models import APIRequestError, EmbeddingBatching
+
+
+TEXTS = [f"text number {i}" + " word" * i for i in range(10)]
+
+
+def test_sub_batches_are_merged_in_input_order(make_client):
+    client = make_client(embedding_batching=EmbeddingBatching(max_items=3))
+
+    response = client.create_embeddings(TEXTS)
+
+    assert [len(request["input"]) for request in client.requests] == [3, 3, 3, 1]
+    assert [item.index for item in response.data] == list(range(len(TEXTS)))
+    assert [item.embedding for item in response.data] == [embed_text(text) for text in TEXTS]
+    tokens = sum(len(text.split()) for text in TEXTS)
+    assert response.usage.prompt_tokens == response.usage.total_tokens == tokens
+
+
+def test_sub_batches_as_numpy(make_client):
+    np = pytest.importorskip("numpy")
+    client = make_client(embedding_batching=EmbeddingBatching(max_items=4))
+
+    response = client.create_embeddings(TEXTS, as_numpy=True)
+
+    np.testing.assert_array_equal(response.matrix, np.array([embed_text(text) for text in TEXTS], np.float32))
+
+
+def test_transient_batch_failure_is_retried_alone(make_client):
+    client = make_client(embedding_batching=EmbeddingBatching(max_items=3, max_attempts=2))
+    failed = []
+
+    def fail_once(endpoint, payload):
+        if payload["input"][0] == TEXTS[3] and not failed:
+            failed.append(payload)
+            return APIRequestError("API Error: Server error: HTTP 503", 503)
+        return None
+
+    client.fail_on = fail_once
+    response = client.create_embeddings(TEXTS)
+
+    assert len(client.requests) == 5
+    assert sum(request["input"][0] == TEXTS[3] for request in client.requests) == 2
+    assert [item.embedding for item in response.data] == [embed_text(text) for text in TEXTS]
+
+
+def test_client_error_is_not_retried(make_client):
+    client = make_client(embedding_batching=EmbeddingBatching(max_items=3, max_concurrency=1, max_attempts=3))
+    client.fail_on = lambda endpoint, payload: (
+        APIRequestError("API Error: Bad request", 400) if payload["input"][0] == TEXTS[3] else None
+    )
+
+    with pytest.raises(ValueError, match="Bad request"):
+        client.create_embeddings(TEXTS)
+    assert sum(request["input"][0] == TEXTS[3] for request in client.requests) == 1
@@ -0,0 +1,62 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sify.aiplatform.models import EmbeddingStore
+
+
+def _vectors(n, dim=8, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_reopen_discards_unflushed_appends(tmp_path, dtype):
+    path = str(tmp_path / "store")
+    committed = _vectors(10)
+    store = EmbeddingStore.create(path, "stub-model", 8, dtype=dtype)
+    store.append([f"a{i}" for i in range(10)], committed)
+    store.flush({"job": 1})
+    store.append([f"b{i}" for i in range(5)], _vectors(5, seed=1))
+    assert len(store) == 15
+    store.close(flush=False)
+
+    reader = EmbeddingStore.open(path)
+    assert len(reader) == 10 and reader.metadata == {"job": 1}
+    assert "b0" not in reader
+    reader.close()
+
+    writer = EmbeddingStore.open(path, writable=True)
+    assert len(writer) == 10
+    # The discarded ids can be appended again, after the committed rows
+    redone = _vectors(5, seed=2)
+    writer.append([f"b{i}" for i in range(5)], redone)
+    writer.close()
+
+    store = EmbeddingStore.open(path)
+    assert len(store) == 15
+    assert store.ids_at(range(15)) == [f"a{i}" for i in range(10)] + [f"b{i}" for i in range(5)]
+    tolerance = {"float32": 1e-6, "float16": 1e-2, "int8": 5e-2}[dtype]
+    np.testing.assert_allclose(store.get(["a3", "b4"]), np.stack([committed[3], redone[4]]),
+                               atol=tolerance * np.abs(redone).max())
+    scores, ids = store.search(redone[4], k=1)
+    assert ids == ["b4"]
+
+
+def test_append_rejects_committed_and_pending_ids(tmp_path):
+    store = EmbeddingStore.create(str(tmp_path / "store"), "stub-model", 8)
+    store.append(["a"], _vectors(1))
+    with pytest.raises(ValueError, match="already in the store"):
+        store.append(["a"], _vectors(1))
+    store.flush()
+    with pytest.raises(ValueError, match="already in the store"):
+        store.append(["b", "a"], _vectors(2))
+    assert len(store) == 1
+
+
+def test_empty_append_is_a_no_op(tmp_path):
+    store = EmbeddingStore.create(str(tmp_path / "store"), "stub-model", 8)
+    store.append([], [])
+    store.append([], np.empty((0, 8), np.float32))
+    assert len(store) == 0
+    with pytest.raises(ValueError, match="0 ids for 1 vectors"):
+        store.append([], _vectors(1))
@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from conftest import embed_text
+from sify.aiplatform.models import (
+    APIRequestError,
+    EmbeddingPipeline,
+    EmbeddingStore,
+    EmbeddingStoreSink,
+    NpyShardSink,
+    read_jsonl
+)
+
+RECORDS = [(f"doc-{i}", f"record {i} text") for i in range(23)]
+
+
+def _fail_at(text):
+    return lambda endpoint, payload: APIRequestError("API Error: Bad request", 400) if text in payload["input"] else None
+
+
+def _expected(records):
+    return np.array([embed_text(text) for _, text in records], dtype=np.float32)
+
+
+def _run_with_crash_then_resume(make_client, sink_factory):
+    client = make_client()
+    client.fail_on = _fail_at(RECORDS[15][1])
+    pipeline = EmbeddingPipeline(client, sink_factory(), batch_size=2, max_concurrency=1, commit_every=3)
+    with pytest.raises(ValueError, match="Bad request"):
+        pipeline.run(RECORDS)
+
+    client = make_client()
+    stats = EmbeddingPipeline(client, sink_factory(), batch_size=2, max_concurrency=1, commit_every=3).run(RECORDS)
+    # Six batches were committed before the failure; the seventh was written but not committed
+    assert stats["resumed_from"] == 12
+    assert stats["records"] == len(RECORDS)
+    assert stats["batches"] == 6
+    assert client.requests[0]["input"] == [RECORDS[12][1], RECORDS[13][1]]
+
+
+def test_store_sink_resumes_from_checkpoint(tmp_path, make_client):
+    path = str(tmp_path / "store")
+    _run_with_crash_then_resume(make_client, lambda: EmbeddingStoreSink(path))
+
+    store = EmbeddingStore.open(path)
+    assert store.model_id == "stub-model"
+    assert store.metadata["pipeline"] == {"model": "stub-model", "records": len(RECORDS)}
+    assert store.ids_at(range(len(store))) == [embedding_id for embedding_id, _ in RECORDS]
+    np.testing.assert_array_equal(store.get([embedding_id for embedding_id, _ in RECORDS]), _expected(RECORDS))
+
+
+def test_shard_sink_resumes_from_checkpoint(tmp_path, make_client):
+    directory = str(tmp_path / "shards")
+    _run_with_crash_then_resume(make_client, lambda: NpyShardSink(directory))
+
+    shards = sorted(name for name in os.listdir(directory) if name.endswith(".npy"))
+    ids, rows = [], []
+    for name in shards:
+        rows.append(np.load(os.path.join(directory, name)))
+        with open(os.path.join(directory, name[:-len(".npy")] + ".ids.json")) as f:
+            ids.extend(json.load(f))
+    assert ids == [embedding_id for embedding_id, _ in RECORDS]
+    np.testing.assert_array_equal(np.concatenate(rows), _expected(RECORDS))
+
+
+def test_finished_run_resumes_to_nothing(tmp_path, make_client):
+    path = str(tmp_path / "store")
+    EmbeddingPipeline(make_client(), EmbeddingStoreSink(path), batch_size=4).run(RECORDS)
+
+    client = make_client()
+    stats = EmbeddingPipeline(client, EmbeddingStoreSink(path), batch_size=4).run(RECORDS)
+    assert stats["resumed_from"] == stats["records"] == len(RECORDS)
+    assert client.requests == []
+
+
+def test_checkpoint_of_another_model_is_refused(tmp_path, make_client):
+    path = str(tmp_path / "store")
+    EmbeddingPipeline(make_client(), EmbeddingStoreSink(path)).run(RECORDS[:3])
+
+    with pytest.raises(ValueError, match="stub-model"):
+        EmbeddingPipeline(make_client(model_id="other-model"), EmbeddingStoreSink(path)).run(RECORDS)
+
+
+def test_read_jsonl_ids_default_to_line_position(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": "x", "text": "first"}\n\n{"text": "second"}\n')
+
+    assert list(read_jsonl(str(path))) == [("x", "first"), ("1", "second")]
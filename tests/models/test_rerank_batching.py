@@ -0,0 +1,72 @@
+import pytest
+
+from conftest import rerank_score
+from sify.aiplatform.models import RerankBatching
+
+QUERY = "apple pie"
+DOCUMENTS = [f"{'apple ' * ((i * 7) % 5)}filler document {i}" for i in range(14)]
+
+
+def _ranking(query, documents):
+    scores = [rerank_score(query, document) for document in documents]
+    return sorted(range(len(documents)), key=lambda i: (-scores[i], i))
+
+
+def test_batches_are_merged_into_one_ranking(make_client):
+    client = make_client(rerank_batching=RerankBatching(max_documents=4))
+
+    response = client.rerank(QUERY, DOCUMENTS, top_n=5)
+
+    assert [len(request["documents"]) for request in client.requests] == [4, 4, 4, 2]
+    assert [request["top_n"] for request in client.requests] == [4, 4, 4, 2]
+    expected = _ranking(QUERY, DOCUMENTS)[:5]
+    assert [result.index for result in response.results] == expected
+    assert [result.document["text"] for result in response.results] == [DOCUMENTS[i] for i in expected]
+    assert [result.relevance_score for result in response.results] == [
+        rerank_score(QUERY, DOCUMENTS[i]) for i in expected
+    ]
+    assert response.meta == {"billed_units": {"search_units": 4}}
+
+
+def test_single_batch_is_sent_unchanged(make_client):
+    client = make_client(rerank_batching=RerankBatching(max_documents=32))
+
+    response = client.rerank(QUERY, DOCUMENTS, top_n=3)
+
+    assert client.requests == [{"model": "stub-model", "query": QUERY, "documents": DOCUMENTS, "top_n": 3}]
+    assert [result.index for result in response.results] == _ranking(QUERY, DOCUMENTS)[:3]
+
+
+def test_anchors_calibrate_request_normalized_scores(make_client):
+    client = make_client(normalize_scores=True, rerank_batching=RerankBatching(max_documents=6, anchors=2))
+
+    response = client.rerank(QUERY, DOCUMENTS, top_n=10)
+
+    # Every batch after the first also carries the two anchors and asks for every result
+    first, *others = client.requests
+    assert first["documents"] == DOCUMENTS[:4] and "top_n" not in first
+    for request in others:
+        assert request["documents"][-2:] == DOCUMENTS[:2] and "top_n" not in request
+    assert sum(len(request["documents"]) - 2 for request in others) == len(DOCUMENTS) - 4
+
+    # Scores end up on the first batch's scale, so the merged ranking is the global one
+    raw = [rerank_score(QUERY, document) for document in DOCUMENTS]
+    low, high = min(raw[:4]), max(raw[:4])
+    expected = _ranking(QUERY, DOCUMENTS)[:10]
+    assert [result.index for result in response.results] == expected
+    assert [result.relevance_score for result in response.results] == pytest.approx(
+        [(raw[i] - low) / (high - low) for i in expected]
+    )
+
+
+def test_unanchored_request_normalized_scores_are_not_comparable(make_client):
+    client = make_client(normalize_scores=True, rerank_batching=RerankBatching(max_documents=6))
+
+    response = client.rerank(QUERY, DOCUMENTS)
+
+    assert [result.index for result in response.results] != _ranking(QUERY, DOCUMENTS)
+
+
+def test_anchors_must_fit_in_a_batch():
+    with pytest.raises(ValueError, match="anchors"):
+        RerankBatching(max_documents=4, anchors=4)
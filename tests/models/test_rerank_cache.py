@@ -0,0 +1,68 @@
+import pytest
+
+from sify.aiplatform.models import RerankBatching, RerankCache
+
+QUERY = "apple pie"
+DOCUMENTS = ["apple pie recipe", "banana bread", "apple crumble and pie", "pie chart basics", "weather today"]
+
+
+def _results(response):
+    return [(result.index, result.relevance_score, result.document) for result in response.results]
+
+
+def test_hits_are_merged_with_fetched_misses(make_client):
+    cache = RerankCache()
+    client = make_client(rerank_cache=cache)
+    client.rerank(QUERY, DOCUMENTS[:3])
+
+    documents = [DOCUMENTS[3], DOCUMENTS[2], DOCUMENTS[0], DOCUMENTS[4]]
+    response = client.rerank(QUERY, documents, top_n=3)
+
+    # Only the misses were sent, without top_n, and the hits moved to their new indexes
+    assert client.requests[-1]["documents"] == [DOCUMENTS[3], DOCUMENTS[4]]
+    assert "top_n" not in client.requests[-1]
+    fresh = make_client().rerank(QUERY, documents, top_n=3)
+    assert _results(response) == _results(fresh)
+    assert response.id == "rerank-2"
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 5
+
+
+def test_all_hits_send_no_request(make_client):
+    client = make_client(rerank_cache=RerankCache())
+    first = client.rerank(QUERY, DOCUMENTS)
+
+    response = client.rerank(QUERY, DOCUMENTS[::-1], top_n=2)
+
+    assert len(client.requests) == 1
+    assert _results(response) == _results(make_client().rerank(QUERY, DOCUMENTS[::-1], top_n=2))
+    assert response.id == first.id
+
+
+def test_keys_include_query_and_return_documents(make_client):
+    client = make_client(rerank_cache=RerankCache())
+    client.rerank(QUERY, DOCUMENTS)
+
+    client.rerank("banana", DOCUMENTS)
+    assert len(client.requests[-1]["documents"]) == len(DOCUMENTS)
+
+    response = client.rerank(QUERY, DOCUMENTS, return_documents=False)
+    assert len(client.requests) == 3
+    assert all(result.document is None for result in response.results)
+
+
+def test_expired_entries_are_fetched_again(make_client, monkeypatch):
+    import sify.aiplatform.models.rerank_cache as rerank_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(rerank_cache.time, "monotonic", lambda: now[0])
+    client = make_client(rerank_cache=RerankCache(ttl=60))
+    client.rerank(QUERY, DOCUMENTS)
+
+    now[0] += 61
+    client.rerank(QUERY, DOCUMENTS)
+    assert len(client.requests) == 2 and client.requests[1]["documents"] == DOCUMENTS
+
+
+def test_cache_is_refused_with_anchor_calibration(make_client):
+    with pytest.raises(ValueError, match="anchors"):
+        make_client(rerank_cache=RerankCache(), rerank_batching=RerankBatching(max_documents=8, anchors=2))
@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sify.aiplatform.models import FlatIndex, IVFIndex, VectorIndex
+
+
+def _corpus(n=500, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n, dim)).astype(np.float32), rng.normal(size=(8, dim)).astype(np.float32)
+
+
+@pytest.mark.parametrize("metric", ["cosine", "dot"])
+@pytest.mark.parametrize("make_index", [
+    lambda metric: FlatIndex(16, metric),
+    lambda metric: IVFIndex(16, metric, n_lists=8, n_probe=3),
+], ids=["flat", "ivf"])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(tmp_path, make_index, metric, mmap):
+    vectors, queries = _corpus()
+    index = make_index(metric)
+    index.add(vectors, ids=np.arange(1000, 1500))
+    index.delete([1000, 1001])
+    expected = index.search(queries, k=5)
+
+    path = str(tmp_path / "index.bin")
+    index.save(path)
+    loaded = VectorIndex.load(path, mmap=mmap)
+
+    assert type(loaded) is type(index)
+    assert loaded.metric == metric and len(loaded) == len(index) == 498
+    scores, ids = loaded.search(queries, k=5)
+    np.testing.assert_array_equal(ids, expected[1])
+    np.testing.assert_allclose(scores, expected[0], rtol=1e-6)
+
+    # A loaded index keeps working, and the file is not modified by later changes
+    new_ids = loaded.add(queries)
+    assert new_ids.tolist() == list(range(1500, 1508))
+    assert loaded.search(queries[0], k=1)[1][0] == 1500
+    assert len(VectorIndex.load(path)) == 498
+
+
+def test_load_checks_the_index_kind(tmp_path):
+    vectors, _ = _corpus(n=20)
+    index = FlatIndex(16)
+    index.add(vectors)
+    path = str(tmp_path / "index.bin")
+    index.save(path)
+
+    with pytest.raises(ValueError, match="flat index"):
+        IVFIndex.load(path)
+
+
+def test_ivf_with_every_list_probed_is_exact():
+    vectors, queries = _corpus()
+    for metric in ("cosine", "dot"):
+        flat = FlatIndex(16, metric)
+        flat.add(vectors)
+        ivf = IVFIndex(16, metric, n_lists=8)
+        ivf.add(vectors)
+        np.testing.assert_array_equal(ivf.search(queries, k=5, n_probe=8)[1], flat.search(queries, k=5)[1])